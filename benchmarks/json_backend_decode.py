@@ -0,0 +1,81 @@
+# Copyright 2024 Datastrato Pvt Ltd.
+# This software is licensed under the Apache License version 2.
+"""
+Decode and encode time of a large load-table response: the stdlib path (``response.json()`` and
+FastMCP's default tool serializer) against the optional msgspec/orjson backend.
+
+    pip install -e ".[fast]"
+    python benchmarks/json_backend_decode.py --columns 20000
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Callable
+
+from fastmcp.tools.tool import default_serializer
+
+from mcp_server_gravitino.server import json_backend
+from mcp_server_gravitino.server.json_stream import decode_json, project_value
+
+COLUMNS_SPEC = {
+    "table": {
+        "name": True,
+        "comment": True,
+        "columns": [{"name": True, "type": True, "comment": True, "nullable": True, "autoIncrement": True}],
+    }
+}
+
+
+def synthetic_table_response(columns: int) -> bytes:
+    return json.dumps(
+        {
+            "code": 0,
+            "table": {
+                "name": "wide_table",
+                "comment": "synthetic",
+                "columns": [
+                    {
+                        "name": f"column_{i}",
+                        "type": "varchar(255)" if i % 2 else {"type": "list", "elementType": "integer"},
+                        "comment": "synthetic column",
+                        "nullable": True,
+                        "autoIncrement": False,
+                        "defaultValue": {"type": "literal", "dataType": "integer", "value": str(i)},
+                    }
+                    for i in range(columns)
+                ],
+                "properties": {f"key_{i}": "value" for i in range(100)},
+                "audit": {"creator": "bench", "createTime": "2024-01-01T00:00:00Z"},
+            },
+        }
+    ).encode()
+
+
+def measure(name: str, fn: Callable[[], Any], repeat: int) -> None:
+    fn()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    elapsed = (time.perf_counter() - started) / repeat
+    print(f"{name:<40} {elapsed * 1000:9.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--columns", type=int, default=20000, help="number of columns of the synthetic table")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    body = synthetic_table_response(args.columns)
+    result = project_value(json.loads(body), COLUMNS_SPEC)["table"]
+    print(f"backend: {json_backend.BACKEND}, body: {len(body) / 1024 / 1024:.1f} MiB")
+
+    measure("decode: json.loads + projection", lambda: project_value(json.loads(body), COLUMNS_SPEC), args.repeat)
+    measure("decode: backend", lambda: decode_json(body, COLUMNS_SPEC), args.repeat)
+    measure("encode: fastmcp default serializer", lambda: default_serializer(result), args.repeat)
+    measure("encode: backend", lambda: json_backend.dumps(result), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# Copyright 2024 Datastrato Pvt Ltd.
+# This software is licensed under the Apache License version 2.
+"""
+Peak memory of decoding a synthetic load-table response: whole-body ``json.loads`` (what
+``response.json()`` does) against the projected streaming decode used by the table tools.
+
+    python benchmarks/json_stream_memory.py --size-mb 300
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from typing import Callable, Iterator
+
+from mcp_server_gravitino.server.json_stream import project_json
+
+COLUMNS_ONLY_SPEC = {
+    "table": {
+        "name": True,
+        "comment": True,
+        "columns": [{"name": True, "type": True, "nullable": True, "autoIncrement": True}],
+    }
+}
+NAME_ONLY_SPEC = {"table": {"name": True, "comment": True}}
+
+
+def synthetic_table_response(size_mb: int, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """Yield a load-table response of roughly ``size_mb`` megabytes in ``chunk_size`` pieces."""
+    target = size_mb * 1024 * 1024
+    pending = b'{"code":0,"table":{"name":"wide_table","comment":"synthetic","columns":['
+    written = 0
+    index = 0
+    column = json.dumps(
+        {
+            "name": "column_%d",
+            "type": "varchar(255)",
+            "comment": "synthetic column " * 8,
+            "nullable": True,
+            "autoIncrement": False,
+            "defaultValue": {"type": "literal", "dataType": "varchar(255)", "value": "N/A"},
+        }
+    ).encode()
+    while written < target:
+        pending += (b"," if index else b"") + column % index
+        index += 1
+        if len(pending) >= chunk_size:
+            written += len(pending)
+            yield pending
+            pending = b""
+    yield pending + b'],"properties":{},"audit":{"creator":"bench"}}}'
+
+
+def measure(name: str, size_mb: int, decode: Callable[[Iterator[bytes]], object]) -> None:
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = decode(synthetic_table_response(size_mb))
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    print(f"{name:<28} peak={peak / 1024 / 1024:9.1f} MiB  time={elapsed:7.2f} s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=300, help="size of the synthetic response body")
+    args = parser.parse_args()
+
+    print(f"synthetic load-table response: ~{args.size_mb} MiB")
+    measure("response.json()", args.size_mb, lambda chunks: json.loads(b"".join(chunks)))
+    measure("stream, columns projection", args.size_mb, lambda chunks: project_json(chunks, COLUMNS_ONLY_SPEC))
+    measure("stream, name projection", args.size_mb, lambda chunks: project_json(chunks, NAME_ONLY_SPEC))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# Copyright 2024 Datastrato Pvt Ltd.
+# This software is licensed under the Apache License version 2.
+
+# Counts of the tables requested through the tools, so the cache warmer prefetches the most used ones.
+import json
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Optional
+
+from mcp_server_gravitino.server.settings import get_settings
+from mcp_server_gravitino.server.tools.common_tools import resolve_fqn
+
+# tables whose count is tracked, the least requested ones are forgotten first
+_MAX_TRACKED = 1000
+# counts below this are forgotten when decayed
+_MIN_COUNT = 0.05
+
+
+class AccessCounter:
+    """
+    Thread-safe counts of the tables requested, decayed over time so recent requests weigh more.
+    If ``path`` is set, the counts are loaded from that JSON file when created and written to it by
+    ``save``.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self._path = path
+        self._counts: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        if path is not None and path.is_file():
+            try:
+                self._counts.update(json.loads(path.read_text(encoding="utf-8")))
+            except ValueError:
+                # a file cut short by a crash
+                pass
+
+    def record(self, key: str) -> None:
+        with self._lock:
+            self._counts[key] += 1
+
+    def most_common(self, n: int) -> list[str]:
+        with self._lock:
+            return [key for key, _ in self._counts.most_common(n)]
+
+    def decay(self, factor: float) -> None:
+        """Multiply every count by ``factor``, forgetting the tables which are rarely requested."""
+        with self._lock:
+            self._counts = Counter(
+                {
+                    key: count * factor
+                    for key, count in self._counts.most_common(_MAX_TRACKED)
+                    if count * factor >= _MIN_COUNT
+                }
+            )
+
+    def save(self) -> None:
+        if self._path is None:
+            return
+        with self._lock:
+            data = json.dumps(dict(self._counts))
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        # replaced at once, so a crash never leaves a partial file
+        tmp_path = self._path.with_suffix(".tmp")
+        tmp_path.write_text(data, encoding="utf-8")
+        tmp_path.replace(self._path)
+
+
+_counter: Optional[AccessCounter] = None
+_counter_lock = threading.Lock()
+
+
+def get_access_counter() -> AccessCounter:
+    """Get the process-wide table access counter, persisted to ``Settings.access_counts_path`` if set."""
+    global _counter
+    with _counter_lock:
+        if _counter is None:
+            path = get_settings().access_counts_path
+            _counter = AccessCounter(Path(path) if path else None)
+        return _counter
+
+
+def record_table_access(fully_qualified_name: str) -> None:
+    """
+    Count a request of a table, if the cache warmer is enabled.
+
+    Parameters
+    ----------
+    fully_qualified_name : str
+        Fully qualified name of the table, counted under its canonical name including the Metalake.
+    """
+    if not get_settings().cache_warmer:
+        return
+    try:
+        key = str(resolve_fqn(fully_qualified_name, "table"))
+    except ValueError:
+        return
+    get_access_counter().record(key)
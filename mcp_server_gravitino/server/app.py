@@ -3,11 +3,12 @@
 import os
 
 import httpx
-from fastmcp import FastMCP
 from httpx import Response
 
-from mcp_server_gravitino.server import tools
-from mcp_server_gravitino.server.settings import Settings
+from mcp_server_gravitino.server import json_backend, tools
+from mcp_server_gravitino.server.limits import LimitedFastMCP, LimitedTransport
+from mcp_server_gravitino.server.scheduler import SchedulingTransport
+from mcp_server_gravitino.server.settings import get_settings
 from mcp_server_gravitino.server.test_helper import (
     LIST_CATALOG_TEST_RESPONSE,
     LIST_MODEL_TEST_RESPONSE,
@@ -15,6 +16,7 @@ from mcp_server_gravitino.server.test_helper import (
     LIST_TABLE_TEST_RESPONSE,
     mock_httpx_client,
 )
+from mcp_server_gravitino.server.warmer import CacheWarmer
 
 
 class GravitinoMCPServer:
@@ -24,8 +26,12 @@ class GravitinoMCPServer:
         self.test_enabled = os.getenv("GRAVITINO_TEST") == "True"
         self.metalake = metalake_name = os.getenv("GRAVITINO_METALAKE", "metalake_demo")
 
-        self.mcp = FastMCP("Gravitino", dependencies=["httpx"])
-        self.settings = Settings()
+        self.mcp = LimitedFastMCP(
+            "Gravitino",
+            dependencies=["httpx"],
+            tool_serializer=json_backend.tool_serializer(),
+        )
+        self.settings = get_settings()
         self.session = self._create_session()
 
         self.mount_tools()
@@ -57,6 +63,8 @@ class GravitinoMCPServer:
         """
         Run mcp server
         """
+        if self.settings.cache_warmer:
+            CacheWarmer(self.session).start()
         self.mcp.run()
 
     def _create_session(self):
@@ -64,6 +72,7 @@ class GravitinoMCPServer:
             return httpx.Client(
                 base_url=self.settings.uri,
                 headers=self.settings.authorization,
+                transport=LimitedTransport(SchedulingTransport(lambda limits: httpx.HTTPTransport(limits=limits))),
             )
 
         return mock_httpx_client(self.metalake, self.settings)
@@ -0,0 +1,348 @@
+# Copyright 2024 Datastrato Pvt Ltd.
+# This software is licensed under the Apache License version 2.
+import contextvars
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Hashable, Optional, TypeVar
+
+from mcp_server_gravitino.server.settings import get_settings
+
+V = TypeVar("V")
+
+_MISSING = object()
+
+# the file of an ImmutableCache is rewritten with its entries only once it has this many times more lines
+_COMPACT_RATIO = 2
+# nor is a file rewritten before it has this many lines
+_COMPACT_MIN_LINES = 1000
+
+# threads reloading expired values in the background, shared by every cache
+_REFRESH_WORKERS = 4
+
+_refresh_executor: Optional[ThreadPoolExecutor] = None
+_refresh_executor_lock = threading.Lock()
+
+
+def _get_refresh_executor() -> ThreadPoolExecutor:
+    global _refresh_executor
+    with _refresh_executor_lock:
+        if _refresh_executor is None:
+            _refresh_executor = ThreadPoolExecutor(max_workers=_REFRESH_WORKERS, thread_name_prefix="cache-refresh")
+        return _refresh_executor
+
+
+class TTLCache:
+    """
+    A thread-safe LRU cache whose entries expire ``ttl`` seconds after they were stored. Expired entries
+    are kept ``grace`` more seconds, during which ``get_or_load`` still returns them and reloads them in
+    the background (stale-while-revalidate).
+    """
+
+    def __init__(self, ttl: float, max_entries: int, grace: float = 0.0):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.grace = grace
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        # keys being reloaded in the background, with a token per reload. Storing or dropping a key drops its
+        # token, so a reload started before does not store its older value.
+        self._refreshing: dict[Hashable, object] = {}
+        self._hits = 0
+        self._misses = 0
+        self._stale_hits = 0
+        self._stale_seconds = 0.0
+        self._max_stale_seconds = 0.0
+        self._refresh_errors = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_entries > 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            value, staleness = self._lookup(key)
+            if value is _MISSING or staleness is not None:
+                self._misses += 1
+                return default
+            self._hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._refreshing.pop(key, None)
+            self._store(key, value)
+
+    def update(self, key: Hashable, fn: Callable[[Any], Any]) -> None:
+        """Replace the value of ``key`` with ``fn(value)`` if it is cached, keeping its expiry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                return
+            self._refreshing.pop(key, None)
+            self._entries[key] = (entry[0], fn(entry[1]))
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], V], refresh: bool = False) -> V:
+        """
+        Get the cached value of ``key``, or load, store and return it. ``refresh`` forces a load. An
+        expired value still in its grace period is returned as is and reloaded in the background.
+        """
+        if not refresh:
+            with self._lock:
+                value, staleness = self._lookup(key)
+                if value is not _MISSING:
+                    if staleness is None:
+                        self._hits += 1
+                        return value
+                    self._stale_hits += 1
+                    self._stale_seconds += staleness
+                    self._max_stale_seconds = max(self._max_stale_seconds, staleness)
+                    token = None
+                    if key not in self._refreshing:
+                        token = self._refreshing[key] = object()
+            if value is not _MISSING:
+                if token is not None:
+                    self._refresh_in_background(key, loader, token)
+                return value
+
+        with self._lock:
+            self._misses += 1
+        value = loader()
+        with self._lock:
+            # a reload of this key started in the background before must not overwrite the value
+            self._refreshing.pop(key, None)
+            if self.enabled:
+                self._store(key, value)
+        return value
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop ``key``, or every entry if ``key`` is None."""
+        with self._lock:
+            if key is None:
+                self._refreshing.clear()
+                self._entries.clear()
+            else:
+                self._refreshing.pop(key, None)
+                self._entries.pop(key, None)
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        """Drop every entry whose (string) key starts with ``prefix``."""
+        with self._lock:
+            for key in [key for key in self._refreshing if isinstance(key, str) and key.startswith(prefix)]:
+                del self._refreshing[key]
+            for key in [key for key in self._entries if isinstance(key, str) and key.startswith(prefix)]:
+                del self._entries[key]
+
+    def stats(self) -> dict[str, Any]:
+        """Counts of the lookups of the cache, and how stale the expired values it returned were."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "staleHits": self._stale_hits,
+                "meanStaleSeconds": round(self._stale_seconds / self._stale_hits, 3) if self._stale_hits else 0.0,
+                "maxStaleSeconds": round(self._max_stale_seconds, 3),
+                "refreshErrors": self._refresh_errors,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _lookup(self, key: Hashable) -> tuple[Any, Optional[float]]:
+        # the value of key and the seconds since it expired, None if it has not, with the lock held
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING, None
+        staleness = time.monotonic() - entry[0]
+        if staleness >= 0 and staleness >= self.grace:
+            del self._entries[key]
+            return _MISSING, None
+        self._entries.move_to_end(key)
+        return entry[1], staleness if staleness >= 0 else None
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _refresh_in_background(self, key: Hashable, loader: Callable[[], Any], token: object) -> None:
+        def _refresh() -> None:
+            try:
+                value = loader()
+            except Exception:
+                # the stale value stays until its grace period ends, then the next call loads it
+                with self._lock:
+                    self._refresh_errors += 1
+                    if self._refreshing.get(key) is token:
+                        del self._refreshing[key]
+                return
+            with self._lock:
+                if self._refreshing.get(key) is token:
+                    del self._refreshing[key]
+                    self._store(key, value)
+
+        # the reload sends its requests with the priority class and client of the call
+        context = contextvars.copy_context()
+        _get_refresh_executor().submit(context.run, _refresh)
+
+
+class ImmutableCache:
+    """
+    A thread-safe LRU cache of entities which never change once created, so entries do not expire.
+    Values must be JSON compatible. If ``path`` is set, every new entry is appended to that JSON Lines
+    file, and the entries of the file are loaded when the cache is created. The file is rewritten with
+    the entries of the cache once most of its lines are duplicates or evicted entries.
+    """
+
+    def __init__(self, max_entries: int, path: Optional[Path] = None):
+        self.max_entries = max_entries
+        self._path = path
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        # lines of the file, including the duplicates and entries evicted since
+        self._lines = 0
+        if path is not None and path.is_file():
+            self._load(path)
+            self._compact_if_needed()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._entries:
+                return default
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def set(self, key: str, value: Any) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            is_new = key not in self._entries
+            self._store(key, value)
+            if is_new and self._path is not None:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                with self._path.open("a", encoding="utf-8") as file:
+                    file.write(_entry_line(key, value))
+                self._lines += 1
+                self._compact_if_needed()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _store(self, key: str, value: Any) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _compact_if_needed(self) -> None:
+        # with the lock held
+        if self._path is None or self._lines < max(_COMPACT_MIN_LINES, _COMPACT_RATIO * len(self._entries)):
+            return
+        # replaced at once, so a crash never leaves a partial file
+        tmp_path = self._path.with_suffix(".tmp")
+        with tmp_path.open("w", encoding="utf-8") as file:
+            for key, value in self._entries.items():
+                file.write(_entry_line(key, value))
+        tmp_path.replace(self._path)
+        self._lines = len(self._entries)
+
+    def _load(self, path: Path) -> None:
+        with path.open(encoding="utf-8") as file:
+            for line in file:
+                self._lines += 1
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # a line cut short by a crash
+                    continue
+                self._store(entry["key"], entry["value"])
+
+
+def _entry_line(key: str, value: Any) -> str:
+    return json.dumps({"key": key, "value": value}, separators=(",", ":")) + "\n"
+
+
+# caches of the metadata read most, whose expired entries are served while they are reloaded
+_STALE_WHILE_REVALIDATE = frozenset({"catalogs", "schemas", "tables", "table_details"})
+
+_caches: dict[str, TTLCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_cache(name: str, ttl: Optional[float] = None, max_entries: Optional[int] = None) -> TTLCache:
+    """
+    Get the process-wide cache called ``name``, creating it on first use.
+
+    Parameters
+    ----------
+    name : str
+        Name of the cache, e.g. "tables".
+    ttl : Optional[float]
+        Time to live of the entries, ``Settings.cache_ttl`` if None. Only used when the cache is created.
+        The caches of catalogs, schemas and tables serve their expired entries for
+        ``Settings.cache_stale_grace`` more seconds while they are reloaded.
+    max_entries : Optional[int]
+        Max number of entries, ``Settings.cache_max_entries`` if None. Only used when the cache is created.
+
+    Returns
+    -------
+    TTLCache
+        The cache.
+    """
+    with _caches_lock:
+        cache = _caches.get(name)
+        if cache is None:
+            settings = get_settings()
+            cache = _caches[name] = TTLCache(
+                ttl=settings.cache_ttl if ttl is None else ttl,
+                max_entries=settings.cache_max_entries if max_entries is None else max_entries,
+                grace=settings.cache_stale_grace if name in _STALE_WHILE_REVALIDATE else 0.0,
+            )
+        return cache
+
+
+def cache_stats() -> dict[str, dict[str, Any]]:
+    """Get the stats of every cache created with ``get_cache``, by name."""
+    with _caches_lock:
+        caches = dict(_caches)
+    return {name: cache.stats() for name, cache in sorted(caches.items())}
+
+
+_immutable_caches: dict[str, ImmutableCache] = {}
+
+
+def get_immutable_cache(name: str) -> ImmutableCache:
+    """
+    Get the process-wide cache of immutable entities called ``name``, creating it on first use.
+
+    Parameters
+    ----------
+    name : str
+        Name of the cache, e.g. "model_versions". Also the name of its file in ``Settings.immutable_cache_dir``.
+
+    Returns
+    -------
+    ImmutableCache
+        The cache.
+    """
+    with _caches_lock:
+        cache = _immutable_caches.get(name)
+        if cache is None:
+            settings = get_settings()
+            directory = settings.immutable_cache_dir
+            cache = _immutable_caches[name] = ImmutableCache(
+                max_entries=settings.immutable_cache_max_entries,
+                path=Path(directory) / f"{name}.jsonl" if directory else None,
+            )
+        return cache
@@ -0,0 +1,64 @@
+# Copyright 2024 Datastrato Pvt Ltd.
+# This software is licensed under the Apache License version 2.
+import contextvars
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Iterable, Iterator, Optional, Tuple, TypeVar
+
+from mcp_server_gravitino.server.settings import get_settings
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def bounded_map(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: Optional[int] = None,
+) -> Iterator[Tuple[T, Optional[R], Optional[Exception]]]:
+    """
+    Apply a blocking function to many items on a bounded thread pool.
+
+    At most ``max_workers`` calls run at once and at most twice as many items are taken from
+    ``items`` ahead of completion, so large or lazily produced inputs are not materialized.
+    Every call runs in a copy of the caller's context.
+
+    Parameters
+    ----------
+    fn : Callable[[T], R]
+        The function to apply, typically issuing one or more requests to Gravitino.
+    items : Iterable[T]
+        The items to apply the function to.
+    max_workers : Optional[int]
+        Max number of concurrent calls, ``Settings.max_concurrency`` if None.
+
+    Yields
+    ------
+    Tuple[T, Optional[R], Optional[Exception]]
+        ``(item, result, None)`` or ``(item, None, error)`` for every item, in completion order.
+    """
+    max_workers = max(1, max_workers or get_settings().max_concurrency)
+    pending: dict[Future, T] = {}
+    iterator = iter(items)
+    exhausted = False
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while pending or not exhausted:
+            while not exhausted and len(pending) < max_workers * 2:
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    exhausted = True
+                    break
+                context = contextvars.copy_context()
+                pending[executor.submit(context.run, fn, item)] = item
+
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = pending.pop(future)
+                error = future.exception()
+                if error is not None:
+                    yield item, None, error
+                else:
+                    yield item, future.result(), None
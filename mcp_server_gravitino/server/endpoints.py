@@ -0,0 +1,130 @@
+# Copyright 2024 Datastrato Pvt Ltd.
+# This software is licensed under the Apache License version 2.
+
+# REST endpoints of Gravitino. Paths are built from templates compiled once, with every name
+# percent-encoded, and each endpoint has a stable label, e.g. to key metrics or limits by endpoint.
+import re
+from functools import lru_cache
+from string import Formatter
+from typing import Optional
+from urllib.parse import quote
+
+
+class Endpoint:
+    """A REST endpoint, built from a template such as ``/api/metalakes/{metalake}/catalogs``."""
+
+    __slots__ = ("label", "template", "_literals", "_pattern")
+
+    def __init__(self, label: str, template: str):
+        self.label = label
+        self.template = template
+        parsed = list(Formatter().parse(template))
+        # the literal parts around the fields, with an empty one after a trailing field
+        self._literals = tuple(literal for literal, _, _, _ in parsed) + (("",) if parsed[-1][1] is not None else ())
+        # requests are matched by path, without the query string of the template
+        self._pattern = re.compile(
+            "".join(
+                re.escape(literal) + ("[^/]+" if field is not None else "")
+                for literal, field, _, _ in Formatter().parse(template.partition("?")[0])
+            )
+        )
+
+    def path(self, *values: str) -> str:
+        """
+        Build the path of the endpoint.
+
+        Parameters
+        ----------
+        values : str
+            The values of the fields of the template, in order. They are percent-encoded, so names
+            containing '/' or spaces are sent as a single path segment.
+
+        Returns
+        -------
+        str
+            The path, with the query string of the template if any.
+        """
+        parts = [self._literals[0]]
+        for literal, value in zip(self._literals[1:], values, strict=True):
+            parts.append(quote(value, safe=""))
+            parts.append(literal)
+        return "".join(parts)
+
+    def matches(self, path: str) -> bool:
+        return self._pattern.fullmatch(path) is not None
+
+
+_METALAKE = "/api/metalakes/{metalake}"
+_CATALOG = _METALAKE + "/catalogs/{catalog}"
+_SCHEMA = _CATALOG + "/schemas/{schema}"
+_MODEL = _SCHEMA + "/models/{model}"
+
+ENDPOINTS: dict[str, Endpoint] = {
+    endpoint.label: endpoint
+    for endpoint in (
+        Endpoint("metalake", _METALAKE),
+        Endpoint("catalogs", _METALAKE + "/catalogs?details=true"),
+        Endpoint("catalog", _CATALOG),
+        Endpoint("schemas", _CATALOG + "/schemas"),
+        Endpoint("schema", _SCHEMA),
+        Endpoint("tables", _SCHEMA + "/tables"),
+        Endpoint("table", _SCHEMA + "/tables/{table}"),
+        Endpoint("models", _SCHEMA + "/models"),
+        Endpoint("model", _MODEL),
+        Endpoint("model_versions", _MODEL + "/versions?details=true"),
+        Endpoint("model_version", _MODEL + "/versions/{version}"),
+        Endpoint("model_alias", _MODEL + "/aliases/{alias}"),
+        Endpoint("filesets", _SCHEMA + "/filesets"),
+        Endpoint("fileset", _SCHEMA + "/filesets/{fileset}"),
+        Endpoint("topics", _SCHEMA + "/topics"),
+        Endpoint("topic", _SCHEMA + "/topics/{topic}"),
+        Endpoint("tags", _METALAKE + "/tags"),
+        Endpoint("tag_objects", _METALAKE + "/tags/{tag}/objects"),
+        Endpoint("object_tags", _METALAKE + "/objects/{type}/{name}/tags"),
+        Endpoint("roles", _METALAKE + "/roles"),
+        Endpoint("role", _METALAKE + "/roles/{role}"),
+        Endpoint("users", _METALAKE + "/users?details=true"),
+        Endpoint("grant_roles", _METALAKE + "/permissions/users/{user}/grant"),
+        Endpoint("revoke_roles", _METALAKE + "/permissions/users/{user}/revoke"),
+    )
+}
+
+
+def endpoint_path(label: str, *values: str) -> str:
+    """
+    Build the path of a registered endpoint.
+
+    Parameters
+    ----------
+    label : str
+        Label of the endpoint, one of the keys of ``ENDPOINTS``.
+    values : str
+        The values of the fields of its template, in order, e.g. the Metalake, catalog and schema names.
+
+    Returns
+    -------
+    str
+        The percent-encoded path.
+    """
+    return ENDPOINTS[label].path(*values)
+
+
+@lru_cache(maxsize=4096)
+def endpoint_label(path: str) -> Optional[str]:
+    """
+    Get the label of the endpoint a request path belongs to.
+
+    Parameters
+    ----------
+    path : str
+        The path of a request, without the query string.
+
+    Returns
+    -------
+    Optional[str]
+        The label of the endpoint, or None if the path matches no registered endpoint.
+    """
+    for endpoint in ENDPOINTS.values():
+        if endpoint.matches(path):
+            return endpoint.label
+    return None
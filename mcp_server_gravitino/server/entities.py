@@ -0,0 +1,308 @@
+# Copyright 2024 Datastrato Pvt Ltd.
+# This software is licensed under the Apache License version 2.
+
+# Compact, immutable views of Gravitino entities. Responses are decoded into these once and the
+# instances are shared by the tools and caches instead of re-walking raw dictionaries.
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from mcp_server_gravitino.server.names import join_fqn
+
+
+def _dict(data: Any) -> dict[str, Any]:
+    return data if isinstance(data, dict) else {}
+
+
+def _tuple(data: Any) -> tuple:
+    return tuple(data) if isinstance(data, (list, tuple)) else ()
+
+
+@dataclass(frozen=True, slots=True)
+class NameIdentifier:
+    """Identifier of an entity as returned by the list endpoints."""
+
+    name: Optional[str]
+    namespace: tuple[str, ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: Any) -> "NameIdentifier":
+        data = _dict(data)
+        return cls(name=data.get("name"), namespace=_tuple(data.get("namespace")))
+
+    @property
+    def namespace_name(self) -> str:
+        return join_fqn(*self.namespace)
+
+    @property
+    def fully_qualified_name(self) -> str:
+        return join_fqn(*self.namespace, self.name or "")
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "namespace": self.namespace_name,
+            "fullyQualifiedName": self.fully_qualified_name,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class Catalog:
+    name: Optional[str]
+    type: Optional[str] = None
+    provider: Optional[str] = None
+    comment: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Any) -> "Catalog":
+        data = _dict(data)
+        return cls(
+            name=data.get("name"),
+            type=data.get("type"),
+            provider=data.get("provider"),
+            comment=data.get("comment"),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "type": self.type,
+            "provider": self.provider,
+            "comment": self.comment,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class Schema(NameIdentifier):
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "namespace": self.namespace_name,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class Model(NameIdentifier):
+    pass
+
+
+def _properties(data: Any) -> tuple[tuple[str, Any], ...]:
+    return tuple(_dict(data).items())
+
+
+@dataclass(frozen=True, slots=True)
+class Fileset:
+    name: Optional[str]
+    # "managed" or "external"
+    type: Optional[str] = None
+    storage_location: Optional[str] = None
+    comment: Optional[str] = None
+    # kept as pairs so the entity stays immutable
+    properties: tuple[tuple[str, Any], ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: Any) -> "Fileset":
+        data = _dict(data)
+        return cls(
+            name=data.get("name"),
+            type=data.get("type"),
+            storage_location=data.get("storageLocation"),
+            comment=data.get("comment"),
+            properties=_properties(data.get("properties")),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "type": self.type,
+            "storageLocation": self.storage_location,
+            "comment": self.comment,
+            "properties": dict(self.properties),
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class Topic:
+    name: Optional[str]
+    comment: Optional[str] = None
+    properties: tuple[tuple[str, Any], ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: Any) -> "Topic":
+        data = _dict(data)
+        return cls(
+            name=data.get("name"),
+            comment=data.get("comment"),
+            properties=_properties(data.get("properties")),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "comment": self.comment,
+            "properties": dict(self.properties),
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class Column:
+    name: Optional[str]
+    type: Any = None
+    comment: Optional[str] = None
+    nullable: Optional[bool] = None
+    auto_increment: Optional[bool] = None
+
+    @classmethod
+    def from_dict(cls, data: Any) -> "Column":
+        data = _dict(data)
+        return cls(
+            name=data.get("name"),
+            type=data.get("type"),
+            comment=data.get("comment"),
+            nullable=data.get("nullable"),
+            auto_increment=data.get("autoIncrement"),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "type": self.type,
+            "comment": self.comment,
+            "nullable": self.nullable,
+            "autoIncrement": self.auto_increment,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class Table:
+    name: Optional[str]
+    comment: Optional[str] = None
+    columns: tuple[Column, ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: Any) -> "Table":
+        data = _dict(data)
+        return cls(
+            name=data.get("name"),
+            comment=data.get("comment"),
+            columns=tuple(Column.from_dict(column) for column in _tuple(data.get("columns"))),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ModelVersion:
+    version: Optional[int]
+    comment: Optional[str] = None
+    aliases: tuple[str, ...] = ()
+    uri: Optional[str] = None
+    creator: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Any) -> "ModelVersion":
+        data = _dict(data)
+        return cls(
+            version=data.get("version"),
+            comment=data.get("comment"),
+            aliases=_tuple(data.get("aliases")),
+            uri=data.get("uri"),
+            creator=_dict(data.get("audit")).get("creator"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class User:
+    name: Optional[str]
+    roles: tuple[str, ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: Any) -> "User":
+        data = _dict(data)
+        return cls(name=data.get("name"), roles=_tuple(data.get("roles")))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"name": self.name, "roles": list(self.roles)}
+
+
+@dataclass(frozen=True, slots=True)
+class Privilege:
+    name: Optional[str]
+    # "allow" or "deny"
+    condition: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Any) -> "Privilege":
+        data = _dict(data)
+        return cls(name=data.get("name"), condition=data.get("condition"))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"name": self.name, "condition": self.condition}
+
+
+@dataclass(frozen=True, slots=True)
+class SecurableObject:
+    """An object of a role, and the privileges the role has on it."""
+
+    full_name: Optional[str]
+    type: Optional[str] = None
+    privileges: tuple[Privilege, ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: Any) -> "SecurableObject":
+        data = _dict(data)
+        return cls(
+            full_name=data.get("fullName"),
+            type=data.get("type"),
+            privileges=tuple(Privilege.from_dict(privilege) for privilege in _tuple(data.get("privileges"))),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "fullName": self.full_name,
+            "type": self.type,
+            "privileges": [privilege.to_dict() for privilege in self.privileges],
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class Role:
+    name: str
+    securable_objects: tuple[SecurableObject, ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: Any) -> "Role":
+        data = _dict(data)
+        return cls(
+            name=f"{data.get('name')}",
+            securable_objects=tuple(SecurableObject.from_dict(obj) for obj in _tuple(data.get("securableObjects"))),
+        )
+
+    def to_dict(self, details: bool = False) -> dict[str, Any]:
+        if not details:
+            return {"name": self.name}
+        return {"name": self.name, "securableObjects": [obj.to_dict() for obj in self.securable_objects]}
+
+
+@dataclass(frozen=True, slots=True)
+class Tag:
+    name: str
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"name": self.name}
+
+
+@dataclass(frozen=True, slots=True)
+class MetadataObject:
+    """An object a tag is associated with."""
+
+    full_name: Optional[str]
+    type: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Any) -> "MetadataObject":
+        data = _dict(data)
+        return cls(full_name=data.get("fullName"), type=data.get("type"))
+
+    def to_dict(self) -> dict[str, str]:
+        return {
+            "fullName": f"{self.full_name}",
+            "type": f"{self.type}",
+        }
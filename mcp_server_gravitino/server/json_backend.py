@@ -0,0 +1,135 @@
+# Copyright 2024 Datastrato Pvt Ltd.
+# This software is licensed under the Apache License version 2.
+
+# Optional fast JSON backends. msgspec decodes projected response shapes into typed structs,
+# orjson speeds up plain decoding and tool result encoding; the stdlib is used when neither is installed.
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+if msgspec is not None:
+    BACKEND = "msgspec"
+elif orjson is not None:
+    BACKEND = "orjson"
+else:
+    BACKEND = "json"
+
+# marker returned by decode_typed when no typed decoding is possible
+UNSUPPORTED = object()
+
+# compiled struct types, keyed by the id of the projection spec they were built from, least recently
+# used first. The spec is kept with its decoder, so its id is not reused while the entry exists.
+_MAX_TYPED_DECODERS = 256
+_typed_decoders: OrderedDict[int, tuple[Any, Any]] = OrderedDict()
+_typed_decoders_lock = threading.Lock()
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode a complete JSON document, raising ``ValueError`` if it is not valid JSON with every backend."""
+    if msgspec is not None:
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError as err:
+            raise ValueError(str(err)) from err
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(value: Any, indent: bool = True) -> str:
+    """
+    Encode a value the way FastMCP encodes tool results by default: with ``str`` as fallback and,
+    unless ``indent`` is False, indented by two spaces.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(value, default=str, option=option).decode()
+        except TypeError:
+            # e.g. an integer wider than 64 bits, which only the stdlib encodes
+            pass
+    if indent:
+        return json.dumps(value, default=str, indent=2, ensure_ascii=False)
+    return json.dumps(value, default=str, ensure_ascii=False, separators=(",", ":"))
+
+
+def tool_serializer() -> Optional[Callable[[Any], str]]:
+    """
+    Get the serializer for tool results.
+
+    Returns
+    -------
+    Optional[Callable[[Any], str]]
+        ``dumps`` if orjson is installed, otherwise None to keep FastMCP's default serializer.
+    """
+    return dumps if orjson is not None else None
+
+
+def decode_typed(data: bytes, spec: Any) -> Any:
+    """
+    Decode a complete JSON document into the typed struct compiled from a projection spec.
+
+    Parameters
+    ----------
+    data : bytes
+        The JSON document.
+    spec : Any
+        A projection spec, see ``json_stream.Spec``. Specs are expected to be module constants or
+        otherwise reused, their compiled struct is cached by identity in a bounded LRU.
+
+    Returns
+    -------
+    Any
+        The projected document as builtin types, or ``UNSUPPORTED`` if msgspec is not installed or
+        the document does not have the shape described by the spec.
+
+    Raises
+    ------
+    ValueError
+        If the document is not valid JSON.
+    """
+    if msgspec is None:
+        return UNSUPPORTED
+
+    with _typed_decoders_lock:
+        cached = _typed_decoders.get(id(spec))
+        if cached is not None:
+            _typed_decoders.move_to_end(id(spec))
+    if cached is None:
+        cached = (spec, msgspec.json.Decoder(_struct_type(spec)))
+        with _typed_decoders_lock:
+            _typed_decoders[id(spec)] = cached
+            while len(_typed_decoders) > _MAX_TYPED_DECODERS:
+                _typed_decoders.popitem(last=False)
+    try:
+        return msgspec.to_builtins(cached[1].decode(data))
+    except msgspec.ValidationError:
+        return UNSUPPORTED
+    except msgspec.DecodeError as err:
+        # like the other backends, so callers handle a malformed response in one way
+        raise ValueError(str(err)) from err
+
+
+def _struct_type(spec: Any) -> Any:
+    if isinstance(spec, dict):
+        # keys missing from the document stay UNSET and are left out, like in the streaming projection
+        fields = [
+            (f"field_{i}", Optional[_struct_type(sub_spec)] | msgspec.UnsetType, msgspec.UNSET)
+            for i, sub_spec in enumerate(spec.values())
+        ]
+        rename = {f"field_{i}": key for i, key in enumerate(spec)}
+        return msgspec.defstruct("Projection", fields, rename=rename)
+    if isinstance(spec, list):
+        return list[_struct_type(spec[0])]
+    return Any
@@ -0,0 +1,286 @@
+# Copyright 2024 Datastrato Pvt Ltd.
+# This software is licensed under the Apache License version 2.
+
+# Incremental JSON decoding for large Gravitino responses. Only the fields named in a
+# projection spec are materialized; everything else is scanned over as the body streams in.
+import codecs
+import json
+import re
+from typing import Any, Iterable, Iterator, Optional
+
+import httpx
+
+from mcp_server_gravitino.server import json_backend
+
+# A projection spec describes which parts of a JSON document to keep:
+# - True keeps the whole value,
+# - a dict keeps only the listed keys of an object, each projected with its own spec,
+# - a single-element list projects every item of an array with the contained spec.
+Spec = Any
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRUCTURAL = re.compile(r'[\[\]{}"]')
+_STRING_BODY = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_SIMPLE_KEY = re.compile(r'"([^"\\]*)"[ \t\n\r]*:')
+_DECODER = json.JSONDecoder()
+_NUMBER_TAIL = frozenset("0123456789.eE+-")
+_INCOMPLETE = object()
+
+# response bodies up to this size are decoded whole rather than streamed
+STREAM_THRESHOLD = 2 * 1024 * 1024
+
+
+class _StreamReader:
+    """A text buffer over an iterator of byte chunks, compacted as values are consumed."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """Append the next chunk to the buffer, dropping everything before ``pos``."""
+        if self.eof:
+            return False
+        for chunk in self._chunks:
+            text = self._decoder.decode(chunk)
+            if text:
+                self.buf = self.buf[self.pos :] + text
+                self.pos = 0
+                return True
+        self.buf = self.buf[self.pos :] + self._decoder.decode(b"", final=True)
+        self.pos = 0
+        self.eof = True
+        return True
+
+    def _more(self) -> int:
+        """Read more data or fail, returning how far existing indexes have shifted."""
+        shift = self.pos
+        if not self._fill():
+            raise json.JSONDecodeError("Unterminated JSON document", self.buf, len(self.buf))
+        return shift
+
+    def peek(self) -> str:
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            self._more()
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self.buf, self.pos)
+        self.pos += 1
+
+    def try_decode(self) -> Any:
+        """Decode the value at the current position if it is complete in the buffer, else ``_INCOMPLETE``."""
+        try:
+            value, end = _DECODER.raw_decode(self.buf, self.pos)
+        except json.JSONDecodeError:
+            return _INCOMPLETE
+        # a number cut by the end of the buffer may still continue, e.g. "1" of "1.5"
+        if not self.eof and (end == len(self.buf) or self.buf[end] in _NUMBER_TAIL):
+            return _INCOMPLETE
+        self.pos = end
+        return value
+
+    def decode(self) -> Any:
+        """Decode the complete value at the current position, reading as much as needed."""
+        is_container = self.peek() in "[{"
+        while True:
+            value = self.try_decode()
+            if value is not _INCOMPLETE:
+                return value
+            if is_container:
+                end = self._container_end()
+                value, _ = _DECODER.raw_decode(self.buf[self.pos : end])
+                self.pos = end
+                return value
+            self._more()
+
+    def key(self) -> str:
+        """Decode an object key and the colon following it."""
+        self.peek()
+        match = _SIMPLE_KEY.match(self.buf, self.pos)
+        if match is not None:
+            self.pos = match.end()
+            return match.group(1)
+        key = self.decode()
+        self.expect(":")
+        return key
+
+    def _container_end(self) -> int:
+        depth = 0
+        i = self.pos
+        while True:
+            match = _STRUCTURAL.search(self.buf, i)
+            if match is None:
+                i = len(self.buf) - self._more()
+                continue
+
+            char = match.group()
+            i = match.end()
+            if char == '"':
+                body = _STRING_BODY.match(self.buf, i)
+                while body is None:
+                    i -= self._more()
+                    body = _STRING_BODY.match(self.buf, i)
+                i = body.end()
+            elif char in "[{":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return i
+
+
+def _iter_members(reader: _StreamReader) -> Iterator[Optional[str]]:
+    """
+    Walk the members of the array or object at the current position. Yields each object key (None for
+    array items); the caller must consume the member value before resuming the iterator.
+    """
+    is_object = reader.peek() == "{"
+    close = "}" if is_object else "]"
+    reader.pos += 1
+    if reader.peek() == close:
+        reader.pos += 1
+        return
+
+    while True:
+        yield reader.key() if is_object else None
+
+        char = reader.peek()
+        reader.pos += 1
+        if char == close:
+            return
+        if char != ",":
+            raise json.JSONDecodeError("Expecting ',' delimiter", reader.buf, reader.pos - 1)
+
+
+def _project(reader: _StreamReader, spec: Spec) -> Any:
+    char = reader.peek()
+    if spec is True or char not in "[{":
+        return reader.decode()
+
+    # values that already sit in the buffer are cheapest to decode whole and project afterwards;
+    # only values spanning several chunks are walked member by member
+    value = reader.try_decode()
+    if value is not _INCOMPLETE:
+        return project_value(value, spec)
+
+    if char == "{" and isinstance(spec, dict):
+        result: dict[str, Any] = {}
+        for key in _iter_members(reader):
+            sub_spec = spec.get(key)
+            if sub_spec is None:
+                _skip(reader)
+            else:
+                result[key] = _project(reader, sub_spec)
+        return result
+    if char == "[" and isinstance(spec, list):
+        return [_project(reader, spec[0]) for _ in _iter_members(reader)]
+    return reader.decode()
+
+
+def _skip(reader: _StreamReader) -> None:
+    """Move past the value at the current position without holding it in full."""
+    if reader.peek() not in "[{":
+        reader.decode()
+        return
+    if reader.try_decode() is not _INCOMPLETE:
+        return
+    for _ in _iter_members(reader):
+        _skip(reader)
+
+
+def project_json(chunks: Iterable[bytes], spec: Spec) -> Any:
+    """
+    Decode a JSON document from a stream of byte chunks, keeping only the projected fields.
+
+    Parameters
+    ----------
+    chunks : Iterable[bytes]
+        UTF-8 encoded JSON document, split into arbitrary chunks.
+    spec : Spec
+        Projection spec, see ``Spec``. Values whose type does not match the spec are kept whole.
+
+    Returns
+    -------
+    Any
+        The projected document. Keys not present in the document are absent from the result.
+
+    Raises
+    ------
+    json.JSONDecodeError
+        If the document is malformed or truncated.
+    """
+    return _project(_StreamReader(chunks), spec)
+
+
+def project_value(value: Any, spec: Spec) -> Any:
+    """Apply a projection spec to an already decoded JSON value."""
+    if isinstance(spec, dict) and isinstance(value, dict):
+        return {key: project_value(value[key], sub_spec) for key, sub_spec in spec.items() if key in value}
+    if isinstance(spec, list) and isinstance(value, list):
+        return [project_value(item, spec[0]) for item in value]
+    return value
+
+
+def decode_json(data: bytes, spec: Optional[Spec] = None) -> Any:
+    """
+    Decode a complete JSON document with the fastest available backend and apply a projection spec.
+
+    Parameters
+    ----------
+    data : bytes
+        The JSON document.
+    spec : Optional[Spec]
+        Projection spec, or None to keep the whole document
+
+    Returns
+    -------
+    Any
+        The (projected) document.
+    """
+    if spec is None or spec is True:
+        return json_backend.loads(data)
+    projected = json_backend.decode_typed(data, spec)
+    if projected is json_backend.UNSUPPORTED:
+        projected = project_value(json_backend.loads(data), spec)
+    return projected
+
+
+def fetch_json(session: httpx.Client, url: str, spec: Optional[Spec] = None) -> Any:
+    """
+    GET a Gravitino endpoint and decode the response body.
+
+    Bodies up to ``STREAM_THRESHOLD`` bytes are read whole and decoded by the fast JSON backend,
+    larger ones (or ones of unknown length) are projected while they stream in.
+
+    Parameters
+    ----------
+    session : httpx.Client
+        HTTP client
+    url : str
+        Path of the endpoint, relative to the client's base url
+    spec : Optional[Spec]
+        Projection spec for the response body, or None to decode it whole
+
+    Returns
+    -------
+    Any
+        The (projected) response body.
+
+    Raises
+    ------
+    httpx.HTTPStatusError
+        If the response has an error status code.
+    """
+    with session.stream("GET", url) as response:
+        response.raise_for_status()
+        length = response.headers.get("content-length")
+        if spec is None or (length is not None and int(length) <= STREAM_THRESHOLD):
+            return decode_json(response.read(), spec)
+        return project_json(response.iter_bytes(), spec)
@@ -0,0 +1,350 @@
+# Copyright 2024 Datastrato Pvt Ltd.
+# This software is licensed under the Apache License version 2.
+
+# Rate limits and max in flight caps of the tool calls of each client and of the requests sent to
+# each Gravitino endpoint, configured in the settings.
+import contextvars
+import functools
+import heapq
+import inspect
+import itertools
+import threading
+import time
+from typing import Any, Callable, Literal, Optional
+
+import anyio.to_thread
+import httpx
+from fastmcp import FastMCP
+from fastmcp.server.dependencies import get_context
+
+from mcp_server_gravitino.server.endpoints import endpoint_label
+from mcp_server_gravitino.server.scheduler import priority_class, release_on_close, tool_call
+from mcp_server_gravitino.server.settings import get_settings
+from mcp_server_gravitino.server.tools.common_tools import BULK_OPERATION_TAG, LIST_OPERATION_TAG
+
+# cost of a tool call by tag, calls and requests waiting for a slot are served cheapest first
+_TAG_COSTS = {
+    BULK_OPERATION_TAG: 3,
+    LIST_OPERATION_TAG: 2,
+}
+# retry hint given when no slot was freed in time, as the time a slot frees up is unknown
+_SLOT_RETRY_AFTER = 1.0
+# seconds a limiter is kept unused, e.g. for a client which disconnected, before it is dropped
+_LIMITER_IDLE_TTL = 300.0
+
+# cost of the tool call being run, inherited by the requests it sends
+_call_cost: contextvars.ContextVar[int] = contextvars.ContextVar("call_cost", default=1)
+
+_limiters: dict[tuple[str, str, str], "Limiter"] = {}
+_limiters_lock = threading.Lock()
+_limiters_swept = time.monotonic()
+
+
+class RateLimitExceeded(Exception):
+    """A tool call or request was rejected by its limiter."""
+
+    def __init__(self, scope: str, retry_after: float):
+        super().__init__(f"Too many calls to {scope}, retry after {retry_after:.2f} seconds")
+        self.scope = scope
+        self.retry_after = retry_after
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"result": "error", "message": str(self), "retryAfterSeconds": round(self.retry_after, 3)}
+
+
+class EndpointRateLimitExceeded(RateLimitExceeded, httpx.TransportError):
+    """A request was rejected by the limiter of its endpoint, handled like the other transport errors."""
+
+    def __init__(self, scope: str, retry_after: float, request: Optional[httpx.Request] = None):
+        super().__init__(scope, retry_after)
+        self._request = request
+
+
+class Limiter:
+    """A thread-safe token bucket rate limit and max number of concurrent calls."""
+
+    def __init__(self, scope: str, rate: Optional[float] = None, max_in_flight: Optional[int] = None):
+        self.scope = scope
+        self.rate = rate or 0.0
+        self.max_in_flight = max_in_flight or 0
+        # a burst of up to one second of calls is allowed
+        self.capacity = max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._in_flight = 0
+        self._waiters: list[tuple[int, int]] = []
+        self._tickets = itertools.count()
+        self._condition = threading.Condition()
+        self._last_used = self._updated
+
+    def acquire(self, cost: int = 1, max_wait: float = 0.0) -> None:
+        """
+        Wait for a token and a free slot, for at most ``max_wait`` seconds.
+
+        Parameters
+        ----------
+        cost : int
+            Cost of the call, waiting calls get a free slot cheapest first, then in arrival order.
+        max_wait : float
+            Max seconds to wait.
+
+        Raises
+        ------
+        RateLimitExceeded
+            If the call would wait longer than ``max_wait``.
+        """
+        deadline = time.monotonic() + max_wait
+        self._last_used = deadline
+        wait = self._reserve_token(max_wait)
+        try:
+            if wait > 0:
+                time.sleep(wait)
+            if self.max_in_flight:
+                self._acquire_slot(cost, deadline)
+        except BaseException:
+            # the call is not made, so its token is given back
+            self._refund_token()
+            raise
+
+    def release(self) -> None:
+        """Free the slot taken by ``acquire``."""
+        if not self.max_in_flight:
+            return
+        with self._condition:
+            self._in_flight -= 1
+            self._last_used = time.monotonic()
+            self._condition.notify_all()
+
+    def idle(self, now: float) -> bool:
+        """
+        Whether the limiter has not been used for ``_LIMITER_IDLE_TTL`` seconds and its bucket is full,
+        so dropping it and creating a new one later does not change the calls it allows.
+        """
+        with self._condition:
+            if self._in_flight or self._waiters or now - self._last_used < _LIMITER_IDLE_TTL:
+                return False
+            return not self.rate or self._tokens + (now - self._updated) * self.rate >= self.capacity
+
+    def _reserve_token(self, max_wait: float) -> float:
+        if not self.rate:
+            return 0.0
+        with self._condition:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            wait = max(0.0, (1 - self._tokens) / self.rate)
+            if wait > max_wait:
+                raise RateLimitExceeded(self.scope, wait)
+            # the token is taken now, so calls waiting for later tokens queue behind this one
+            self._tokens -= 1
+            return wait
+
+    def _refund_token(self) -> None:
+        if not self.rate:
+            return
+        with self._condition:
+            self._tokens = min(self.capacity, self._tokens + 1)
+
+    def _acquire_slot(self, cost: int, deadline: float) -> None:
+        with self._condition:
+            waiter = (cost, next(self._tickets))
+            heapq.heappush(self._waiters, waiter)
+            try:
+                while self._in_flight >= self.max_in_flight or self._waiters[0] != waiter:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise RateLimitExceeded(self.scope, _SLOT_RETRY_AFTER)
+                    self._condition.wait(remaining)
+            except BaseException:
+                self._waiters.remove(waiter)
+                heapq.heapify(self._waiters)
+                self._condition.notify_all()
+                raise
+            heapq.heappop(self._waiters)
+            self._in_flight += 1
+
+
+def get_limiter(kind: Literal["tool", "endpoint"], name: str, client: str = "") -> Optional[Limiter]:
+    """
+    Get the limiter of a tool or endpoint, as configured in the settings.
+
+    Parameters
+    ----------
+    kind : Literal["tool", "endpoint"]
+        Whether ``name`` is a tool name or an endpoint label.
+    name : str
+        The tool name or endpoint label, the "*" entry of the settings applies if it has none.
+    client : str
+        Identifier of the client, tools are limited per client.
+
+    Returns
+    -------
+    Optional[Limiter]
+        The limiter, or None if the tool or endpoint is not limited.
+    """
+    settings = get_settings()
+    rates = settings.tool_rate_limits if kind == "tool" else settings.endpoint_rate_limits
+    caps = settings.tool_max_in_flight if kind == "tool" else settings.endpoint_max_in_flight
+    rate, max_in_flight = rates.get(name, rates.get("*")), caps.get(name, caps.get("*"))
+    if not rate and not max_in_flight:
+        return None
+
+    key = (kind, name, client)
+    with _limiters_lock:
+        _drop_idle_limiters()
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = _limiters[key] = Limiter(name, rate, max_in_flight)
+        return limiter
+
+
+def _drop_idle_limiters() -> None:
+    # at most once per TTL, so a limiter is dropped at most two TTLs after its last use
+    global _limiters_swept
+    now = time.monotonic()
+    if now - _limiters_swept < _LIMITER_IDLE_TTL:
+        return
+    _limiters_swept = now
+    for key in [key for key, limiter in _limiters.items() if limiter.idle(now)]:
+        del _limiters[key]
+
+
+def limits_enabled() -> bool:
+    settings = get_settings()
+    return any(
+        (
+            settings.tool_rate_limits,
+            settings.tool_max_in_flight,
+            settings.endpoint_rate_limits,
+            settings.endpoint_max_in_flight,
+        )
+    )
+
+
+def limit_tool(
+    fn: Callable[..., Any],
+    name: str,
+    tags: Optional[set[str]] = None,
+    annotations: Any = None,
+) -> Callable[..., Any]:
+    """
+    Wrap a tool function so its requests are sent with the priority class of the tool and its calls
+    are limited. If limits are enabled, synchronous tools run on a worker thread, so calls waiting for
+    their turn do not block the other clients.
+
+    Parameters
+    ----------
+    fn : Callable[..., Any]
+        The tool function.
+    name : str
+        Name of the tool.
+    tags : Optional[set[str]]
+        Tags of the tool, the priority class and cost of its calls depend on them.
+    annotations : Any
+        Annotations of the tool, the priority class of its calls depends on them.
+
+    Returns
+    -------
+    Callable[..., Any]
+        The wrapped function. A rejected call returns
+        {"result": "error", "message": "error message", "retryAfterSeconds": seconds}.
+    """
+    priority = priority_class(tags, annotations)
+    is_async = inspect.iscoroutinefunction(fn)
+
+    if not limits_enabled():
+        if is_async:
+
+            @functools.wraps(fn)
+            async def _scheduled_async(*args: Any, **kwargs: Any) -> Any:
+                with tool_call(priority, _client_key()):
+                    return await fn(*args, **kwargs)
+
+            return _scheduled_async
+
+        @functools.wraps(fn)
+        def _scheduled(*args: Any, **kwargs: Any) -> Any:
+            with tool_call(priority, _client_key()):
+                return fn(*args, **kwargs)
+
+        return _scheduled
+
+    cost = max((_TAG_COSTS.get(tag, 1) for tag in tags or ()), default=1)
+
+    @functools.wraps(fn)
+    async def _limited(*args: Any, **kwargs: Any) -> Any:
+        client = _client_key()
+        token = _call_cost.set(cost)
+        try:
+            with tool_call(priority, client):
+                limiter = get_limiter("tool", name, client)
+                if limiter is not None:
+                    await anyio.to_thread.run_sync(limiter.acquire, cost, get_settings().limit_max_wait)
+                try:
+                    if is_async:
+                        return await fn(*args, **kwargs)
+                    return await anyio.to_thread.run_sync(functools.partial(fn, *args, **kwargs))
+                finally:
+                    if limiter is not None:
+                        limiter.release()
+        except RateLimitExceeded as err:
+            return err.to_dict()
+        finally:
+            _call_cost.reset(token)
+
+    return _limited
+
+
+class LimitedFastMCP(FastMCP):
+    """FastMCP server scheduling and limiting the calls of the tools registered on it."""
+
+    def add_tool(
+        self,
+        fn: Callable[..., Any],
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        tags: Optional[set[str]] = None,
+        annotations: Any = None,
+    ) -> None:
+        super().add_tool(
+            limit_tool(fn, name or fn.__name__, tags, annotations),
+            name=name,
+            description=description,
+            tags=tags,
+            annotations=annotations,
+        )
+
+
+class LimitedTransport(httpx.BaseTransport):
+    """Transport applying the endpoint limits of the settings to the requests sent through another transport."""
+
+    def __init__(self, transport: httpx.BaseTransport):
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.raw_path.decode("ascii").partition("?")[0]
+        limiter = get_limiter("endpoint", endpoint_label(path) or "other")
+        if limiter is None:
+            return self._transport.handle_request(request)
+
+        try:
+            limiter.acquire(_call_cost.get(), get_settings().limit_max_wait)
+        except RateLimitExceeded as err:
+            raise EndpointRateLimitExceeded(err.scope, err.retry_after, request) from None
+        try:
+            response = self._transport.handle_request(request)
+        except BaseException:
+            limiter.release()
+            raise
+        return release_on_close(response, limiter.release)
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+def _client_key() -> str:
+    try:
+        ctx = get_context()
+        return ctx.client_id or str(id(ctx.session))
+    except (RuntimeError, ValueError):
+        return ""
@@ -0,0 +1,85 @@
+# Copyright 2024 Datastrato Pvt Ltd.
+# This software is licensed under the Apache License version 2.
+
+# Fully qualified names of metadata objects: names joined by dots, a name containing a dot quoted with
+# backquotes. Kept free of other imports, so the entities can build their names too.
+from typing import Tuple
+
+_QUOTE = "`"
+
+
+def split_fqn(fqn: str) -> Tuple[str, ...]:
+    """
+    Split a fully qualified name into names. A name containing dots is quoted with backquotes,
+    and a backquote in a quoted name is doubled, e.g. ```catalog.`my.schema`.table```.
+
+    Parameters
+    ----------
+    fqn : str
+        A fully qualified name.
+
+    Returns
+    -------
+    Tuple[str, ...]
+        The unquoted names.
+
+    Raises
+    ------
+    ValueError
+        If a name is empty or a quote is not closed.
+    """
+    if _QUOTE not in fqn:
+        names = tuple(fqn.split("."))
+    else:
+        names_list, name, index = [], [], 0
+        while index < len(fqn):
+            char = fqn[index]
+            if char == _QUOTE and not name:
+                end = index + 1
+                while True:
+                    end = fqn.find(_QUOTE, end)
+                    if end < 0:
+                        raise ValueError(f"Invalid fully qualified name {fqn!r}: unclosed quote")
+                    if fqn.startswith(_QUOTE * 2, end):
+                        end += 2
+                        continue
+                    break
+                name.append(fqn[index + 1 : end].replace(_QUOTE * 2, _QUOTE))
+                index = end + 1
+                if index < len(fqn) and fqn[index] != ".":
+                    raise ValueError(f"Invalid fully qualified name {fqn!r}: expected '.' after a quoted name")
+                continue
+            if char == ".":
+                names_list.append("".join(name))
+                name = []
+            else:
+                name.append(char)
+            index += 1
+        names_list.append("".join(name))
+        names = tuple(names_list)
+    if not all(names):
+        raise ValueError(f"Invalid fully qualified name {fqn!r}: names cannot be empty")
+    return names
+
+
+def join_fqn(*names: str) -> str:
+    """
+    Join names into a fully qualified name, the reverse of ``split_fqn``.
+
+    Parameters
+    ----------
+    *names : str
+        The names, e.g. of the Metalake, catalog, schema and table.
+
+    Returns
+    -------
+    str
+        The names joined by dots, those containing a dot or starting with a backquote quoted.
+    """
+    return ".".join(_quote_name(name) for name in names)
+
+
+def _quote_name(name: str) -> str:
+    if "." in name or name.startswith(_QUOTE):
+        return _QUOTE + name.replace(_QUOTE, _QUOTE * 2) + _QUOTE
+    return name
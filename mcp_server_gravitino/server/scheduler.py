@@ -0,0 +1,233 @@
+# Copyright 2024 Datastrato Pvt Ltd.
+# This software is licensed under the Apache License version 2.
+
+# Scheduling of the requests sent to Gravitino. Every tool call has a priority class, and each class
+# has its own connection pool, so writes and bulk calls never hold up the connections of quick reads.
+# Within a class, free connections go to the waiting clients in turn.
+import contextlib
+import contextvars
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Callable, Iterator, Literal, Optional
+
+import httpx
+
+from mcp_server_gravitino.server.settings import get_settings
+from mcp_server_gravitino.server.tools.common_tools import BULK_OPERATION_TAG
+
+PriorityClass = Literal["interactive", "write", "bulk"]
+
+PRIORITY_CLASSES: tuple[PriorityClass, ...] = ("interactive", "write", "bulk")
+
+# priority class and client of the tool call being run, inherited by the requests it sends
+_priority: contextvars.ContextVar[PriorityClass] = contextvars.ContextVar("priority", default="interactive")
+_client: contextvars.ContextVar[str] = contextvars.ContextVar("client", default="")
+
+# tool calls being run and the time the last one ended, to tell whether the server is idle
+_active_calls = 0
+_last_call_end = float("-inf")
+_calls_lock = threading.Lock()
+
+
+def priority_class(tags: Optional[set[str]] = None, annotations: Any = None) -> PriorityClass:
+    """
+    Get the priority class of a tool.
+
+    Parameters
+    ----------
+    tags : Optional[set[str]]
+        Tags of the tool, tools tagged as bulk operations are bulk.
+    annotations : Any
+        Annotations of the tool, as a dict or ``ToolAnnotations``, the other tools which are not
+        read only are writes.
+
+    Returns
+    -------
+    PriorityClass
+        "bulk", "write" or "interactive".
+    """
+    if tags and BULK_OPERATION_TAG in tags:
+        return "bulk"
+    read_only = (
+        annotations.get("readOnlyHint") if isinstance(annotations, dict) else getattr(annotations, "readOnlyHint", None)
+    )
+    return "write" if read_only is False else "interactive"
+
+
+@contextlib.contextmanager
+def call_scope(priority: PriorityClass, client: str = "") -> Iterator[None]:
+    """Send the requests made in this scope, including from ``bounded_map`` threads, with a priority class."""
+    priority_token = _priority.set(priority)
+    client_token = _client.set(client)
+    try:
+        yield
+    finally:
+        _client.reset(client_token)
+        _priority.reset(priority_token)
+
+
+@contextlib.contextmanager
+def tool_call(priority: PriorityClass, client: str = "") -> Iterator[None]:
+    """Run a tool call in a ``call_scope``, counting it as activity of the server."""
+    global _active_calls, _last_call_end
+    with _calls_lock:
+        _active_calls += 1
+    try:
+        with call_scope(priority, client):
+            yield
+    finally:
+        with _calls_lock:
+            _active_calls -= 1
+            _last_call_end = time.monotonic()
+
+
+def idle_seconds() -> float:
+    """Seconds since the last tool call ended, infinite before the first one and 0 while one is being run."""
+    with _calls_lock:
+        if _active_calls:
+            return 0.0
+        return time.monotonic() - _last_call_end
+
+
+class FairSlots:
+    """A thread-safe number of slots, handed to the waiting clients in turn once all are taken."""
+
+    def __init__(self, size: int):
+        self.size = max(1, size)
+        self._in_use = 0
+        self._waiters: OrderedDict[str, deque[threading.Event]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def acquire(self, client: str = "", timeout: Optional[float] = None) -> None:
+        """
+        Wait for a free slot.
+
+        Parameters
+        ----------
+        client : str
+            Identifier of the client, waiting clients get a slot in turn.
+        timeout : Optional[float]
+            Max seconds to wait, or None to wait until a slot is free.
+
+        Raises
+        ------
+        httpx.PoolTimeout
+            If no slot was freed within ``timeout`` seconds.
+        """
+        with self._lock:
+            if self._in_use < self.size and not self._waiters:
+                self._in_use += 1
+                return
+            event = threading.Event()
+            self._waiters.setdefault(client, deque()).append(event)
+        if event.wait(timeout):
+            return
+        with self._lock:
+            # the slot may have been handed over since the wait timed out
+            if event.is_set():
+                return
+            events = self._waiters[client]
+            events.remove(event)
+            if not events:
+                del self._waiters[client]
+        raise httpx.PoolTimeout(f"No connection to Gravitino was freed within {timeout} seconds")
+
+    def release(self) -> None:
+        with self._lock:
+            if not self._waiters:
+                self._in_use -= 1
+                return
+            # the slot goes to the first waiting client, which then moves to the back of the line
+            client, events = self._waiters.popitem(last=False)
+            event = events.popleft()
+            if events:
+                self._waiters[client] = events
+        event.set()
+
+
+class SchedulingTransport(httpx.BaseTransport):
+    """Transport sending each request through the connection pool of its priority class."""
+
+    def __init__(self, create_transport: Callable[[httpx.Limits], httpx.BaseTransport]):
+        """
+        Parameters
+        ----------
+        create_transport : Callable[[httpx.Limits], httpx.BaseTransport]
+            Creates the transport of a priority class, given the limits of its connection pool.
+        """
+        settings = get_settings()
+        connections = {
+            "interactive": settings.interactive_connections,
+            "write": settings.write_connections,
+            "bulk": settings.bulk_connections,
+        }
+        self._slots = {priority: FairSlots(connections[priority]) for priority in PRIORITY_CLASSES}
+        self._transports = {
+            priority: create_transport(httpx.Limits(max_connections=slots.size, max_keepalive_connections=slots.size))
+            for priority, slots in self._slots.items()
+        }
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        priority = _priority.get()
+        slots = self._slots[priority]
+        # waits up to the pool timeout of the request, like the connection pool itself
+        timeout = request.extensions.get("timeout", {}).get("pool")
+        try:
+            slots.acquire(_client.get(), get_settings().limit_max_wait if timeout is None else timeout)
+        except httpx.PoolTimeout as err:
+            err.request = request
+            raise
+        try:
+            response = self._transports[priority].handle_request(request)
+        except BaseException:
+            slots.release()
+            raise
+        return release_on_close(response, slots.release)
+
+    def close(self) -> None:
+        for transport in {id(transport): transport for transport in self._transports.values()}.values():
+            transport.close()
+
+
+def release_on_close(response: httpx.Response, release: Callable[[], None]) -> httpx.Response:
+    """
+    Call ``release`` once the body of a response is read or the response is closed.
+
+    Parameters
+    ----------
+    response : httpx.Response
+        A response returned by a transport.
+    release : Callable[[], None]
+        Frees what the request held, e.g. a slot.
+
+    Returns
+    -------
+    httpx.Response
+        The response.
+    """
+    if isinstance(response.stream, httpx.ByteStream):
+        # the body is already in memory
+        release()
+    else:
+        # streamed responses are decoded while they are received, so the request holds until then
+        response.stream = _ReleasingStream(response.stream, release)
+    return response
+
+
+class _ReleasingStream(httpx.SyncByteStream):
+    def __init__(self, stream: Any, release: Callable[[], None]):
+        self._stream = stream
+        self._release: Optional[Callable[[], None]] = release
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            if hasattr(self._stream, "close"):
+                self._stream.close()
+        finally:
+            release, self._release = self._release, None
+            if release is not None:
+                release()
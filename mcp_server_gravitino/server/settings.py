@@ -1,5 +1,6 @@
 # Copyright 2024 Datastrato Pvt Ltd.
 # This software is licensed under the Apache License version 2.
+from functools import lru_cache
 from typing import Optional
 
 from pydantic import model_validator
@@ -18,6 +19,36 @@ class Settings(BaseSettings):
     # mcp settings
     active_tools: Optional[str] = "*"  # comma separated tools to mount
 
+    # performance settings
+    max_concurrency: int = 8  # max parallel requests of a bulk tool
+    cache_ttl: float = 30.0  # seconds metadata is cached for, 0 disables caching
+    cache_max_entries: int = 10000  # max entries per cache
+    cache_stale_grace: float = 0.0  # seconds expired catalogs, schemas and tables are served while reloaded
+    snapshot_dir: Optional[str] = None  # directory metadata snapshots are persisted to
+    immutable_cache_max_entries: int = 100000  # max entries per cache of immutable entities, 0 disables them
+    immutable_cache_dir: Optional[str] = None  # directory immutable entities are persisted to
+    export_dir: Optional[str] = None  # directory the tools may write output files to, none if not set
+
+    # connections to Gravitino of each priority class, requests wait for a free one in turn per client
+    interactive_connections: int = 8  # for the calls of read tools
+    write_connections: int = 4  # for the calls of tools changing metadata
+    bulk_connections: int = 4  # for the calls of bulk and background tools
+
+    # limits, keyed by tool name or endpoint label, the "*" entry applies to the others
+    tool_rate_limits: dict[str, float] = {}  # calls per second of each client
+    tool_max_in_flight: dict[str, int] = {}  # concurrent calls of each client
+    endpoint_rate_limits: dict[str, float] = {}  # requests per second to Gravitino
+    endpoint_max_in_flight: dict[str, int] = {}  # concurrent requests to Gravitino
+    limit_max_wait: float = 2.0  # seconds a call or request may wait for its turn before being rejected
+
+    # cache warmer, refreshing catalogs, schemas and the most requested tables while no tool is called
+    cache_warmer: bool = False
+    cache_warmer_interval: float = 20.0  # seconds between two rounds, below cache_ttl to keep entries warm
+    cache_warmer_idle: float = 2.0  # seconds without tool calls before a round starts
+    cache_warmer_budget: int = 50  # max requests of a round
+    cache_warmer_tables: int = 20  # number of most requested tables refreshed
+    access_counts_path: Optional[str] = None  # JSON file the table request counts are persisted to
+
     model_config = SettingsConfigDict(env_prefix="GRAVITINO_")
 
     @model_validator(mode="after")
@@ -35,3 +66,9 @@ class Settings(BaseSettings):
         if self.jwt_token:
             return {"Authorization": f"Bearer {self.jwt_token}"}
         raise ValueError("one of basic auth or jwt token should be provided")
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the settings of the server, read from the environment once."""
+    return Settings()
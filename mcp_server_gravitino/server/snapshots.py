@@ -0,0 +1,98 @@
+# Copyright 2024 Datastrato Pvt Ltd.
+# This software is licensed under the Apache License version 2.
+
+# Metadata snapshots: a content hash per entity, used to detect what changed between two points in time.
+import hashlib
+import json
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field, is_dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+from mcp_server_gravitino.server.names import split_fqn
+from mcp_server_gravitino.server.settings import get_settings
+
+# snapshots kept in memory, older ones are only available if persisted
+_MAX_SNAPSHOTS = 32
+
+
+def content_hash(value: Any) -> str:
+    """Hash an entity (or any JSON compatible value) independently of key order."""
+    if is_dataclass(value):
+        value = asdict(value)
+    data = json.dumps(value, sort_keys=True, default=str, separators=(",", ":")).encode()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+@dataclass
+class Snapshot:
+    """
+    Hashes of the metadata of a Metalake. Entry keys are ``<kind>:<dotted path>``, e.g.
+    ``table:catalog.schema.table``; the path of every kind except ``tag`` starts with the catalog name.
+    """
+
+    id: str
+    created_at: str
+    catalog_names: Optional[list[str]] = None
+    definitions: str = "none"
+    tags: bool = False
+    entries: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def create(cls, **kwargs: Any) -> "Snapshot":
+        return cls(id=uuid.uuid4().hex, created_at=datetime.now(timezone.utc).isoformat(), **kwargs)
+
+    def in_scope(self, key: str) -> bool:
+        """Whether an entry key lies in the catalogs this snapshot was taken of."""
+        kind, _, path = key.partition(":")
+        if kind == "tag":
+            return self.tags
+        return not self.catalog_names or split_fqn(path)[0] in self.catalog_names
+
+
+class SnapshotStore:
+    """Recent snapshots in memory, optionally persisted as JSON files to ``Settings.snapshot_dir``."""
+
+    def __init__(self, directory: Optional[str] = None):
+        self._directory = Path(directory) if directory else None
+        self._snapshots: OrderedDict[str, Snapshot] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def save(self, snapshot: Snapshot) -> None:
+        with self._lock:
+            self._snapshots[snapshot.id] = snapshot
+            while len(self._snapshots) > _MAX_SNAPSHOTS:
+                self._snapshots.popitem(last=False)
+        if self._directory is not None:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            self._path(snapshot.id).write_text(json.dumps(asdict(snapshot)), encoding="utf-8")
+
+    def get(self, snapshot_id: str) -> Optional[Snapshot]:
+        with self._lock:
+            snapshot = self._snapshots.get(snapshot_id)
+        if snapshot is not None or self._directory is None:
+            return snapshot
+        path = self._path(snapshot_id)
+        if not path.is_file():
+            return None
+        return Snapshot(**json.loads(path.read_text(encoding="utf-8")))
+
+    def _path(self, snapshot_id: str) -> Path:
+        # ids are generated hex strings, anything else must not escape the directory
+        return self._directory / f"{Path(snapshot_id).name}.json"
+
+
+_store: Optional[SnapshotStore] = None
+_store_lock = threading.Lock()
+
+
+def get_snapshot_store() -> SnapshotStore:
+    """Get the process-wide snapshot store."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = SnapshotStore(get_settings().snapshot_dir)
+        return _store
@@ -3,6 +3,8 @@
 import httpx
 from httpx import MockTransport, Response
 
+from mcp_server_gravitino.server.limits import LimitedTransport
+from mcp_server_gravitino.server.scheduler import SchedulingTransport
 from mcp_server_gravitino.server.settings import Settings
 
 LIST_CATALOG_TEST_RESPONSE = [
@@ -11,7 +13,13 @@ LIST_CATALOG_TEST_RESPONSE = [
         "type": "relational",
         "provider": "hive",
         "comment": "mock catalog",
-    }
+    },
+    {
+        "name": "catalog",
+        "type": "relational",
+        "provider": "hive",
+        "comment": "mock catalog",
+    },
 ]
 LIST_SCHEMA_TEST_RESPONSE = [
     {
@@ -31,6 +39,19 @@ LIST_TABLE_TEST_RESPONSE = [
         "fullyQualifiedName": "demo_metalake.catalog.schema.table2",
     },
 ]
+GET_TABLE_TEST_RESPONSE = {
+    "name": "table1",
+    "comment": "mock table",
+    "columns": [
+        {"name": "id", "type": "long", "nullable": False},
+        {"name": "ts", "type": "timestamp", "nullable": True},
+    ],
+    "partitioning": [{"strategy": "day", "fieldName": ["ts"]}],
+    "distribution": {"strategy": "hash", "number": 4, "funcArgs": [{"type": "field", "fieldName": ["id"]}]},
+    "sortOrders": [],
+    "indexes": [{"indexType": "PRIMARY_KEY", "name": "pk", "fieldNames": [["id"]]}],
+    "properties": {"format": "parquet"},
+}
 LIST_MODEL_TEST_RESPONSE = [
     {
         "name": "model1",
@@ -44,6 +65,75 @@ LIST_MODEL_TEST_RESPONSE = [
     },
 ]
 
+GET_MODEL_VERSION_TEST_RESPONSE = {
+    "1": {
+        "version": 1,
+        "comment": "first",
+        "aliases": [],
+        "uri": "s3://models/model1/1",
+        "audit": {"creator": "alice"},
+    },
+    "2": {
+        "version": 2,
+        "comment": "second",
+        "aliases": ["prod"],
+        "uri": "s3://models/model1/2",
+        "audit": {"creator": "bob"},
+    },
+}
+GET_FILESET_TEST_RESPONSE = {
+    "fileset1": {"name": "fileset1", "type": "managed", "storageLocation": "hdfs://warehouse/fileset1"},
+    "fileset2": {"name": "fileset2", "type": "external", "storageLocation": "s3://bucket/fileset2"},
+}
+LIST_USER_TEST_RESPONSE = [
+    {"name": "alice", "roles": ["analyst", "admin"]},
+    {"name": "bob", "roles": ["analyst"]},
+]
+GET_ROLE_TEST_RESPONSE = {
+    "analyst": {
+        "name": "analyst",
+        "securableObjects": [
+            {
+                "fullName": "catalog",
+                "type": "catalog",
+                "privileges": [
+                    {"name": "use_catalog", "condition": "allow"},
+                    {"name": "use_schema", "condition": "allow"},
+                    {"name": "select_table", "condition": "allow"},
+                ],
+            },
+            {
+                "fullName": "catalog.schema.table2",
+                "type": "table",
+                "privileges": [{"name": "select_table", "condition": "deny"}],
+            },
+        ],
+    },
+    "admin": {
+        "name": "admin",
+        "securableObjects": [
+            {
+                "fullName": "demo_metalake",
+                "type": "metalake",
+                "privileges": [{"name": "create_catalog", "condition": "allow"}],
+            },
+        ],
+    },
+}
+LIST_TAG_TEST_RESPONSE = ["PII", "sensitive"]
+LIST_TAG_OBJECTS_TEST_RESPONSE = {
+    "PII": [
+        {"fullName": "catalog.schema.table1", "type": "table"},
+        {"fullName": "catalog.schema.table2.email", "type": "column"},
+    ],
+    "sensitive": [
+        {"fullName": "catalog.schema.table1", "type": "table"},
+    ],
+}
+LIST_ENTITY_TAGS_TEST_RESPONSE = {
+    "table/catalog.schema.table1": ["PII", "sensitive"],
+}
+
 
 def mock_httpx_client(
     metalake: str,
@@ -93,6 +183,14 @@ def mock_httpx_client(
                         "identifiers": LIST_TABLE_TEST_RESPONSE,
                     },
                 )
+            # mock a table
+            elif request.url.path == f"/api/metalakes/{metalake}/catalogs/catalog/schemas/schema/tables/table1":
+                return Response(
+                    200,
+                    json={
+                        "table": GET_TABLE_TEST_RESPONSE,
+                    },
+                )
             # mock models
             elif request.url.path == f"/api/metalakes/{metalake}/catalogs/catalog/schemas/schema/models":
                 return Response(
@@ -101,7 +199,113 @@ def mock_httpx_client(
                         "identifiers": LIST_MODEL_TEST_RESPONSE,
                     },
                 )
+            # mock versions of a model
+            elif (
+                request.url.path == f"/api/metalakes/{metalake}/catalogs/catalog/schemas/schema/models/model1/versions"
+            ):
+                return Response(
+                    200,
+                    json={
+                        "versions": [int(version) for version in GET_MODEL_VERSION_TEST_RESPONSE],
+                    },
+                )
+            # mock a model version, by version number or alias
+            elif request.url.path.startswith(
+                f"/api/metalakes/{metalake}/catalogs/catalog/schemas/schema/models/model1/"
+            ):
+                kind, key = request.url.path.split("/")[-2:]
+                for version in GET_MODEL_VERSION_TEST_RESPONSE.values():
+                    if (kind == "versions" and key == str(version["version"])) or (
+                        kind == "aliases" and key in version["aliases"]
+                    ):
+                        return Response(
+                            200,
+                            json={
+                                "modelVersion": version,
+                            },
+                        )
+            # mock filesets
+            elif request.url.path == f"/api/metalakes/{metalake}/catalogs/fileset_catalog/schemas/schema/filesets":
+                return Response(
+                    200,
+                    json={
+                        "identifiers": [
+                            {"name": name, "namespace": [metalake, "fileset_catalog", "schema"]}
+                            for name in GET_FILESET_TEST_RESPONSE
+                        ],
+                    },
+                )
+            # mock a fileset
+            elif request.url.path.startswith(
+                f"/api/metalakes/{metalake}/catalogs/fileset_catalog/schemas/schema/filesets/"
+            ):
+                fileset_name = request.url.path.split("/")[-1]
+                if fileset_name in GET_FILESET_TEST_RESPONSE:
+                    return Response(
+                        200,
+                        json={
+                            "fileset": GET_FILESET_TEST_RESPONSE[fileset_name],
+                        },
+                    )
+            # mock users
+            elif request.url.path == f"/api/metalakes/{metalake}/users":
+                return Response(
+                    200,
+                    json={
+                        "users": LIST_USER_TEST_RESPONSE,
+                    },
+                )
+            # mock roles
+            elif request.url.path == f"/api/metalakes/{metalake}/roles":
+                return Response(
+                    200,
+                    json={
+                        "names": list(GET_ROLE_TEST_RESPONSE),
+                    },
+                )
+            # mock role details
+            elif request.url.path.startswith(f"/api/metalakes/{metalake}/roles/"):
+                role_name = request.url.path.split("/")[5]
+                if role_name in GET_ROLE_TEST_RESPONSE:
+                    return Response(
+                        200,
+                        json={
+                            "role": GET_ROLE_TEST_RESPONSE[role_name],
+                        },
+                    )
+            # mock tags
+            elif request.url.path == f"/api/metalakes/{metalake}/tags":
+                return Response(
+                    200,
+                    json={
+                        "names": LIST_TAG_TEST_RESPONSE,
+                    },
+                )
+            # mock objects of a tag
+            elif request.url.path.startswith(f"/api/metalakes/{metalake}/tags/"):
+                tag_name = request.url.path.split("/")[5]
+                if tag_name in LIST_TAG_OBJECTS_TEST_RESPONSE:
+                    return Response(
+                        200,
+                        json={
+                            "metadataObjects": LIST_TAG_OBJECTS_TEST_RESPONSE[tag_name],
+                        },
+                    )
+            # mock tags of an object
+            elif request.url.path.startswith(f"/api/metalakes/{metalake}/objects/"):
+                object_path = "/".join(request.url.path.split("/")[5:7])
+                if object_path in LIST_ENTITY_TAGS_TEST_RESPONSE:
+                    return Response(
+                        200,
+                        json={
+                            "names": LIST_ENTITY_TAGS_TEST_RESPONSE[object_path],
+                        },
+                    )
 
         return Response(404, json={"path": str(request.url)})
 
-    return httpx.Client(transport=MockTransport(mock_handler), base_url=setting.uri)
+    transport = MockTransport(mock_handler)
+    return httpx.Client(
+        transport=LimitedTransport(SchedulingTransport(lambda limits: transport)),
+        base_url=setting.uri,
+    )
@@ -2,41 +2,79 @@ import os
 
 metalake_name = os.getenv("GRAVITINO_METALAKE", "metalake_demo")
 
+from mcp_server_gravitino.server.tools.cache_stats import get_cache_stats
 from mcp_server_gravitino.server.tools.catalog import (
     get_list_of_catalogs,
 )
+from mcp_server_gravitino.server.tools.changes import get_metadata_changes_since
+from mcp_server_gravitino.server.tools.crawl import crawl_metalake
+from mcp_server_gravitino.server.tools.diff import diff_namespaces, diff_tables
+from mcp_server_gravitino.server.tools.fileset import get_fileset_by_fqn, get_filesets_in_schema, get_list_of_filesets
 from mcp_server_gravitino.server.tools.models import get_list_of_model_versions_by_fqn, get_list_of_models
 from mcp_server_gravitino.server.tools.schema import get_list_of_schemas
 from mcp_server_gravitino.server.tools.table import (
     get_list_of_tables,
     get_table_by_fqn,
     get_table_columns_by_fqn,
+    get_table_details_by_fqn,
 )
 from mcp_server_gravitino.server.tools.tag import (
     associate_tag_to_entity,
+    associate_tags_to_entities,
     get_list_of_tags,
+    get_tagged_objects,
+    get_tags_for_entity,
     list_objects_by_tag,
 )
+from mcp_server_gravitino.server.tools.topic import get_list_of_topics, get_topic_by_fqn
 from mcp_server_gravitino.server.tools.user_role import (
+    check_user_access,
     get_list_of_roles,
     get_list_of_users,
+    get_role_details,
+    get_roles_granting_privilege,
+    get_roles_of_user,
+    get_users_with_role,
     grant_role_to_user,
+    grant_roles_to_users,
     revoke_role_from_user,
+    revoke_roles_from_users,
 )
 
 __all__ = [
     "get_table_by_fqn",
     "get_table_columns_by_fqn",
+    "get_table_details_by_fqn",
+    "diff_tables",
+    "diff_namespaces",
     "get_list_of_tables",
     "get_list_of_tags",
     "associate_tag_to_entity",
+    "associate_tags_to_entities",
     "list_objects_by_tag",
+    "get_tags_for_entity",
+    "get_tagged_objects",
     "get_list_of_catalogs",
     "get_list_of_schemas",
     "get_list_of_roles",
+    "get_role_details",
+    "get_roles_granting_privilege",
+    "check_user_access",
     "get_list_of_users",
+    "get_roles_of_user",
+    "get_users_with_role",
     "grant_role_to_user",
     "revoke_role_from_user",
+    "grant_roles_to_users",
+    "revoke_roles_from_users",
     "get_list_of_model_versions_by_fqn",
     "get_list_of_models",
+    "get_list_of_filesets",
+    "get_fileset_by_fqn",
+    "get_filesets_in_schema",
+    "get_list_of_topics",
+    "get_topic_by_fqn",
+    "crawl_metalake",
+    "get_metadata_changes_since",
+    "get_cache_stats",
 ]
@@ -0,0 +1,47 @@
+# Copyright 2024 Datastrato Pvt Ltd.
+# This software is licensed under the Apache License version 2.
+
+# Stats of the metadata caches of the server, e.g. to check how stale the served metadata is.
+from typing import Any
+
+import httpx
+from fastmcp import FastMCP
+
+from mcp_server_gravitino.server.cache import cache_stats
+from mcp_server_gravitino.server.tools.common_tools import CACHE_TAG, GET_OPERATION_TAG
+
+
+def get_cache_stats(mcp: FastMCP, session: httpx.Client) -> None:
+    """Get the hits, misses and staleness of the metadata caches of the server."""
+
+    @mcp.tool(
+        name="get_cache_stats",
+        description="Get the hits, misses and staleness of the metadata caches of the server.",
+        tags={
+            CACHE_TAG,
+            GET_OPERATION_TAG,
+        },
+        annotations={
+            "readOnlyHint": True,
+            "openWorldHint": False,
+        },
+    )
+    def _get_cache_stats() -> dict[str, Any]:
+        """
+        Get the stats of the metadata caches of the server, since it started.
+
+        Returns
+        -------
+        dict[str, Any]
+            Returns a dictionary with the following keys:
+            - result: "success"
+            - caches: The stats of each cache by name, e.g. "tables", with the keys:
+                - entries: Number of entries in the cache
+                - hits: Lookups answered with a value which had not expired
+                - misses: Lookups answered by loading the value from Gravitino
+                - staleHits: Lookups answered with an expired value, reloaded in the background
+                - meanStaleSeconds: Mean seconds since the expired values served had expired
+                - maxStaleSeconds: Max seconds since an expired value served had expired
+                - refreshErrors: Background reloads which failed
+        """
+        return {"result": "success", "caches": cache_stats()}
@@ -7,9 +7,24 @@ from typing import Any
 import httpx
 from fastmcp import FastMCP
 
+from mcp_server_gravitino.server.cache import get_cache
+from mcp_server_gravitino.server.endpoints import endpoint_path
+from mcp_server_gravitino.server.entities import Catalog
+from mcp_server_gravitino.server.json_stream import Spec, fetch_json
 from mcp_server_gravitino.server.tools import metalake_name
 from mcp_server_gravitino.server.tools.common_tools import CATALOG_TAG, DETAILS_TAG, LIST_OPERATION_TAG
 
+_CATALOGS_SPEC: Spec = {
+    "catalogs": [
+        {
+            "name": True,
+            "type": True,
+            "provider": True,
+            "comment": True,
+        }
+    ],
+}
+
 
 def get_list_of_catalogs(mcp: FastMCP, session: httpx.Client) -> None:
     """Get a list of catalogs in the Metalake."""
@@ -28,10 +43,14 @@ def get_list_of_catalogs(mcp: FastMCP, session: httpx.Client) -> None:
             "openWorldHint": True,
         },
     )
-    def _get_list_of_catalogs() -> list[dict[str, Any]]:
+    def _get_list_of_catalogs(refresh: bool = False) -> list[dict[str, Any]]:
         """
         Get a list of catalogs in the Metalake. it returns a list of dictionaries containing catalog details.
 
+        Parameters
+        ----------
+        refresh : bool
+            Whether to load the catalogs from Gravitino instead of using the cache.
 
         Returns
         -------
@@ -42,17 +61,29 @@ def get_list_of_catalogs(mcp: FastMCP, session: httpx.Client) -> None:
             - provider: Provider of the catalog.
             - comment: Comment about the catalog.
         """
-        response = session.get(f"/api/metalakes/{metalake_name}/catalogs?details=true")
-        response.raise_for_status()
-        response_json = response.json()
-
-        catalogs = response_json.get("catalogs", [])
-        return [
-            {
-                "name": catalog.get("name"),
-                "type": catalog.get("type"),
-                "provider": catalog.get("provider"),
-                "comment": catalog.get("comment"),
-            }
-            for catalog in catalogs
-        ]
+        return [catalog.to_dict() for catalog in load_catalogs(session, refresh)]
+
+
+def load_catalogs(session: httpx.Client, refresh: bool = False) -> tuple[Catalog, ...]:
+    """
+    Load the catalogs of the Metalake, through the catalogs cache.
+
+    Parameters
+    ----------
+    session : httpx.Client
+        HTTP client
+    refresh : bool
+        Whether to bypass the cached catalogs and load them from Gravitino
+
+    Returns
+    -------
+    tuple[Catalog, ...]
+        The catalogs in the Metalake.
+    """
+    url = endpoint_path("catalogs", metalake_name)
+
+    def _load() -> tuple[Catalog, ...]:
+        response_json = fetch_json(session, url, _CATALOGS_SPEC)
+        return tuple(Catalog.from_dict(catalog) for catalog in response_json.get("catalogs") or [])
+
+    return get_cache("catalogs").get_or_load(url, _load, refresh)
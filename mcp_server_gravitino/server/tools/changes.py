@@ -0,0 +1,292 @@
+# Copyright 2024 Datastrato Pvt Ltd.
+# This software is licensed under the Apache License version 2.
+from typing import Any, Literal, Optional
+
+import httpx
+from fastmcp import FastMCP
+
+from mcp_server_gravitino.server.concurrency import bounded_map
+from mcp_server_gravitino.server.entities import Catalog, Schema
+from mcp_server_gravitino.server.names import join_fqn, split_fqn
+from mcp_server_gravitino.server.snapshots import Snapshot, content_hash, get_snapshot_store
+from mcp_server_gravitino.server.tools import metalake_name
+from mcp_server_gravitino.server.tools.catalog import load_catalogs
+from mcp_server_gravitino.server.tools.common_tools import (
+    BULK_OPERATION_TAG,
+    CATALOG_TAG,
+    LIST_OPERATION_TAG,
+    SCHEMA_TAG,
+    TABLE_TAG,
+    TAG_OBJECT_TAG,
+)
+from mcp_server_gravitino.server.tools.fileset import load_filesets
+from mcp_server_gravitino.server.tools.models import load_models
+from mcp_server_gravitino.server.tools.schema import load_schemas
+from mcp_server_gravitino.server.tools.table import load_table, load_table_modified_time, load_tables
+from mcp_server_gravitino.server.tools.tag import load_tag_objects, load_tags
+from mcp_server_gravitino.server.tools.topic import load_topics
+
+# entry kinds holding the hash of a container listing or the modification time of a table, they are not
+# reported as changes
+_LISTING_KINDS = ("schemas", "tables", "models", "filesets", "topics", "modified")
+
+TableDefinitions = Literal["none", "changed", "all"]
+
+
+def get_metadata_changes_since(mcp: FastMCP, session: httpx.Client) -> None:
+    """Get the metadata changes since a previous snapshot."""
+
+    @mcp.tool(
+        name="get_metadata_changes_since",
+        description=(
+            "Take a snapshot of the Metalake metadata and list the catalogs, schemas, tables, models, "
+            "filesets, topics and tags added, removed or changed since a previous snapshot."
+        ),
+        tags={
+            CATALOG_TAG,
+            SCHEMA_TAG,
+            TABLE_TAG,
+            TAG_OBJECT_TAG,
+            LIST_OPERATION_TAG,
+            BULK_OPERATION_TAG,
+        },
+        annotations={
+            "readOnlyHint": True,
+            "openWorldHint": True,
+        },
+    )
+    def _get_metadata_changes_since(
+        snapshot_id: Optional[str] = None,
+        catalog_names: Optional[list[str]] = None,
+        table_definitions: Optional[TableDefinitions] = None,
+        include_tags: Optional[bool] = None,
+    ) -> dict[str, Any]:
+        """
+        Take a snapshot of the Metalake metadata and compare it with a previous snapshot. Every entity
+        is stored as a content hash, so only entities whose hash differs are reported.
+
+        Parameters
+        ----------
+        snapshot_id : Optional[str]
+            Id of the snapshot to compare with, as returned in "snapshotId" by a previous call. If not set,
+            only a new snapshot is taken.
+        catalog_names : Optional[list[str]]
+            Names of the catalogs to snapshot, all catalogs if not set. Defaults to the catalogs of the
+            previous snapshot.
+        table_definitions : Optional[TableDefinitions]
+            Which table definitions to load and compare, defaults to the setting of the previous snapshot
+            or "none":
+            - none: only detect tables being added or removed
+            - changed: check the modification time of every table, with a request decoding only it, and
+              reload the tables modified since the previous snapshot or without a modification time;
+              definitions of the other tables are carried over from the previous snapshot. Table listings
+              carry no modification time, so this still sends one request per table
+            - all: reload every table
+        include_tags : Optional[bool]
+            Whether to compare the objects associated with each tag. Defaults to the setting of the
+            previous snapshot or False.
+
+        Returns
+        -------
+        dict[str, Any]
+            If an error occurs, returns {"result": "error", "message": "error message"}.
+            if successful, returns a dictionary with the following keys:
+            - result: "success"
+            - snapshotId: Id of the new snapshot, to pass to the next call
+            - baseSnapshotId: Id of the snapshot compared with
+            - added, removed, changed: Lists of entities, each with a "type" (catalog, schema, table, model,
+              fileset, topic or tag) and a "fullyQualifiedName" (the tag name for tags)
+            - errors: Containers which could not be listed, with "fullyQualifiedName" and "message". Their
+              previous content is carried over, so they are not reported as removed
+            - requests: Number of requests sent to Gravitino
+        """
+        store = get_snapshot_store()
+        base = None
+        if snapshot_id:
+            base = store.get(snapshot_id)
+            if base is None:
+                return {"result": "error", "message": f"snapshot {snapshot_id} not found"}
+
+        snapshot = Snapshot.create(
+            catalog_names=catalog_names if catalog_names is not None else base and base.catalog_names,
+            definitions=table_definitions or (base.definitions if base else "none"),
+            tags=include_tags if include_tags is not None else bool(base and base.tags),
+        )
+        errors: list[dict[str, str]] = []
+        try:
+            requests = _capture(session, snapshot, base, errors)
+        except httpx.HTTPError as err:
+            return {"result": "error", "message": str(err)}
+        store.save(snapshot)
+
+        added, removed, changed = _diff(base, snapshot) if base else ([], [], [])
+        return {
+            "result": "success",
+            "snapshotId": snapshot.id,
+            "baseSnapshotId": base.id if base else None,
+            "added": added,
+            "removed": removed,
+            "changed": changed,
+            "errors": errors,
+            "requests": requests,
+        }
+
+
+def _capture(
+    session: httpx.Client,
+    snapshot: Snapshot,
+    base: Optional[Snapshot],
+    errors: list[dict[str, str]],
+) -> int:
+    """Fill the entries of a snapshot, returning the number of requests sent."""
+    entries = snapshot.entries
+    requests = 1
+
+    selected = set(snapshot.catalog_names or [])
+    catalogs = [catalog for catalog in load_catalogs(session, refresh=True) if not selected or catalog.name in selected]
+    for catalog in catalogs:
+        entries[f"catalog:{join_fqn(catalog.name)}"] = content_hash(catalog)
+
+    schemas: list[tuple[Catalog, Schema]] = []
+    for catalog, result, error in bounded_map(lambda catalog: load_schemas(session, catalog.name, True), catalogs):
+        requests += 1
+        if error is not None:
+            _carry_over(base, entries, (catalog.name,), errors, error)
+            continue
+        entries[f"schemas:{join_fqn(catalog.name)}"] = content_hash(sorted(schema.name or "" for schema in result))
+        for schema in result:
+            schemas.append((catalog, schema))
+            entries[f"schema:{join_fqn(catalog.name, schema.name)}"] = ""
+
+    def _list_children(item: tuple[Catalog, Schema]) -> tuple[str, tuple]:
+        catalog, schema = item
+        if catalog.type == "relational":
+            return "table", load_tables(session, catalog.name, schema.name, True)
+        if catalog.type == "model":
+            return "model", load_models(session, catalog.name, schema.name, True)
+        if catalog.type == "fileset":
+            return "fileset", load_filesets(session, catalog.name, schema.name, True)
+        if catalog.type == "messaging":
+            return "topic", load_topics(session, catalog.name, schema.name, True)
+        return "", ()
+
+    # tables as their catalog, schema and table names
+    tables_to_load: list[tuple[str, ...]] = []
+    tables_to_check: list[tuple[str, ...]] = []
+    for (catalog, schema), result, error in bounded_map(_list_children, schemas):
+        names = (catalog.name, schema.name)
+        requests += 1
+        if error is not None:
+            _carry_over(base, entries, names, errors, error)
+            continue
+        kind, identifiers = result
+        if not kind:
+            continue
+
+        entries[f"{kind}s:{join_fqn(*names)}"] = content_hash(sorted(ident.name or "" for ident in identifiers))
+        for ident in identifiers:
+            path = join_fqn(*names, ident.name)
+            entries[f"{kind}:{path}"] = ""
+            if kind != "table" or snapshot.definitions == "none":
+                continue
+            if snapshot.definitions == "changed" and base and f"definition:{path}" in base.entries:
+                tables_to_check.append((*names, ident.name))
+            else:
+                tables_to_load.append((*names, ident.name))
+
+    # an altered table keeps its name, so only its modification time tells whether its definition changed;
+    # listings carry no modification time, so this is one request per table
+    for table_names, modified_time, error in bounded_map(
+        lambda table_names: load_table_modified_time(session, join_fqn(metalake_name, *table_names)),
+        tables_to_check,
+    ):
+        requests += 1
+        if error is not None:
+            _carry_over(base, entries, table_names, errors, error)
+            continue
+        path = join_fqn(*table_names)
+        modified_key = f"modified:{path}"
+        if modified_time is not None:
+            entries[modified_key] = modified_time
+        if modified_time is not None and base.entries.get(modified_key) == modified_time:
+            entries[f"definition:{path}"] = base.entries[f"definition:{path}"]
+        else:
+            tables_to_load.append(table_names)
+
+    for table_names, table, error in bounded_map(
+        lambda table_names: load_table(session, join_fqn(metalake_name, *table_names), True),
+        tables_to_load,
+    ):
+        requests += 1
+        if error is not None:
+            _carry_over(base, entries, table_names, errors, error)
+            continue
+        entries[f"definition:{join_fqn(*table_names)}"] = content_hash(table)
+
+    if snapshot.tags:
+        tags = load_tags(session, refresh=True)
+        requests += 1
+        for tag, objects, error in bounded_map(lambda tag: load_tag_objects(session, tag.name, True), tags):
+            requests += 1
+            key = f"tag:{tag.name}"
+            if error is not None:
+                errors.append({"fullyQualifiedName": tag.name, "message": str(error)})
+                if base and key in base.entries:
+                    entries[key] = base.entries[key]
+                continue
+            entries[key] = content_hash(sorted((obj.type or "", obj.full_name or "") for obj in objects))
+
+    return requests
+
+
+def _carry_over(
+    base: Optional[Snapshot],
+    entries: dict[str, str],
+    names: tuple[str, ...],
+    errors: list[dict[str, str]],
+    error: Exception,
+) -> None:
+    """Keep the previous entries below a container which could not be listed."""
+    errors.append({"fullyQualifiedName": join_fqn(metalake_name, *names), "message": str(error)})
+    if base is None:
+        return
+    path = join_fqn(*names)
+    prefix = f"{path}."
+    for key, value in base.entries.items():
+        kind, _, key_path = key.partition(":")
+        if kind != "catalog" and kind != "tag" and (key_path == path or key_path.startswith(prefix)):
+            entries.setdefault(key, value)
+
+
+def _diff(base: Snapshot, snapshot: Snapshot) -> tuple[list, list, list]:
+    compare_definitions = base.definitions != "none" and snapshot.definitions != "none"
+
+    def _comparable(key: str) -> bool:
+        kind = key.partition(":")[0]
+        if kind in _LISTING_KINDS or (kind == "definition" and not compare_definitions):
+            return False
+        return base.in_scope(key) and snapshot.in_scope(key)
+
+    def _entity(key: str) -> dict[str, str]:
+        kind, _, path = key.partition(":")
+        if kind == "tag":
+            return {"type": "tag", "fullyQualifiedName": path}
+        return {
+            "type": "table" if kind == "definition" else kind,
+            "fullyQualifiedName": join_fqn(metalake_name, *split_fqn(path)),
+        }
+
+    added, removed, changed = [], [], []
+    for key, value in snapshot.entries.items():
+        if not _comparable(key):
+            continue
+        if key not in base.entries:
+            # the definition of a new table is part of the table being added
+            if not key.startswith("definition:"):
+                added.append(_entity(key))
+        elif base.entries[key] != value:
+            changed.append(_entity(key))
+    for key in base.entries:
+        if key not in snapshot.entries and _comparable(key) and not key.startswith("definition:"):
+            removed.append(_entity(key))
+    return added, removed, changed
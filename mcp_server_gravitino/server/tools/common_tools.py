@@ -1,12 +1,27 @@
 # Copyright 2024 Datastrato Pvt Ltd.
 # This software is licensed under the Apache License version 2.
-from typing import List, Optional, Tuple
+import time
+import uuid
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+import anyio.from_thread
+from fastmcp import Context
+
+from mcp_server_gravitino.server.cache import TTLCache, get_cache
+from mcp_server_gravitino.server.endpoints import endpoint_path
+from mcp_server_gravitino.server.json_backend import dumps
+from mcp_server_gravitino.server.json_stream import Spec
+from mcp_server_gravitino.server.names import join_fqn, split_fqn
+from mcp_server_gravitino.server.tools import metalake_name as global_metalake_name
 
 # Operation tags
 LIST_OPERATION_TAG = "list operation"
 GET_OPERATION_TAG = "get operation"
 GRANT_OPERATION_TAG = "grant operation"
 REVOKE_OPERATION_TAG = "revoke operation"
+BULK_OPERATION_TAG = "bulk operation"
 
 # API tags
 MODEL_TAG = "models"
@@ -14,6 +29,8 @@ MODEL_VERSION_TAG = "model_versions"
 CATALOG_TAG = "catalogs"
 SCHEMA_TAG = "schemas"
 TABLE_TAG = "tables"
+FILESET_TAG = "filesets"
+TOPIC_TAG = "topics"
 TAG_OBJECT_TAG = "tags"
 ROLE_TAG = "roles"
 USER_TAG = "users"
@@ -21,50 +38,292 @@ PRIVILEGES_TAG = "privileges"
 
 # other tags
 DETAILS_TAG = "details"
+CACHE_TAG = "cache"
+
+# min seconds between two progress notifications
+PROGRESS_INTERVAL = 0.5
+
+# seconds the results of a bulk tool stay available for paging, and number of results kept per tool,
+# independently of the cache settings
+RESULTS_TTL = 600.0
+MAX_RESULTS = 16
+
+T = TypeVar("T")
+
+# Projection of the NameIdentifier list returned by the list endpoints
+IDENTIFIERS_SPEC: Spec = {
+    "identifiers": [
+        {
+            "name": True,
+            "namespace": True,
+        }
+    ],
+}
+
+
+# number of names below the Metalake in the fully qualified name of each entity type
+ENTITY_LEVELS = {
+    "metalake": 0,
+    "catalog": 1,
+    "schema": 2,
+    "table": 3,
+    "model": 3,
+    "fileset": 3,
+    "topic": 3,
+    "column": 4,
+}
+# entity type of a fully qualified name starting with the Metalake, by number of names
+_INFERRED_TYPES = ("metalake", "catalog", "schema", "table", "column")
+
 
+@dataclass(frozen=True, slots=True)
+class FullyQualifiedName:
+    """A fully qualified name resolved by ``resolve_fqn``."""
 
-def parse_four_level_fqn(fqn: List[str]) -> Tuple[Optional[str], str, str, str]:
+    metalake: str
+    names: Tuple[str, ...]
+    type: str
+    path: str
+
+    @property
+    def catalog(self) -> Optional[str]:
+        return self.names[0] if self.names else None
+
+    @property
+    def schema(self) -> Optional[str]:
+        return self.names[1] if len(self.names) > 1 else None
+
+    @property
+    def name(self) -> str:
+        return self.names[-1] if self.names else self.metalake
+
+    @property
+    def object_name(self) -> str:
+        """The name of the metadata object in Gravitino, i.e. the names below the Metalake joined by dots."""
+        return ".".join(self.names)
+
+    def __str__(self) -> str:
+        return join_fqn(self.metalake, *self.names)
+
+
+@lru_cache(maxsize=4096)
+def resolve_fqn(fqn: str, entity_type: Optional[str] = None) -> FullyQualifiedName:
     """
-    Parse a fully qualified name (FQN) with optional metalake prefix.
+    Resolve a fully qualified name, the result is cached so tools can resolve names on every call.
 
     Parameters
     ----------
-    fqn : List[str]
-        A list representing a fully qualified name. It should contain either:
-        - 4 levels: [metalake_name, catalog_name, schema_name, entity_name]
-        - 3 levels: [catalog_name, schema_name, entity_name]
+    fqn : str
+        A fully qualified name, see ``split_fqn`` for quoting.
+    entity_type : Optional[str]
+        Type of the entity, one of the keys of ``ENTITY_LEVELS``. The Metalake name is then optional,
+        e.g. both 'catalog.schema.table' and 'metalake.catalog.schema.table' are tables. If not set,
+        the name must start with the Metalake name and the type is inferred from the number of names:
+        metalake, catalog, schema, table or column.
 
     Returns
     -------
-     Tuple[Optional[str], str, str, str]
-        A tuple containing (metalake_name, catalog_name, schema_name, entity_name).
-        If metalake_name is not provided, it will be returned as None.
+    FullyQualifiedName
+        The resolved name.
 
     Raises
     ------
     ValueError
-         If the FQN does not have 3 or 4 components.
+        If the name is invalid or has too few or too many names for the entity type.
     """
-    if len(fqn) >= 4:
-        return fqn[0], fqn[1], fqn[2], fqn[3]
-    elif len(fqn) == 3:
-        return None, fqn[0], fqn[1], fqn[2]
+    names = split_fqn(fqn)
+    if entity_type is None:
+        if len(names) > len(_INFERRED_TYPES):
+            raise ValueError(
+                f"Invalid fully qualified name {fqn!r}: it must refer to a metalake, catalog, schema, table or column"
+            )
+        metalake, names, entity_type = names[0], names[1:], _INFERRED_TYPES[len(names) - 1]
     else:
-        raise ValueError(
-            "Invalid fully qualified name. Expected [catalog_name.schema_name.entity_name] or [metalake_name.catalog_name.schema_name.entity_name]"
-        )
+        levels = ENTITY_LEVELS[entity_type]
+        if len(names) == levels + 1:
+            metalake, names = names[0], names[1:]
+        elif len(names) == levels and levels:
+            metalake = global_metalake_name
+        else:
+            raise ValueError(
+                f"Invalid fully qualified name {fqn!r}: a {entity_type} name has {levels} names, "
+                "optionally preceded by the metalake name"
+            )
+    return FullyQualifiedName(
+        metalake=metalake,
+        names=names,
+        type=entity_type,
+        # columns have no endpoint, their path is the one of their table
+        path=endpoint_path("table", metalake, *names[:3])
+        if entity_type == "column"
+        else endpoint_path(entity_type, metalake, *names),
+    )
 
 
-def get_name_identifier_without_metalake(fqn: str) -> str:
+def paginate(items: Sequence[T], page_size: int, offset: int = 0) -> Tuple[List[T], Optional[int]]:
     """
-    Get the name identifier without the metalake name.
+    Get a page of items.
+
     Parameters
     ----------
-    fqn : str
-        A fully qualified name.
+    items : Sequence[T]
+        All items.
+    page_size : int
+        Max number of items in the page, at least 1.
+    offset : int
+        Index of the first item of the page.
+
+    Returns
+    -------
+    Tuple[List[T], Optional[int]]
+        The page and the offset of the next page, or None if this is the last page.
+    """
+    page_size = max(1, page_size)
+    offset = max(0, offset)
+    end = offset + page_size
+    return list(items[offset:end]), end if end < len(items) else None
+
+
+def paginate_within_budget(
+    items: Sequence[T],
+    encode: Callable[[T], Any],
+    max_items: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    offset: int = 0,
+) -> Tuple[List[Any], Dict[str, int], Optional[int]]:
+    """
+    Get a page of encoded items fitting in a budget. Items are encoded one at a time, in order, and the
+    page ends before the first item which would exceed the budget, so the items after it are never
+    encoded. A page holds at least one item, even one larger than ``max_bytes``, so every page makes
+    progress.
+
+    Parameters
+    ----------
+    items : Sequence[T]
+        All items.
+    encode : Callable[[T], Any]
+        Converts an item to its JSON compatible value, e.g. ``Column.to_dict``.
+    max_items : Optional[int]
+        Max number of items in the page, at least 1, no limit if None.
+    max_bytes : Optional[int]
+        Max size of the page as a compact JSON array, no limit if None.
+    offset : int
+        Index of the first item of the page.
+
+    Returns
+    -------
+    Tuple[List[Any], Dict[str, int], Optional[int]]
+        The encoded page, its counts ("total" items, "returned" and "remaining" after the page) and the
+        offset of the next page, or None if this is the last page.
+    """
+    offset = min(max(0, offset), len(items))
+    end = len(items) if max_items is None else min(len(items), offset + max(1, max_items))
+    page: List[Any] = []
+    size = 2  # the brackets of the array
+    index = offset
+    while index < end:
+        value = encode(items[index])
+        if max_bytes is not None:
+            # the item and the comma before it
+            size += len(dumps(value, indent=False).encode()) + (1 if page else 0)
+            if size > max_bytes and page:
+                break
+        page.append(value)
+        index += 1
+    counts = {"total": len(items), "returned": len(page), "remaining": len(items) - index}
+    return page, counts, index if index < len(items) else None
+
+
+def first_results_page(cache_name: str, summary: Dict[str, Any], page_size: int) -> Dict[str, Any]:
+    """
+    Keep the results of a bulk tool call for paging through their "items", and get their first page.
+
+    Parameters
+    ----------
+    cache_name : str
+        Name of the cache the results of the tool are kept in, e.g. "crawls".
+    summary : Dict[str, Any]
+        The results, with every item in "items".
+    page_size : int
+        Max number of items in the page.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The results with the items of the first page, and a "nextPageToken" if there are more items.
+        The results stay available for ``RESULTS_TTL`` seconds, and only the ``MAX_RESULTS`` most recent
+        results of the tool are kept.
+    """
+    results_id = uuid.uuid4().hex
+    _results_cache(cache_name).set(results_id, summary)
+    return _results_page(results_id, summary, 0, page_size)
+
+
+def results_page(cache_name: str, page_token: str, page_size: int, expired_message: str) -> Dict[str, Any]:
+    """
+    Get a page of the results kept by ``first_results_page``.
+
+    Parameters
+    ----------
+    cache_name : str
+        Name of the cache the results of the tool are kept in.
+    page_token : str
+        Token of the page, as returned in "nextPageToken".
+    page_size : int
+        Max number of items in the page.
+    expired_message : str
+        Error message if the results are no longer kept, telling how to get them again.
+
     Returns
     -------
-    str
-        The name identifier without the metalake name.
+    Dict[str, Any]
+        The results with the items of the page, and a "nextPageToken" if there are more items.
+        If the token is invalid or the results have expired, returns
+        {"result": "error", "message": "error message"}.
     """
-    return fqn.split(".", 1)[1] if "." in fqn else fqn
+    results_id, _, offset = page_token.rpartition(":")
+    if not results_id or not offset.isdigit():
+        return {"result": "error", "message": "page_token is invalid"}
+    summary = _results_cache(cache_name).get(results_id)
+    if summary is None:
+        return {"result": "error", "message": expired_message}
+    return _results_page(results_id, summary, int(offset), page_size)
+
+
+def _results_cache(cache_name: str) -> TTLCache:
+    return get_cache(cache_name, ttl=RESULTS_TTL, max_entries=MAX_RESULTS)
+
+
+def _results_page(results_id: str, summary: Dict[str, Any], offset: int, page_size: int) -> Dict[str, Any]:
+    items, next_offset = paginate(summary["items"], page_size, offset)
+    page = {**summary, "items": items}
+    if next_offset is not None:
+        page["nextPageToken"] = f"{results_id}:{next_offset}"
+    return page
+
+
+def progress_reporter(ctx: Context) -> Callable[[int, int], None]:
+    """
+    Build a callback reporting the progress of a long running tool to the client, from a worker thread.
+
+    Parameters
+    ----------
+    ctx : Context
+        MCP context of the tool call.
+
+    Returns
+    -------
+    Callable[[int, int], None]
+        Callback taking the number of steps done and the total number of steps. Calls less than
+        ``PROGRESS_INTERVAL`` seconds apart are dropped, except the final one.
+    """
+    last_report = [0.0]
+
+    def _report(done: int, total: int) -> None:
+        now = time.monotonic()
+        if done < total and now - last_report[0] < PROGRESS_INTERVAL:
+            return
+        last_report[0] = now
+        anyio.from_thread.run(ctx.report_progress, done, total)
+
+    return _report
@@ -0,0 +1,273 @@
+# Copyright 2024 Datastrato Pvt Ltd.
+# This software is licensed under the Apache License version 2.
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import anyio
+import httpx
+from fastmcp import Context, FastMCP
+
+from mcp_server_gravitino.server import json_backend
+from mcp_server_gravitino.server.concurrency import bounded_map
+from mcp_server_gravitino.server.entities import Catalog, NameIdentifier, Schema
+from mcp_server_gravitino.server.settings import get_settings
+from mcp_server_gravitino.server.tools import metalake_name
+from mcp_server_gravitino.server.tools.catalog import load_catalogs
+from mcp_server_gravitino.server.tools.common_tools import (
+    BULK_OPERATION_TAG,
+    CATALOG_TAG,
+    FILESET_TAG,
+    LIST_OPERATION_TAG,
+    MODEL_TAG,
+    SCHEMA_TAG,
+    TABLE_TAG,
+    TOPIC_TAG,
+    first_results_page,
+    join_fqn,
+    progress_reporter,
+    results_page,
+)
+from mcp_server_gravitino.server.tools.fileset import load_filesets
+from mcp_server_gravitino.server.tools.models import load_models
+from mcp_server_gravitino.server.tools.schema import load_schemas
+from mcp_server_gravitino.server.tools.table import load_table, load_tables
+from mcp_server_gravitino.server.tools.topic import load_topics
+
+
+def crawl_metalake(mcp: FastMCP, session: httpx.Client) -> None:
+    """Walk the catalogs, schemas, tables and models of the Metalake in bulk."""
+
+    @mcp.tool(
+        name="crawl_metalake",
+        description=(
+            "Walk the catalogs, schemas, tables, models, filesets and topics of the Metalake in one call, "
+            "writing them to a local JSON Lines file or returning them in pages."
+        ),
+        tags={
+            CATALOG_TAG,
+            SCHEMA_TAG,
+            TABLE_TAG,
+            MODEL_TAG,
+            FILESET_TAG,
+            TOPIC_TAG,
+            LIST_OPERATION_TAG,
+            BULK_OPERATION_TAG,
+        },
+        annotations={
+            "readOnlyHint": False,
+            "openWorldHint": True,
+            "destructiveHint": False,
+            "idempotentHint": True,
+        },
+    )
+    async def _crawl_metalake(
+        ctx: Context,
+        catalog_names: Optional[list[str]] = None,
+        include_table_details: bool = False,
+        output_path: Optional[str] = None,
+        page_size: int = 500,
+        page_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Walk the catalogs, schemas, tables, models, filesets and topics of the Metalake in one call. Listings are
+        fetched concurrently and stored in the server caches, so later tool calls on the crawled
+        objects are served without requests to Gravitino.
+
+        Parameters
+        ----------
+        ctx : Context
+            MCP context, used to report progress.
+        catalog_names : Optional[list[str]]
+            Names of the catalogs to crawl, all catalogs if not set.
+        include_table_details : bool
+            Whether to load every table to include its comment and columns.
+        output_path : Optional[str]
+            File to write the crawled objects to, one JSON object per line, relative to the export
+            directory of the server (GRAVITINO_EXPORT_DIR). Files cannot be written if it is not set.
+            If not set, the objects are returned in pages.
+        page_size : int
+            Max number of objects returned per page.
+        page_token : Optional[str]
+            Token of the page to return, as returned by a previous call in "nextPageToken". When set,
+            no new crawl is started and the other parameters except page_size are ignored. The pages of
+            a crawl stay available for 10 minutes, and only for the 16 most recent crawls; the token
+            of an expired crawl returns an error, and a new crawl has to be started.
+
+        Returns
+        -------
+        dict[str, Any]
+            If an error occurs, returns {"result": "error", "message": "error message"}.
+            if successful, returns a dictionary with the following keys:
+            - result: "success"
+            - counts: Number of crawled objects per type (catalog, schema, table, model, fileset, topic)
+            - errors: Containers which could not be listed, with "fullyQualifiedName" and "message"
+            - elapsedSeconds: Duration of the crawl
+            - outputPath: The absolute path of the file the objects were written to, only present if
+              output_path is set
+            - items: The objects of the page, only present if output_path is not set. Every object has
+              a "type", "name" and "fullyQualifiedName", catalogs also "catalogType", "provider" and
+              "comment", tables with details also "comment" and "columns".
+            - nextPageToken: Token of the next page, only present if there are more objects
+        """
+        if page_token:
+            return results_page("crawls", page_token, page_size, "The crawl has expired, start a new crawl")
+
+        report = progress_reporter(ctx)
+        if output_path:
+            try:
+                path = _export_path(output_path)
+            except ValueError as err:
+                return {"result": "error", "message": str(err)}
+            try:
+                with path.open("w", encoding="utf-8") as output:
+                    summary = await anyio.to_thread.run_sync(
+                        lambda: _crawl(
+                            session,
+                            catalog_names,
+                            include_table_details,
+                            lambda record: output.write(json_backend.dumps(record, indent=False) + "\n"),
+                            report,
+                        )
+                    )
+            except OSError as err:
+                return {"result": "error", "message": str(err)}
+            return {**summary, "outputPath": str(path)}
+
+        items: list[dict[str, Any]] = []
+        summary = await anyio.to_thread.run_sync(
+            lambda: _crawl(session, catalog_names, include_table_details, items.append, report)
+        )
+        summary["items"] = items
+        return first_results_page("crawls", summary, page_size)
+
+
+def _export_path(output_path: str) -> Path:
+    """
+    Resolve an output file in the export directory of the settings.
+
+    Parameters
+    ----------
+    output_path : str
+        Path of the file, relative to the export directory.
+
+    Returns
+    -------
+    Path
+        The absolute path of the file, with symbolic links resolved.
+
+    Raises
+    ------
+    ValueError
+        If no export directory is set, or if the path is absolute or leads outside of it, including
+        through ".." or a symbolic link.
+    """
+    export_dir = get_settings().export_dir
+    if not export_dir:
+        raise ValueError("Writing files is disabled, set GRAVITINO_EXPORT_DIR to allow it")
+    relative = Path(output_path)
+    if relative.is_absolute() or ".." in relative.parts:
+        raise ValueError("output_path must be a relative path within the export directory")
+    base = Path(export_dir).resolve()
+    path = (base / relative).resolve()
+    if not path.is_relative_to(base) or path == base:
+        raise ValueError("output_path must be a relative path within the export directory")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _crawl(
+    session: httpx.Client,
+    catalog_names: Optional[list[str]],
+    include_table_details: bool,
+    emit: Callable[[dict[str, Any]], Any],
+    report: Callable[[int, int], None],
+) -> dict[str, Any]:
+    """Walk the hierarchy level by level, listing the containers of each level concurrently."""
+    started = time.monotonic()
+    counts = {"catalog": 0, "schema": 0, "table": 0, "model": 0, "fileset": 0, "topic": 0}
+    errors: list[dict[str, str]] = []
+    requests = {"done": 0, "total": 1}
+
+    def _emit(record_type: str, record: dict[str, Any]) -> None:
+        counts[record_type] += 1
+        emit({"type": record_type, **record})
+
+    def _done() -> None:
+        requests["done"] += 1
+        report(requests["done"], requests["total"])
+
+    selected = set(catalog_names or [])
+    catalogs = [catalog for catalog in load_catalogs(session) if not selected or catalog.name in selected]
+    _done()
+    for catalog in catalogs:
+        _emit(
+            "catalog",
+            {
+                "name": catalog.name,
+                "fullyQualifiedName": join_fqn(metalake_name, catalog.name),
+                "catalogType": catalog.type,
+                "provider": catalog.provider,
+                "comment": catalog.comment,
+            },
+        )
+
+    requests["total"] += len(catalogs)
+    schemas: list[tuple[Catalog, Schema]] = []
+    for catalog, result, error in bounded_map(lambda catalog: load_schemas(session, catalog.name), catalogs):
+        _done()
+        if error is not None:
+            errors.append({"fullyQualifiedName": join_fqn(metalake_name, catalog.name), "message": str(error)})
+            continue
+        for schema in result:
+            schemas.append((catalog, schema))
+            _emit("schema", {"name": schema.name, "fullyQualifiedName": schema.fully_qualified_name})
+
+    def _list_children(item: tuple[Catalog, Schema]) -> tuple[str, tuple[NameIdentifier, ...]]:
+        catalog, schema = item
+        if catalog.type == "relational":
+            return "table", load_tables(session, catalog.name, schema.name)
+        if catalog.type == "model":
+            return "model", load_models(session, catalog.name, schema.name)
+        if catalog.type == "fileset":
+            return "fileset", load_filesets(session, catalog.name, schema.name)
+        if catalog.type == "messaging":
+            return "topic", load_topics(session, catalog.name, schema.name)
+        return "", ()
+
+    requests["total"] += len(schemas)
+    tables: list[NameIdentifier] = []
+    for (_, schema), result, error in bounded_map(_list_children, schemas):
+        _done()
+        if error is not None:
+            errors.append({"fullyQualifiedName": schema.fully_qualified_name, "message": str(error)})
+            continue
+        record_type, identifiers = result
+        for ident in identifiers:
+            if record_type == "table" and include_table_details:
+                tables.append(ident)
+            elif record_type:
+                _emit(record_type, {"name": ident.name, "fullyQualifiedName": ident.fully_qualified_name})
+
+    requests["total"] += len(tables)
+    for ident, table, error in bounded_map(lambda ident: load_table(session, ident.fully_qualified_name), tables):
+        _done()
+        if error is not None:
+            errors.append({"fullyQualifiedName": ident.fully_qualified_name, "message": str(error)})
+            continue
+        _emit(
+            "table",
+            {
+                "name": table.name,
+                "fullyQualifiedName": ident.fully_qualified_name,
+                "comment": table.comment,
+                "columns": [column.to_dict() for column in table.columns],
+            },
+        )
+
+    return {
+        "result": "success",
+        "counts": counts,
+        "errors": errors,
+        "elapsedSeconds": round(time.monotonic() - started, 3),
+    }
@@ -0,0 +1,336 @@
+# Copyright 2024 Datastrato Pvt Ltd.
+# This software is licensed under the Apache License version 2.
+import time
+from dataclasses import asdict
+from typing import Any, Callable, Optional
+
+import anyio
+import httpx
+from fastmcp import Context, FastMCP
+
+from mcp_server_gravitino.server.concurrency import bounded_map
+from mcp_server_gravitino.server.entities import Column, Table
+from mcp_server_gravitino.server.snapshots import content_hash
+from mcp_server_gravitino.server.tools import metalake_name
+from mcp_server_gravitino.server.tools.common_tools import (
+    BULK_OPERATION_TAG,
+    SCHEMA_TAG,
+    TABLE_TAG,
+    first_results_page,
+    join_fqn,
+    progress_reporter,
+    resolve_fqn,
+    results_page,
+)
+from mcp_server_gravitino.server.tools.schema import load_schemas
+from mcp_server_gravitino.server.tools.table import load_table, load_tables
+
+# column attributes compared, with their names in the tool results
+_COLUMN_FIELDS = {
+    "type": "type",
+    "comment": "comment",
+    "nullable": "nullable",
+    "auto_increment": "autoIncrement",
+}
+
+
+def diff_tables(mcp: FastMCP, session: httpx.Client) -> None:
+    """Compare the columns of two tables."""
+
+    @mcp.tool(
+        name="diff_tables",
+        description=(
+            "Compare the columns of two tables, e.g. the same table in two environments, and list the "
+            "columns added, removed or changed."
+        ),
+        tags={
+            TABLE_TAG,
+        },
+        annotations={
+            "readOnlyHint": True,
+            "openWorldHint": True,
+        },
+    )
+    def _diff_tables(source_fully_qualified_name: str, target_fully_qualified_name: str) -> dict[str, Any]:
+        """
+        Compare the columns of two tables. Both tables are loaded concurrently, through the table cache,
+        and only the differences are returned.
+
+        Parameters
+        ----------
+        source_fully_qualified_name : str
+            Fully qualified name of the table to compare from
+        target_fully_qualified_name : str
+            Fully qualified name of the table to compare to
+
+        Returns
+        -------
+        dict[str, Any]
+            If an error occurs, returns {"result": "error", "message": "error message"}.
+            if successful, returns a dictionary with the following keys:
+            - result: "success"
+            - identical: Whether the comments and columns of both tables are the same
+            - comment: The comment of both tables as {"source", "target"}, only present if it differs
+            - added: The columns only in the target table, as returned by get_table_columns_by_fqn
+            - removed: The columns only in the source table, as returned by get_table_columns_by_fqn
+            - changed: The columns in both tables which differ, each with the "name" of the column and
+              the differing attributes (type, comment, nullable, autoIncrement) as {"source", "target"}
+        """
+        names = [source_fully_qualified_name, target_fully_qualified_name]
+        tables: dict[str, Table] = {}
+        for name, table, error in bounded_map(lambda name: load_table(session, name), names):
+            if error is not None:
+                return {"result": "error", "message": f"{name}: {error}"}
+            tables[name] = table
+
+        return {"result": "success", **diff_table_definitions(tables[names[0]], tables[names[1]])}
+
+
+def diff_namespaces(mcp: FastMCP, session: httpx.Client) -> None:
+    """Compare the schemas and tables of two catalogs or two schemas."""
+
+    @mcp.tool(
+        name="diff_namespaces",
+        description=(
+            "Compare two catalogs or two schemas, e.g. across environments, and list the schemas and tables "
+            "added, removed or changed, returned in pages."
+        ),
+        tags={
+            SCHEMA_TAG,
+            TABLE_TAG,
+            BULK_OPERATION_TAG,
+        },
+        annotations={
+            "readOnlyHint": True,
+            "openWorldHint": True,
+        },
+    )
+    async def _diff_namespaces(
+        ctx: Context,
+        source_namespace: str,
+        target_namespace: str,
+        page_size: int = 100,
+        page_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Compare two catalogs or two schemas. Both sides are listed and the tables in both are loaded
+        concurrently, through the table cache. Tables whose definitions hash the same are counted as
+        identical, the others are compared column by column.
+
+        Parameters
+        ----------
+        ctx : Context
+            MCP context, used to report progress.
+        source_namespace : str
+            The catalog ('metalake.catalog') or schema ('metalake.catalog.schema') to compare from
+        target_namespace : str
+            The catalog or schema to compare to, at the same level as source_namespace
+        page_size : int
+            Max number of differences returned per page.
+        page_token : Optional[str]
+            Token of the page to return, as returned by a previous call in "nextPageToken". When set,
+            the namespaces are not compared again and the other parameters except page_size are ignored.
+            The pages of a diff stay available for 10 minutes, and only for the 16 most recent diffs; the
+            token of an expired diff returns an error, and the namespaces have to be compared again.
+
+        Returns
+        -------
+        dict[str, Any]
+            If an error occurs, returns {"result": "error", "message": "error message"}.
+            if successful, returns a dictionary with the following keys:
+            - result: "success"
+            - counts: Number of "added", "removed" and "changed" schemas and tables, and of "identical" tables
+            - errors: Containers and tables which could not be loaded, with "fullyQualifiedName" and "message"
+            - elapsedSeconds: Duration of the comparison
+            - items: The differences of the page, sorted by name. Every difference has a "type" (schema or
+              table), a "name" relative to the namespaces (e.g. "schema.table" when comparing catalogs) and
+              a "status" (added, removed or changed). Changed tables also have a "diff", as returned by
+              diff_tables.
+            - nextPageToken: Token of the next page, only present if there are more differences
+        """
+        if page_token:
+            return results_page("diffs", page_token, page_size, "The diff has expired, compare the namespaces again")
+
+        source = _namespace_path(source_namespace)
+        target = _namespace_path(target_namespace)
+        if source is None or target is None or len(source) != len(target):
+            return {
+                "result": "error",
+                "message": "source_namespace and target_namespace must both refer to a catalog or to a schema",
+            }
+
+        report = progress_reporter(ctx)
+        try:
+            summary = await anyio.to_thread.run_sync(lambda: _diff(session, source, target, report))
+        except httpx.HTTPError as err:
+            return {"result": "error", "message": str(err)}
+        return first_results_page("diffs", summary, page_size)
+
+
+def diff_table_definitions(source: Table, target: Table) -> dict[str, Any]:
+    """
+    Compare two table definitions.
+
+    Parameters
+    ----------
+    source : Table
+        The table to compare from
+    target : Table
+        The table to compare to
+
+    Returns
+    -------
+    dict[str, Any]
+        The differences, with the keys "identical", "comment" (only present if it differs), "added",
+        "removed" and "changed", as returned by the diff_tables tool.
+    """
+    # compare a hash per column first, so only the columns which differ are compared attribute by attribute
+    source_columns = {column.name: column for column in source.columns}
+    target_columns = {column.name: column for column in target.columns}
+    source_hashes = {name: content_hash(column) for name, column in source_columns.items()}
+    target_hashes = {name: content_hash(column) for name, column in target_columns.items()}
+
+    added = [column.to_dict() for name, column in target_columns.items() if name not in source_columns]
+    removed = [column.to_dict() for name, column in source_columns.items() if name not in target_columns]
+    changed = [
+        _diff_columns(source_columns[name], target_columns[name])
+        for name, digest in source_hashes.items()
+        if name in target_hashes and target_hashes[name] != digest
+    ]
+
+    result: dict[str, Any] = {"identical": not (added or removed or changed) and source.comment == target.comment}
+    if source.comment != target.comment:
+        result["comment"] = {"source": source.comment, "target": target.comment}
+    result.update(added=added, removed=removed, changed=changed)
+    return result
+
+
+def _diff_columns(source: Column, target: Column) -> dict[str, Any]:
+    differences: dict[str, Any] = {"name": source.name}
+    for field, key in _COLUMN_FIELDS.items():
+        source_value, target_value = getattr(source, field), getattr(target, field)
+        if source_value != target_value:
+            differences[key] = {"source": source_value, "target": target_value}
+    return differences
+
+
+def _namespace_path(namespace: str) -> Optional[tuple[str, ...]]:
+    """The (catalog,) or (catalog, schema) names of a namespace starting with the Metalake name."""
+    try:
+        fqn = resolve_fqn(namespace)
+    except ValueError:
+        return None
+    return fqn.names if fqn.type in ("catalog", "schema") else None
+
+
+def _diff(
+    session: httpx.Client,
+    source: tuple[str, ...],
+    target: tuple[str, ...],
+    report: Callable[[int, int], None],
+) -> dict[str, Any]:
+    """Compare two namespaces level by level, listing and loading each level concurrently."""
+    started = time.monotonic()
+    counts = {"added": 0, "removed": 0, "changed": 0, "identical": 0}
+    items: list[dict[str, Any]] = []
+    errors: list[dict[str, str]] = []
+    requests = {"done": 0, "total": 0}
+
+    def _emit(item_type: str, name: str, status: str, **extra: Any) -> None:
+        counts[status] += 1
+        items.append({"type": item_type, "name": name, "status": status, **extra})
+
+    def _run(fn: Callable[[tuple[str, ...]], Any], paths: list[tuple[str, ...]]) -> dict[tuple[str, ...], Any]:
+        requests["total"] += len(paths)
+        results = {}
+        for path, result, error in bounded_map(fn, paths):
+            requests["done"] += 1
+            report(requests["done"], requests["total"])
+            if error is not None:
+                errors.append({"fullyQualifiedName": join_fqn(metalake_name, *path), "message": str(error)})
+            else:
+                results[path] = result
+        return results
+
+    def _compare_names(item_type: str, parent: str, source_names: set, target_names: set) -> list[str]:
+        for name in sorted(target_names - source_names):
+            _emit(item_type, _relative_name(parent, name), "added")
+        for name in sorted(source_names - target_names):
+            _emit(item_type, _relative_name(parent, name), "removed")
+        return sorted(source_names & target_names)
+
+    # the schemas to compare, as names relative to the namespaces ("" when comparing two schemas)
+    if len(source) == 1:
+        listed = _run(lambda path: load_schemas(session, path[0]), [source, target])
+        if source not in listed or target not in listed:
+            raise httpx.HTTPError(errors[0]["message"])
+        schema_names = _compare_names(
+            "schema",
+            "",
+            {schema.name for schema in listed[source]},
+            {schema.name for schema in listed[target]},
+        )
+    else:
+        schema_names = [""]
+
+    def _schema_path(side: tuple[str, ...], schema_name: str) -> tuple[str, ...]:
+        return (*side, schema_name) if schema_name else side
+
+    listed = _run(
+        lambda path: load_tables(session, path[0], path[1]),
+        [_schema_path(side, name) for name in schema_names for side in (source, target)],
+    )
+    table_paths: list[tuple[str, str]] = []
+    for schema_name in schema_names:
+        source_tables, target_tables = (
+            listed.get(_schema_path(source, schema_name)),
+            listed.get(_schema_path(target, schema_name)),
+        )
+        if source_tables is None or target_tables is None:
+            continue
+        for table_name in _compare_names(
+            "table",
+            schema_name,
+            {table.name for table in source_tables},
+            {table.name for table in target_tables},
+        ):
+            table_paths.append((schema_name, table_name))
+
+    loaded = _run(
+        lambda path: load_table(session, join_fqn(metalake_name, *path)),
+        [
+            (*_schema_path(side, schema_name), table_name)
+            for schema_name, table_name in table_paths
+            for side in (source, target)
+        ],
+    )
+    for schema_name, table_name in table_paths:
+        source_table = loaded.get((*_schema_path(source, schema_name), table_name))
+        target_table = loaded.get((*_schema_path(target, schema_name), table_name))
+        if source_table is None or target_table is None:
+            continue
+        name = _relative_name(schema_name, table_name)
+        # tables with the same fingerprint are not compared further
+        if _fingerprint(source_table) == _fingerprint(target_table) and (source_table.comment == target_table.comment):
+            counts["identical"] += 1
+        else:
+            _emit("table", name, "changed", diff=diff_table_definitions(source_table, target_table))
+
+    items.sort(key=lambda item: item["name"])
+    return {
+        "result": "success",
+        "counts": counts,
+        "errors": errors,
+        "elapsedSeconds": round(time.monotonic() - started, 3),
+        "items": items,
+    }
+
+
+def _fingerprint(table: Table) -> str:
+    # hashed as plain values, as the column tuples would be hashed by their repr
+    return content_hash([asdict(column) for column in table.columns])
+
+
+def _relative_name(schema_name: str, name: str) -> str:
+    # the names of the items are relative to the namespaces compared
+    return join_fqn(schema_name, name) if schema_name else join_fqn(name)
@@ -0,0 +1,274 @@
+# Copyright 2024 Datastrato Pvt Ltd.
+# This software is licensed under the Apache License version 2.
+
+# Fileset is a collection of files and directories, managed or external, in a fileset catalog.
+from typing import Any, Optional
+
+import httpx
+from fastmcp import FastMCP
+
+from mcp_server_gravitino.server.cache import get_cache
+from mcp_server_gravitino.server.concurrency import bounded_map
+from mcp_server_gravitino.server.endpoints import endpoint_path
+from mcp_server_gravitino.server.entities import Fileset, NameIdentifier
+from mcp_server_gravitino.server.json_stream import Spec, fetch_json
+from mcp_server_gravitino.server.tools import metalake_name as global_metalake_name
+from mcp_server_gravitino.server.tools.common_tools import (
+    BULK_OPERATION_TAG,
+    FILESET_TAG,
+    GET_OPERATION_TAG,
+    IDENTIFIERS_SPEC,
+    LIST_OPERATION_TAG,
+    join_fqn,
+    paginate,
+    resolve_fqn,
+)
+
+_FILESET_SPEC: Spec = {
+    "fileset": {
+        "name": True,
+        "type": True,
+        "storageLocation": True,
+        "comment": True,
+        "properties": True,
+    },
+}
+
+
+def get_list_of_filesets(mcp: FastMCP, session: httpx.Client) -> None:
+    """Get a list of filesets, filtered by catalog and schema it belongs to."""
+
+    # https://gravitino.apache.org/docs/0.8.0-incubating/api/rest/list-filesets
+    @mcp.tool(
+        name="get_list_of_filesets",
+        description="Get a list of filesets, filtered by catalog and schema it belongs to.",
+        tags={
+            FILESET_TAG,
+            LIST_OPERATION_TAG,
+        },
+        annotations={
+            "readOnlyHint": True,
+            "openWorldHint": True,
+        },
+    )
+    def _get_list_of_filesets(
+        catalog_name: str,
+        schema_name: str,
+    ) -> list[dict[str, Any]]:
+        """
+        Get a list of filesets, filtered by catalog and schema it belongs to.
+
+        Parameters
+        ----------
+        catalog_name : str
+            Name of the catalog
+        schema_name : str
+            Name of the schema
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            Returns a list of filesets, it contains the following keys:
+            - name: Name of the fileset
+            - namespace: Namespace of the fileset
+            - fullyQualifiedName: Fully qualified name of the fileset
+        """
+        return [fileset.to_dict() for fileset in load_filesets(session, catalog_name, schema_name)]
+
+
+def get_fileset_by_fqn(mcp: FastMCP, session: httpx.Client) -> None:
+    """Get a fileset by fully qualified fileset name."""
+
+    # https://gravitino.apache.org/docs/0.8.0-incubating/api/rest/load-fileset
+    @mcp.tool(
+        name="get_fileset_by_fqn",
+        description="Get a fileset and its storage location by fully qualified fileset name.",
+        tags={
+            FILESET_TAG,
+            GET_OPERATION_TAG,
+        },
+        annotations={
+            "readOnlyHint": True,
+            "openWorldHint": True,
+        },
+    )
+    def _get_fileset_by_fqn(fully_qualified_name: str) -> dict[str, Any]:
+        """
+        Get a fileset by fully qualified fileset name.
+
+        Parameters
+        ----------
+        fully_qualified_name : str
+            Fully qualified name of the fileset, of the form 'catalog.schema.fileset'
+            or 'metalake.catalog.schema.fileset'.
+
+        Returns
+        -------
+        dict[str, Any]
+            Returns a dictionary containing the following keys:
+            - name: Name of the fileset
+            - fullyQualifiedName: Fully qualified name of the fileset
+            - type: Type of the fileset, "managed" or "external"
+            - storageLocation: Storage location of the fileset
+            - comment: Comment of the fileset
+            - properties: Properties of the fileset
+        """
+        fileset = load_fileset(session, fully_qualified_name)
+        return {**fileset.to_dict(), "fullyQualifiedName": fully_qualified_name}
+
+
+def get_filesets_in_schema(mcp: FastMCP, session: httpx.Client) -> None:
+    """Get the details of many filesets of a schema."""
+
+    @mcp.tool(
+        name="get_filesets_in_schema",
+        description=(
+            "Get the type, storage location, comment and properties of many filesets of a schema in one call, "
+            "returned in pages."
+        ),
+        tags={
+            FILESET_TAG,
+            GET_OPERATION_TAG,
+            BULK_OPERATION_TAG,
+        },
+        annotations={
+            "readOnlyHint": True,
+            "openWorldHint": True,
+        },
+    )
+    def _get_filesets_in_schema(
+        catalog_name: str,
+        schema_name: str,
+        fileset_names: Optional[list[str]] = None,
+        page_size: int = 100,
+        page_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Get the details of many filesets of a schema. Only the filesets of the requested page are
+        loaded, concurrently, and they are cached like the filesets loaded by get_fileset_by_fqn.
+
+        Parameters
+        ----------
+        catalog_name : str
+            Name of the catalog
+        schema_name : str
+            Name of the schema
+        fileset_names : Optional[list[str]]
+            Names of the filesets, every fileset of the schema if not set.
+        page_size : int
+            Max number of filesets returned per page.
+        page_token : Optional[str]
+            Token of the page to return, as returned by a previous call in "nextPageToken".
+
+        Returns
+        -------
+        dict[str, Any]
+            If an error occurs, returns {"result": "error", "message": "error message"}.
+            if successful, returns a dictionary with the following keys:
+            - result: "success"
+            - filesets: The filesets of the page, with the keys returned by get_fileset_by_fqn
+            - errors: Filesets which could not be loaded, with "fullyQualifiedName" and "message"
+            - nextPageToken: Token of the next page, only present if there are more filesets
+        """
+        if page_token is not None and not page_token.isdigit():
+            return {"result": "error", "message": "page_token is invalid"}
+
+        try:
+            if fileset_names is None:
+                fileset_names = [f"{ident.name}" for ident in load_filesets(session, catalog_name, schema_name)]
+        except httpx.HTTPError as err:
+            return {"result": "error", "message": str(err)}
+
+        names, next_offset = paginate(fileset_names, page_size, int(page_token or 0))
+        fully_qualified_names = [join_fqn(global_metalake_name, catalog_name, schema_name, name) for name in names]
+        loaded: dict[str, Fileset] = {}
+        failed: dict[str, str] = {}
+        for fully_qualified_name, fileset, error in bounded_map(
+            lambda name: load_fileset(session, name),
+            fully_qualified_names,
+        ):
+            if error is not None:
+                failed[fully_qualified_name] = str(error)
+            else:
+                loaded[fully_qualified_name] = fileset
+
+        result: dict[str, Any] = {
+            "result": "success",
+            "filesets": [
+                {**loaded[name].to_dict(), "fullyQualifiedName": name}
+                for name in fully_qualified_names
+                if name in loaded
+            ],
+            "errors": [
+                {"fullyQualifiedName": name, "message": failed[name]}
+                for name in fully_qualified_names
+                if name in failed
+            ],
+        }
+        if next_offset is not None:
+            result["nextPageToken"] = str(next_offset)
+        return result
+
+
+def load_filesets(
+    session: httpx.Client,
+    catalog_name: str,
+    schema_name: str,
+    refresh: bool = False,
+) -> tuple[NameIdentifier, ...]:
+    """
+    Load the fileset identifiers of a schema, through the filesets cache.
+
+    Parameters
+    ----------
+    session : httpx.Client
+        HTTP client
+    catalog_name : str
+        Name of the catalog
+    schema_name : str
+        Name of the schema
+    refresh : bool
+        Whether to bypass the cached identifiers and load them from Gravitino
+
+    Returns
+    -------
+    tuple[NameIdentifier, ...]
+        The identifiers of the filesets in the schema.
+    """
+    url = endpoint_path("filesets", global_metalake_name, catalog_name, schema_name)
+
+    def _load() -> tuple[NameIdentifier, ...]:
+        response_json = fetch_json(session, url, IDENTIFIERS_SPEC)
+        return tuple(NameIdentifier.from_dict(fileset) for fileset in response_json.get("identifiers") or [])
+
+    return get_cache("filesets").get_or_load(url, _load, refresh)
+
+
+def load_fileset(session: httpx.Client, fully_qualified_name: str, refresh: bool = False) -> Fileset:
+    """
+    Load a fileset by fully qualified fileset name, through the fileset details cache.
+
+    Parameters
+    ----------
+    session : httpx.Client
+        HTTP client
+    fully_qualified_name : str
+        Fully qualified name of the fileset, with or without the Metalake name
+    refresh : bool
+        Whether to bypass the cached fileset and load it from Gravitino
+
+    Returns
+    -------
+    Fileset
+        The fileset.
+    """
+    url = _fileset_path(fully_qualified_name)
+    return get_cache("fileset_details").get_or_load(
+        url,
+        lambda: Fileset.from_dict(fetch_json(session, url, _FILESET_SPEC).get("fileset")),
+        refresh,
+    )
+
+
+def _fileset_path(fully_qualified_name: str) -> str:
+    return resolve_fqn(fully_qualified_name, "fileset").path
@@ -1,19 +1,48 @@
 # Copyright 2024 Datastrato Pvt Ltd.
 # This software is licensed under the Apache License version 2.
 
-from typing import Any
+from typing import Any, Literal, Optional
 
 import httpx
 from fastmcp import FastMCP
 
+from mcp_server_gravitino.server.cache import get_cache, get_immutable_cache
+from mcp_server_gravitino.server.concurrency import bounded_map
+from mcp_server_gravitino.server.endpoints import endpoint_path
+from mcp_server_gravitino.server.entities import Model, ModelVersion
+from mcp_server_gravitino.server.json_stream import Spec, fetch_json
 from mcp_server_gravitino.server.tools import metalake_name as global_metalake_name
 from mcp_server_gravitino.server.tools.common_tools import (
+    IDENTIFIERS_SPEC,
     LIST_OPERATION_TAG,
     MODEL_TAG,
     MODEL_VERSION_TAG,
-    parse_four_level_fqn,
+    resolve_fqn,
 )
 
+_MODEL_VERSION_SPEC: Spec = {
+    "modelVersion": {
+        "version": True,
+        "comment": True,
+        "aliases": True,
+        "uri": True,
+        "audit": {
+            "creator": True,
+        },
+    },
+}
+
+# the version numbers, and with details (Gravitino 0.9 and later) the aliases of every version
+_MODEL_VERSION_NUMBERS_SPEC: Spec = {
+    "versions": True,
+    "infos": [
+        {
+            "version": True,
+            "aliases": True,
+        }
+    ],
+}
+
 
 def get_list_of_models(mcp: FastMCP, session: httpx.Client) -> None:
     """List all models in the given catalog and schema."""
@@ -52,21 +81,7 @@ def get_list_of_models(mcp: FastMCP, session: httpx.Client) -> None:
             - namespace:  Dot-separated namespace string, e.g. "catalog.schema".
             - fullyQualifiedName: Fully qualified name of the model
         """
-        response = session.get(
-            f"/api/metalakes/{global_metalake_name}/catalogs/{catalog_name}/schemas/{schema_name}/models"
-        )
-        response.raise_for_status()
-        response_json = response.json()
-
-        models = response_json.get("identifiers", [])
-        return [
-            {
-                "name": model.get("name"),
-                "namespace": ".".join(model.get("namespace")),
-                "fullyQualifiedName": ".".join(model.get("namespace")) + "." + model.get("name"),
-            }
-            for model in models
-        ]
+        return [model.to_dict() for model in load_models(session, catalog_name, schema_name)]
 
 
 def get_list_of_model_versions_by_fqn(mcp: FastMCP, session: httpx.Client) -> None:
@@ -84,15 +99,33 @@ def get_list_of_model_versions_by_fqn(mcp: FastMCP, session: httpx.Client) -> No
             "openWorldHint": True,
         },
     )
-    def _list_model_versions_by_fqn(fqn: str) -> list[dict[str, Any]]:
+    def _list_model_versions_by_fqn(
+        fqn: str,
+        alias: Optional[str] = None,
+        latest: Optional[int] = None,
+        min_version: Optional[int] = None,
+        max_version: Optional[int] = None,
+        order: Literal["asc", "desc"] = "asc",
+    ) -> list[dict[str, Any]]:
         """
-        List all versions of a model by its fully qualified name.
+        List the versions of a model by its fully qualified name. The versions are selected from the
+        list of version numbers first, so only the details of the returned versions are fetched.
 
         Parameters
         ----------
         fqn : str
             Fully qualified model name, of the form 'catalog.schema.model'
             or 'metalake.catalog.schema.model'.
+        alias : Optional[str]
+            Only return the version with this alias.
+        latest : Optional[int]
+            Only return the given number of versions with the highest version numbers.
+        min_version : Optional[int]
+            Only return versions from this version number on.
+        max_version : Optional[int]
+            Only return versions up to this version number.
+        order : Literal["asc", "desc"]
+            Sort the versions by ascending ("asc") or descending ("desc") version number.
 
         Returns
         -------
@@ -104,34 +137,217 @@ def get_list_of_model_versions_by_fqn(mcp: FastMCP, session: httpx.Client) -> No
             - uri: URI of the version
             - creator: Creator of the version
         """
-        metalake_name, catalog_name, schema_name, model_name = parse_four_level_fqn(fqn.split("."))
-        if not metalake_name:
-            metalake_name = global_metalake_name
-
-        response = session.get(
-            f"/api/metalakes/{metalake_name}/catalogs/{catalog_name}/schemas/{schema_name}/models/{model_name}/versions"
-        )
-        response.raise_for_status()
-        response_json = response.json()
-        versions = response_json.get("versions", [])
+        if alias:
+            version_objects = [load_model_version_by_alias(session, fqn, alias)]
+        else:
+            version_objects = []
+            numbers = sorted(load_model_version_numbers(session, fqn))
+            if min_version is not None:
+                numbers = [number for number in numbers if number >= min_version]
+            if max_version is not None:
+                numbers = [number for number in numbers if number <= max_version]
+            if latest is not None:
+                numbers = numbers[-latest:] if latest > 0 else []
+            if numbers:
+                version_objects = load_model_versions(session, fqn, numbers)
 
         version_objects = [
-            _get_model_version_by_fqn_and_version_response(session, fqn, version).get("modelVersion")
-            for version in versions
+            obj
+            for obj in version_objects
+            if (min_version is None or (obj.version or 0) >= min_version)
+            and (max_version is None or (obj.version or 0) <= max_version)
         ]
-
+        version_objects.sort(key=lambda obj: obj.version or 0, reverse=order == "desc")
         return [
             {
-                "version": obj.get("version"),
-                "comment": obj.get("comment"),
-                "aliases": ",".join(obj.get("aliases")),
-                "uri": obj.get("uri"),
-                "creator": obj.get("audit").get("creator"),
+                "version": obj.version,
+                "comment": obj.comment,
+                "aliases": ",".join(obj.aliases),
+                "uri": obj.uri,
+                "creator": obj.creator,
             }
             for obj in version_objects
         ]
 
 
+def load_models(
+    session: httpx.Client,
+    catalog_name: str,
+    schema_name: str,
+    refresh: bool = False,
+) -> tuple[Model, ...]:
+    """
+    Load the models of a schema, through the models cache.
+
+    Parameters
+    ----------
+    session : httpx.Client
+        HTTP client
+    catalog_name : str
+        Name of the catalog
+    schema_name : str
+        Name of the schema
+    refresh : bool
+        Whether to bypass the cached models and load them from Gravitino
+
+    Returns
+    -------
+    tuple[Model, ...]
+        The models in the schema.
+    """
+    url = endpoint_path("models", global_metalake_name, catalog_name, schema_name)
+
+    def _load() -> tuple[Model, ...]:
+        response_json = fetch_json(session, url, IDENTIFIERS_SPEC)
+        return tuple(Model.from_dict(model) for model in response_json.get("identifiers") or [])
+
+    return get_cache("models").get_or_load(url, _load, refresh)
+
+
+def load_model_version_numbers(
+    session: httpx.Client, fully_qualified_name: str, refresh: bool = False
+) -> tuple[int, ...]:
+    """
+    Load the version numbers of a model, through the model versions cache.
+
+    Parameters
+    ----------
+    session : httpx.Client
+        HTTP client
+    fully_qualified_name : str
+        Fully qualified name of the model, with or without the Metalake name
+    refresh : bool
+        Whether to bypass the cached version numbers and load them from Gravitino
+
+    Returns
+    -------
+    tuple[int, ...]
+        The version numbers of the model.
+    """
+    return tuple(_load_version_listing(session, fully_qualified_name, refresh))
+
+
+def _load_version_listing(
+    session: httpx.Client, fully_qualified_name: str, refresh: bool = False
+) -> dict[int, Optional[tuple[str, ...]]]:
+    """
+    Load the version numbers of a model with the aliases of each version, None if Gravitino does not list
+    them. The aliases listed are also stored in the model version aliases cache.
+    """
+    url = _model_endpoint("model_versions", fully_qualified_name)
+
+    def _load() -> dict[int, Optional[tuple[str, ...]]]:
+        response_json = fetch_json(session, url, _MODEL_VERSION_NUMBERS_SPEC)
+        if "infos" not in response_json:
+            return {int(version): None for version in response_json.get("versions") or []}
+        listing = {int(info["version"]): tuple(info.get("aliases") or ()) for info in response_json["infos"]}
+        aliases_cache = get_cache("model_version_aliases")
+        for version, aliases in listing.items():
+            aliases_cache.set(_model_endpoint("model_version", fully_qualified_name, str(version)), list(aliases))
+        return listing
+
+    return get_cache("model_versions").get_or_load(url, _load, refresh)
+
+
+def load_model_versions(
+    session: httpx.Client,
+    fully_qualified_name: str,
+    versions: list[int],
+    refresh: bool = False,
+) -> list[ModelVersion]:
+    """
+    Load versions of a model concurrently. The immutable part of a version is kept in the model versions
+    immutable cache, and its aliases, which can move between versions, in the model version aliases cache.
+    Aliases no longer cached are reloaded from the list of versions in one request, so only the versions
+    missing from the immutable cache are fetched.
+
+    Parameters
+    ----------
+    session : httpx.Client
+        HTTP client
+    fully_qualified_name : str
+        Fully qualified name of the model, with or without the Metalake name
+    versions : list[int]
+        The version numbers to load
+    refresh : bool
+        Whether to bypass the cached versions and load them from Gravitino
+
+    Returns
+    -------
+    list[ModelVersion]
+        The model versions, in the order of ``versions``.
+
+    Raises
+    ------
+    httpx.HTTPError
+        If a version could not be loaded.
+    """
+
+    urls = {version: _model_endpoint("model_version", fully_qualified_name, str(version)) for version in versions}
+    aliases_cache = get_cache("model_version_aliases")
+    aliases = {version: None if refresh else aliases_cache.get(url) for version, url in urls.items()}
+    if not refresh and any(version_aliases is None for version_aliases in aliases.values()):
+        listing = _load_version_listing(session, fully_qualified_name, refresh=True)
+        aliases = {
+            version: listing.get(version) if version_aliases is None else version_aliases
+            for version, version_aliases in aliases.items()
+        }
+
+    def _load(version: int) -> ModelVersion:
+        record = None if refresh else get_immutable_cache("model_versions").get(urls[version])
+        if record is not None and aliases[version] is not None:
+            return ModelVersion.from_dict({**record, "aliases": aliases[version]})
+        response_json = _get_model_version_by_fqn_and_version_response(session, fully_qualified_name, str(version))
+        return _store_model_version(fully_qualified_name, response_json.get("modelVersion"))
+
+    loaded: dict[int, ModelVersion] = {}
+    for version, result, error in bounded_map(_load, versions):
+        if error is not None:
+            raise error
+        loaded[version] = result
+    return [loaded[version] for version in versions]
+
+
+def load_model_version_by_alias(session: httpx.Client, fully_qualified_name: str, alias: str) -> ModelVersion:
+    """
+    Load the version of a model with an alias. Aliases can move between versions, so the lookup is not cached.
+
+    Parameters
+    ----------
+    session : httpx.Client
+        HTTP client
+    fully_qualified_name : str
+        Fully qualified name of the model, with or without the Metalake name
+    alias : str
+        The alias of the version
+
+    Returns
+    -------
+    ModelVersion
+        The model version.
+    """
+    url = _model_endpoint("model_alias", fully_qualified_name, alias)
+    response_json = fetch_json(session, url, _MODEL_VERSION_SPEC)
+    return _store_model_version(fully_qualified_name, response_json.get("modelVersion"))
+
+
+def _store_model_version(fully_qualified_name: str, data: Any) -> ModelVersion:
+    """Cache a model version as returned by Gravitino, keeping its aliases apart from the immutable part."""
+    version = ModelVersion.from_dict(data)
+    url = _model_endpoint("model_version", fully_qualified_name, str(version.version))
+    records = get_immutable_cache("model_versions")
+    if records.get(url) is None:
+        records.set(url, {key: value for key, value in (data or {}).items() if key != "aliases"})
+    get_cache("model_version_aliases").set(url, list(version.aliases))
+    return version
+
+
+def _model_endpoint(label: str, fully_qualified_name: str, *values: str) -> str:
+    """The path of a model endpoint, ``values`` are the fields of the endpoint after the model name."""
+    model = resolve_fqn(fully_qualified_name, "model")
+    return endpoint_path(label, model.metalake, *model.names, *values)
+
+
 def _get_model_version_by_fqn_and_version_response(
     session: httpx.Client,
     fully_qualified_name: str,
@@ -152,13 +368,4 @@ def _get_model_version_by_fqn_and_version_response(
     dict
         Response from Model API.
     """
-    model_names = fully_qualified_name.split(".")
-    metalake_name, catalog_name, schema_name, model_name = parse_four_level_fqn(model_names)
-    if not metalake_name:
-        metalake_name = global_metalake_name
-
-    response = session.get(
-        f"/api/metalakes/{metalake_name}/catalogs/{catalog_name}/schemas/{schema_name}/models/{model_name}/versions/{version}"
-    )
-    response.raise_for_status()
-    return response.json()
+    return fetch_json(session, _model_endpoint("model_version", fully_qualified_name, version), _MODEL_VERSION_SPEC)
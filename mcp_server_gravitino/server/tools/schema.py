@@ -7,8 +7,12 @@ from typing import Any
 import httpx
 from fastmcp import FastMCP
 
+from mcp_server_gravitino.server.cache import get_cache
+from mcp_server_gravitino.server.endpoints import endpoint_path
+from mcp_server_gravitino.server.entities import Schema
+from mcp_server_gravitino.server.json_stream import fetch_json
 from mcp_server_gravitino.server.tools import metalake_name
-from mcp_server_gravitino.server.tools.common_tools import LIST_OPERATION_TAG, SCHEMA_TAG
+from mcp_server_gravitino.server.tools.common_tools import IDENTIFIERS_SPEC, LIST_OPERATION_TAG, SCHEMA_TAG
 
 
 def get_list_of_schemas(mcp: FastMCP, session: httpx.Client) -> None:
@@ -27,7 +31,7 @@ def get_list_of_schemas(mcp: FastMCP, session: httpx.Client) -> None:
             "openWorldHint": True,
         },
     )
-    def _get_list_of_schemas(catalog_name: str) -> list[dict[str, Any]]:
+    def _get_list_of_schemas(catalog_name: str, refresh: bool = False) -> list[dict[str, Any]]:
         """
         Get a list of schemas, filtered by catalog it belongs to.
 
@@ -35,6 +39,8 @@ def get_list_of_schemas(mcp: FastMCP, session: httpx.Client) -> None:
         ----------
         catalog_name : str
             Name of the catalog to filter by.
+        refresh : bool
+            Whether to load the schemas from Gravitino instead of using the cache.
 
         Returns
         -------
@@ -43,15 +49,31 @@ def get_list_of_schemas(mcp: FastMCP, session: httpx.Client) -> None:
             - name: Name of the schema.
             - namespace: Namespace of the schema.
         """
-        response = session.get(f"/api/metalakes/{metalake_name}/catalogs/{catalog_name}/schemas")
-        response.raise_for_status()
-        response_json = response.json()
-
-        identifiers = response_json.get("identifiers", [])
-        return [
-            {
-                "name": ident.get("name"),
-                "namespace": ".".join(ident.get("namespace")),
-            }
-            for ident in identifiers
-        ]
+        return [schema.to_dict() for schema in load_schemas(session, catalog_name, refresh)]
+
+
+def load_schemas(session: httpx.Client, catalog_name: str, refresh: bool = False) -> tuple[Schema, ...]:
+    """
+    Load the schemas of a catalog, through the schemas cache.
+
+    Parameters
+    ----------
+    session : httpx.Client
+        HTTP client
+    catalog_name : str
+        Name of the catalog
+    refresh : bool
+        Whether to bypass the cached schemas and load them from Gravitino
+
+    Returns
+    -------
+    tuple[Schema, ...]
+        The schemas in the catalog.
+    """
+    url = endpoint_path("schemas", metalake_name, catalog_name)
+
+    def _load() -> tuple[Schema, ...]:
+        response_json = fetch_json(session, url, IDENTIFIERS_SPEC)
+        return tuple(Schema.from_dict(ident) for ident in response_json.get("identifiers") or [])
+
+    return get_cache("schemas").get_or_load(url, _load, refresh)
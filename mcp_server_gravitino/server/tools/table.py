@@ -2,13 +2,70 @@
 # This software is licensed under the Apache License version 2.
 
 # Table organizes data in rows and columns and is defined in a Database Schema.
-from typing import Any
+from functools import lru_cache
+from typing import Any, Literal, Optional
 
 import httpx
 from fastmcp import FastMCP
 
+from mcp_server_gravitino.server.access import record_table_access
+from mcp_server_gravitino.server.cache import get_cache
+from mcp_server_gravitino.server.endpoints import endpoint_path
+from mcp_server_gravitino.server.entities import Column, NameIdentifier, Table
+from mcp_server_gravitino.server.json_stream import Spec, fetch_json
 from mcp_server_gravitino.server.tools import metalake_name
-from mcp_server_gravitino.server.tools.common_tools import GET_OPERATION_TAG, LIST_OPERATION_TAG, TABLE_TAG
+from mcp_server_gravitino.server.tools.common_tools import (
+    DETAILS_TAG,
+    GET_OPERATION_TAG,
+    IDENTIFIERS_SPEC,
+    LIST_OPERATION_TAG,
+    TABLE_TAG,
+    paginate_within_budget,
+    resolve_fqn,
+)
+
+_TABLE_SPEC: Spec = {
+    "table": {
+        "name": True,
+        "comment": True,
+    },
+}
+_TABLE_COLUMNS_SPEC: Spec = {
+    "table": {
+        "name": True,
+        "comment": True,
+        "columns": [
+            {
+                "name": True,
+                "type": True,
+                "comment": True,
+                "nullable": True,
+                "autoIncrement": True,
+            }
+        ],
+    },
+}
+
+_TABLE_AUDIT_SPEC: Spec = {
+    "table": {
+        "audit": {
+            "createTime": True,
+            "lastModifiedTime": True,
+        },
+    },
+}
+
+# projections of the sections of a loaded table, decoded only when asked for
+_TABLE_SECTION_SPECS: dict[str, Spec] = {
+    "columns": _TABLE_COLUMNS_SPEC["table"]["columns"],
+    "partitioning": True,
+    "distribution": True,
+    "sortOrders": True,
+    "indexes": True,
+    "properties": True,
+}
+
+TableSection = Literal["columns", "partitioning", "distribution", "sortOrders", "indexes", "properties"]
 
 
 def get_list_of_tables(mcp: FastMCP, session: httpx.Client) -> None:
@@ -30,6 +87,7 @@ def get_list_of_tables(mcp: FastMCP, session: httpx.Client) -> None:
     def _get_list_of_tables(
         catalog_name: str,
         schema_name: str,
+        refresh: bool = False,
     ) -> list[dict[str, Any]]:
         """
         Get a list of tables, filtered by catalog and schema it belongs to.
@@ -40,6 +98,8 @@ def get_list_of_tables(mcp: FastMCP, session: httpx.Client) -> None:
             Name of the catalog
         schema_name : str
             Name of the schema
+        refresh : bool
+            Whether to load the tables from Gravitino instead of using the cache.
 
         Returns
         -------
@@ -49,19 +109,7 @@ def get_list_of_tables(mcp: FastMCP, session: httpx.Client) -> None:
             - namespace: Namespace of the table
             - fullyQualifiedName: Fully qualified name of the table
         """
-        response = session.get(f"/api/metalakes/{metalake_name}/catalogs/{catalog_name}/schemas/{schema_name}/tables")
-        response.raise_for_status()
-        response_json = response.json()
-
-        tables = response_json.get("identifiers", [])
-        return [
-            {
-                "name": table.get("name"),
-                "namespace": ".".join(table.get("namespace")),
-                "fullyQualifiedName": ".".join(table.get("namespace")) + "." + table.get("name"),
-            }
-            for table in tables
-        ]
+        return [table.to_dict() for table in load_tables(session, catalog_name, schema_name, refresh)]
 
 
 def get_table_by_fqn(mcp: FastMCP, session: httpx.Client) -> None:
@@ -80,7 +128,7 @@ def get_table_by_fqn(mcp: FastMCP, session: httpx.Client) -> None:
             "openWorldHint": True,
         },
     )
-    def _get_table_by_fqn(fully_qualified_name: str) -> dict[str, Any]:
+    def _get_table_by_fqn(fully_qualified_name: str, refresh: bool = False) -> dict[str, Any]:
         """
         Get a table by fully qualified table name.
 
@@ -88,6 +136,8 @@ def get_table_by_fqn(mcp: FastMCP, session: httpx.Client) -> None:
         ----------
         fully_qualified_name : str
             Fully qualified name of the table
+        refresh : bool
+            Whether to load the table from Gravitino instead of using the cache.
 
         Returns
         -------
@@ -97,12 +147,16 @@ def get_table_by_fqn(mcp: FastMCP, session: httpx.Client) -> None:
             - fullyQualifiedName: Fully qualified name of the table
             - comment: Comment of the table
         """
-        response = _get_table_by_fqn_response(session, fully_qualified_name)
+        record_table_access(fully_qualified_name)
+        # a cached full load is reused, otherwise only the name and comment are decoded
+        table = None if refresh else get_cache("table_details").get(_table_path(fully_qualified_name))
+        if table is None:
+            table = Table.from_dict(_get_table_by_fqn_response(session, fully_qualified_name, _TABLE_SPEC).get("table"))
 
         return {
-            "name": response.get("table").get("name"),
+            "name": table.name,
             "fullyQualifiedName": fully_qualified_name,
-            "comment": response.get("table").get("comment"),
+            "comment": table.comment,
         }
 
 
@@ -121,19 +175,36 @@ def get_table_columns_by_fqn(mcp: FastMCP, session: httpx.Client) -> None:
             "openWorldHint": True,
         },
     )
-    def _get_table_columns_by_fqn(fully_qualified_name: str) -> dict[str, Any]:
+    def _get_table_columns_by_fqn(
+        fully_qualified_name: str,
+        refresh: bool = False,
+        max_items: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        page_token: Optional[str] = None,
+    ) -> dict[str, Any]:
         """
-        Get a table columns by fully qualified table name.
+        Get a table columns by fully qualified table name. If any of max_items, max_bytes or page_token
+        is set, the columns are returned in pages: a page holds the columns, in table order, up to the
+        first one which would exceed the budget, and the columns after it are not encoded.
 
         Parameters
         ----------
         fully_qualified_name : str
             Fully qualified name of the table
+        refresh : bool
+            Whether to load the table from Gravitino instead of using the cache.
+        max_items : Optional[int]
+            Max number of columns returned.
+        max_bytes : Optional[int]
+            Max size of the returned columns as compact JSON, at least one column is returned.
+        page_token : Optional[str]
+            Token of the page to return, as returned by a previous call in "nextPageToken".
 
         Returns
         -------
         dict[str, Any]
-            Returns a dictionary containing the following keys:
+            If page_token is invalid, returns {"result": "error", "message": "error message"}.
+            Otherwise returns a dictionary containing the following keys:
             - name: Name of the table
             - fullyQualifiedName: Fully qualified name of the table
             - comment: Comment of the table
@@ -142,19 +213,262 @@ def get_table_columns_by_fqn(mcp: FastMCP, session: httpx.Client) -> None:
                 - type: Type of the column
                 - nullable: If the column is nullable or not
                 - autoIncrement: If the column is auto-incremented or not
+            - counts: Only if paged, the number of columns in the table ("total"), in the page
+              ("returned") and after it ("remaining")
+            - nextPageToken: Token of the next page, only present if there are more columns
         """
+        if page_token is not None and not page_token.isdigit():
+            return {"result": "error", "message": "page_token is invalid"}
+
+        record_table_access(fully_qualified_name)
+        table = load_table(session, fully_qualified_name, refresh)
+
+        result: dict[str, Any] = {
+            "name": table.name,
+            "fullyQualifiedName": fully_qualified_name,
+            "comment": table.comment,
+        }
+        if max_items is None and max_bytes is None and page_token is None:
+            result["columns"] = [column.to_dict() for column in table.columns]
+            return result
+
+        result["columns"], result["counts"], next_offset = paginate_within_budget(
+            table.columns, Column.to_dict, max_items, max_bytes, int(page_token or 0)
+        )
+        if next_offset is not None:
+            result["nextPageToken"] = str(next_offset)
+        return result
 
-        response = _get_table_by_fqn_response(session, fully_qualified_name)
 
+def get_table_details_by_fqn(mcp: FastMCP, session: httpx.Client) -> None:
+    """Get the columns, partitioning, distribution, sort orders, indexes and properties of a table."""
+
+    # https://gravitino.apache.org/docs/0.8.0-incubating/api/rest/load-table
+    @mcp.tool(
+        name="get_table_details_by_fqn",
+        description=(
+            "Get the columns, partitioning, distribution, sort orders, indexes and properties of a table "
+            "by fully qualified table name, optionally only some of them."
+        ),
+        tags={
+            TABLE_TAG,
+            GET_OPERATION_TAG,
+            DETAILS_TAG,
+        },
+        annotations={
+            "readOnlyHint": True,
+            "openWorldHint": True,
+        },
+    )
+    def _get_table_details_by_fqn(
+        fully_qualified_name: str,
+        sections: Optional[list[TableSection]] = None,
+        refresh: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Get the details of a table by fully qualified table name. Only the requested sections are
+        decoded and cached, and sections cached by a previous call, including the columns loaded by
+        get_table_columns_by_fqn, are not fetched again.
+
+        Parameters
+        ----------
+        fully_qualified_name : str
+            Fully qualified name of the table
+        sections : Optional[list[TableSection]]
+            The sections to return, all of them if not set:
+            - columns: The columns, as returned by get_table_columns_by_fqn
+            - partitioning: The partitioning of the table, e.g. by day of a timestamp column
+            - distribution: How the data is distributed among buckets
+            - sortOrders: How the data is sorted within a partition
+            - indexes: The primary key and unique indexes
+            - properties: The properties of the table
+        refresh : bool
+            Whether to load the sections from Gravitino instead of using the cache.
+
+        Returns
+        -------
+        dict[str, Any]
+            Returns a dictionary containing the following keys:
+            - name: Name of the table
+            - fullyQualifiedName: Fully qualified name of the table
+            - comment: Comment of the table
+            - one key per requested section, with the section as returned by Gravitino
+        """
+        record_table_access(fully_qualified_name)
+        details = load_table_sections(session, fully_qualified_name, sections or list(_TABLE_SECTION_SPECS), refresh)
         return {
-            "name": response.get("table").get("name"),
+            "name": details.pop("name"),
             "fullyQualifiedName": fully_qualified_name,
-            "comment": response.get("table").get("comment"),
-            "columns": response.get("table").get("columns"),
+            "comment": details.pop("comment"),
+            **details,
         }
 
 
-def _get_table_by_fqn_response(session: httpx.Client, fully_qualified_name: str) -> Any:
+def load_tables(
+    session: httpx.Client,
+    catalog_name: str,
+    schema_name: str,
+    refresh: bool = False,
+) -> tuple[NameIdentifier, ...]:
+    """
+    Load the table identifiers of a schema, through the tables cache.
+
+    Parameters
+    ----------
+    session : httpx.Client
+        HTTP client
+    catalog_name : str
+        Name of the catalog
+    schema_name : str
+        Name of the schema
+    refresh : bool
+        Whether to bypass the cached identifiers and load them from Gravitino
+
+    Returns
+    -------
+    tuple[NameIdentifier, ...]
+        The identifiers of the tables in the schema.
+    """
+    url = endpoint_path("tables", metalake_name, catalog_name, schema_name)
+
+    def _load() -> tuple[NameIdentifier, ...]:
+        response_json = fetch_json(session, url, IDENTIFIERS_SPEC)
+        return tuple(NameIdentifier.from_dict(table) for table in response_json.get("identifiers") or [])
+
+    return get_cache("tables").get_or_load(url, _load, refresh)
+
+
+def load_table(session: httpx.Client, fully_qualified_name: str, refresh: bool = False) -> Table:
+    """
+    Load a table with its columns by fully qualified table name, through the table details cache.
+
+    Parameters
+    ----------
+    session : httpx.Client
+        HTTP client
+    fully_qualified_name : str
+        Fully qualified name of the table
+    refresh : bool
+        Whether to bypass the cached table and load it from Gravitino
+
+    Returns
+    -------
+    Table
+        The table.
+    """
+    return get_cache("table_details").get_or_load(
+        _table_path(fully_qualified_name),
+        lambda: Table.from_dict(
+            _get_table_by_fqn_response(session, fully_qualified_name, _TABLE_COLUMNS_SPEC).get("table")
+        ),
+        refresh,
+    )
+
+
+def load_table_modified_time(session: httpx.Client, fully_qualified_name: str) -> Optional[str]:
+    """
+    Load the time a table was last modified, or created if it was never modified, decoding nothing else.
+
+    Parameters
+    ----------
+    session : httpx.Client
+        HTTP client
+    fully_qualified_name : str
+        Fully qualified name of the table
+
+    Returns
+    -------
+    Optional[str]
+        The time, as returned by Gravitino, or None if the table has no audit.
+    """
+    audit = (_get_table_by_fqn_response(session, fully_qualified_name, _TABLE_AUDIT_SPEC).get("table") or {}).get(
+        "audit"
+    ) or {}
+    return audit.get("lastModifiedTime") or audit.get("createTime")
+
+
+def load_table_sections(
+    session: httpx.Client,
+    fully_qualified_name: str,
+    sections: list[str],
+    refresh: bool = False,
+) -> dict[str, Any]:
+    """
+    Load sections of a table, through the table details and table sections caches. The sections which
+    are not cached are fetched in a single request decoding only them.
+
+    Parameters
+    ----------
+    session : httpx.Client
+        HTTP client
+    fully_qualified_name : str
+        Fully qualified name of the table
+    sections : list[str]
+        The sections to load, keys of the table in the load table response, e.g. "partitioning"
+    refresh : bool
+        Whether to bypass the cached sections and load them from Gravitino
+
+    Returns
+    -------
+    dict[str, Any]
+        The "name" and "comment" of the table and the requested sections.
+    """
+    path = _table_path(fully_qualified_name)
+    section_cache = get_cache("table_sections")
+    table = None if refresh else get_cache("table_details").get(path)
+    summary = None
+    if table is not None:
+        summary = {"name": table.name, "comment": table.comment}
+    elif not refresh:
+        summary = section_cache.get(f"{path}#")
+
+    result: dict[str, Any] = {}
+    missing = []
+    for section in dict.fromkeys(sections):
+        if section == "columns" and table is not None:
+            result[section] = [column.to_dict() for column in table.columns]
+            continue
+        cached = None if refresh else section_cache.get(f"{path}#{section}")
+        if cached is not None:
+            result[section] = cached[0]
+        else:
+            missing.append(section)
+
+    if missing or summary is None:
+        spec = _table_sections_spec(frozenset(missing))
+        data = _get_table_by_fqn_response(session, fully_qualified_name, spec).get("table") or {}
+        summary = {"name": data.get("name"), "comment": data.get("comment")}
+        section_cache.set(f"{path}#", summary)
+        for section in missing:
+            if section == "columns":
+                table = Table.from_dict(data)
+                get_cache("table_details").set(path, table)
+                result[section] = [column.to_dict() for column in table.columns]
+            else:
+                # wrapped, as a section may legitimately be None
+                section_cache.set(f"{path}#{section}", (data.get(section),))
+                result[section] = data.get(section)
+
+    return {**summary, **{section: result[section] for section in dict.fromkeys(sections)}}
+
+
+@lru_cache(maxsize=None)
+def _table_sections_spec(sections: frozenset[str]) -> Spec:
+    # one spec per set of sections, so the decoder compiled from it is reused
+    return {
+        "table": {
+            "name": True,
+            "comment": True,
+            **{section: spec for section, spec in _TABLE_SECTION_SPECS.items() if section in sections},
+        }
+    }
+
+
+def _get_table_by_fqn_response(
+    session: httpx.Client,
+    fully_qualified_name: str,
+    spec: Optional[Spec] = None,
+) -> Any:
     """
     Get a table by fully qualified table name.
 
@@ -164,19 +478,16 @@ def _get_table_by_fqn_response(session: httpx.Client, fully_qualified_name: str)
         HTTP client
     fully_qualified_name : str
         Fully qualified name of the table
+    spec : Optional[Spec]
+        Projection of the response to decode, the whole response is decoded if None
 
     Returns
     -------
     Any
         Returns a dictionary containing the table details
     """
-    table_names = fully_qualified_name.split(".")
-    # metalake=table_names[0]
-    catalog_name = table_names[1]
-    schema_name = table_names[2]
-    table_name = table_names[3]
-    response = session.get(
-        f"/api/metalakes/{metalake_name}/catalogs/{catalog_name}/schemas/{schema_name}/tables/{table_name}"
-    )
-    response.raise_for_status()
-    return response.json()
+    return fetch_json(session, _table_path(fully_qualified_name), spec)
+
+
+def _table_path(fully_qualified_name: str) -> str:
+    return resolve_fqn(fully_qualified_name, "table").path
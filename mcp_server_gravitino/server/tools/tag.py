@@ -1,24 +1,48 @@
 # Copyright 2024 Datastrato Pvt Ltd.
 # This software is licensed under the Apache License version 2.
-from typing import Dict, Optional
+from typing import Any, Callable, Literal, Optional
 
 import httpx
 from fastmcp import FastMCP
+from pydantic import BaseModel
 
+from mcp_server_gravitino.server.cache import get_cache
+from mcp_server_gravitino.server.concurrency import bounded_map
+from mcp_server_gravitino.server.endpoints import endpoint_path
+from mcp_server_gravitino.server.entities import MetadataObject, Tag
+from mcp_server_gravitino.server.json_stream import Spec, fetch_json
 from mcp_server_gravitino.server.tools import metalake_name
 from mcp_server_gravitino.server.tools.common_tools import (
+    BULK_OPERATION_TAG,
     LIST_OPERATION_TAG,
     TAG_OBJECT_TAG,
-    get_name_identifier_without_metalake,
+    FullyQualifiedName,
+    resolve_fqn,
 )
 
-_level_map: Dict[int, str] = {
-    2: "catalog",
-    3: "schema",
-    4: "table",
-    5: "column",
+_METADATA_OBJECTS_SPEC: Spec = {
+    "metadataObjects": [
+        {
+            "fullName": True,
+            "type": True,
+        }
+    ],
 }
 
+_TAG_NAMES_SPEC: Spec = {
+    "names": True,
+}
+
+# entity types tags can be associated with
+_TAGGABLE_TYPES = ("catalog", "schema", "table", "column")
+
+
+class TagAssociation(BaseModel):
+    """Tags to associate with one metadata object."""
+
+    tag_names: list[str]
+    fully_qualified_name: str
+
 
 def get_list_of_tags(mcp: FastMCP, session: httpx.Client):
     """Get a list of tags."""
@@ -46,17 +70,7 @@ def get_list_of_tags(mcp: FastMCP, session: httpx.Client):
             A list of tags, where each tag is represented as a dictionary with the following keys:
             - name: The name of the tag.
         """
-        response = session.get(f"/api/metalakes/{metalake_name}/tags")
-        response.raise_for_status()
-        response_json = response.json()
-
-        tags = response_json.get("names", [])
-        return [
-            {
-                "name": f"{tag}",
-            }
-            for tag in tags
-        ]
+        return [tag.to_dict() for tag in load_tags(session)]
 
 
 def associate_tag_to_entity(mcp: FastMCP, session: httpx.Client) -> None:
@@ -82,25 +96,154 @@ def associate_tag_to_entity(mcp: FastMCP, session: httpx.Client) -> None:
         if not fully_qualified_name:
             return {"result": "error", "message": "fully_qualified_name cannot be empty"}
 
-        names = fully_qualified_name.split(".")
-        level = len(names)
-        if level not in _level_map.keys():
+        fqn = _resolve_taggable(fully_qualified_name)
+        if fqn is None:
             return {
                 "result": "error",
                 "message": "Invalid 'fully_qualified_name': it must refer to a catalog, schema, table or column.",
             }
 
-        object_type = _get_object_type(level)
-        qualified_name = get_name_identifier_without_metalake(fully_qualified_name)
-
-        return _associate_tag_to_object(
+        return _associate_tags_to_object(
             session=session,
-            tag_name=tag_name,
-            object_type=object_type,
-            obj_qualified_name=qualified_name,
+            tag_names=[tag_name],
+            object_type=fqn.type,
+            obj_qualified_name=fqn.object_name,
         )
 
 
+def associate_tags_to_entities(mcp: FastMCP, session: httpx.Client) -> None:
+    """Associate tags with many catalogs, schemas, tables or columns."""
+
+    @mcp.tool(
+        name="associate_tags_to_entities",
+        description=(
+            "Associate tags with many catalogs, schemas, tables or columns in one call, sending one request per object."
+        ),
+        tags={
+            TAG_OBJECT_TAG,
+            BULK_OPERATION_TAG,
+        },
+        annotations={
+            "readOnlyHint": False,
+            "openWorldHint": True,
+            "destructiveHint": True,
+            "idempotentHint": True,
+        },
+    )
+    def _associate_tags_to_entities(associations: list[TagAssociation]) -> dict[str, Any]:
+        """
+        Associate tags with many metadata objects. The tags of all associations referring to the same
+        object are merged and sent in a single request, and the requests for different objects are
+        sent concurrently.
+
+        Parameters
+        ----------
+        associations : list[TagAssociation]
+            The associations, each with the following keys:
+            - tag_names: The names of the tags to associate with the object
+            - fully_qualified_name: The fully qualified name of a catalog, schema, table or column
+
+        Returns
+        -------
+        dict[str, Any]
+            If an error occurs, returns {"result": "error", "message": "error message"}.
+            Otherwise returns a dictionary with the following keys:
+            - result: "success" if every object was tagged, "error" otherwise
+            - succeeded: Number of objects tagged
+            - failed: Number of objects not tagged
+            - items: One outcome per object, in the order the objects first appear in associations,
+              with the keys "fullyQualifiedName", "tagNames", "result" and "message" (only present if
+              the result is "error")
+        """
+        if not associations:
+            return {"result": "error", "message": "associations cannot be empty"}
+
+        # merge the tags per object, keeping the order in which objects and tags were given
+        grouped: dict[str, dict[str, None]] = {}
+        for association in associations:
+            tag_names = grouped.setdefault(association.fully_qualified_name, {})
+            tag_names.update(dict.fromkeys(association.tag_names))
+
+        def _associate(fully_qualified_name: str) -> dict[str, str]:
+            if not fully_qualified_name:
+                return {"result": "error", "message": "fully_qualified_name cannot be empty"}
+            fqn = _resolve_taggable(fully_qualified_name)
+            if fqn is None:
+                return {
+                    "result": "error",
+                    "message": "Invalid 'fully_qualified_name': it must refer to a catalog, schema, table or column.",
+                }
+            return _associate_tags_to_object(
+                session=session,
+                tag_names=list(grouped[fully_qualified_name]),
+                object_type=fqn.type,
+                obj_qualified_name=fqn.object_name,
+            )
+
+        outcomes: dict[str, dict[str, str]] = {}
+        for fully_qualified_name, outcome, error in bounded_map(_associate, grouped):
+            outcomes[fully_qualified_name] = outcome or {"result": "error", "message": str(error)}
+
+        items = [
+            {"fullyQualifiedName": fully_qualified_name, "tagNames": list(tag_names), **outcomes[fully_qualified_name]}
+            for fully_qualified_name, tag_names in grouped.items()
+        ]
+        failed = sum(1 for item in items if item["result"] != "success")
+        return {
+            "result": "error" if failed else "success",
+            "succeeded": len(items) - failed,
+            "failed": failed,
+            "items": items,
+        }
+
+
+def get_tags_for_entity(mcp: FastMCP, session: httpx.Client) -> None:
+    """List the tags of a catalog, schema, table or column."""
+
+    @mcp.tool(
+        name="get_tags_for_entity",
+        description="List the tags of a catalog, schema, table or column.",
+        tags={
+            TAG_OBJECT_TAG,
+            LIST_OPERATION_TAG,
+        },
+        annotations={
+            "readOnlyHint": True,
+            "openWorldHint": True,
+        },
+    )
+    def _get_tags_for_entity(fully_qualified_name: str) -> dict[str, str] | list[dict[str, str]]:
+        """
+        List the tags of a metadata object, as returned by Gravitino this includes the tags inherited
+        from the parent objects.
+
+        Parameters
+        ----------
+        fully_qualified_name : str
+            The fully qualified name of a catalog, schema, table or column
+
+        Returns
+        -------
+        dict[str, str] | list[dict[str, str]]
+            If an error occurs, returns {"result": "error", "message": "error message"}.
+            if successful, returns a list of tags, where each tag is represented as a dictionary with
+            the following keys:
+            - name: The name of the tag.
+        """
+        if not fully_qualified_name:
+            return {"result": "error", "message": "fully_qualified_name cannot be empty"}
+
+        fqn = _resolve_taggable(fully_qualified_name)
+        if fqn is None:
+            return {
+                "result": "error",
+                "message": "Invalid 'fully_qualified_name': it must refer to a catalog, schema, table or column.",
+            }
+
+        tags = load_entity_tags(session, fqn.type, fqn.object_name)
+        return [tag.to_dict() for tag in tags]
+
+
 def list_objects_by_tag(mcp: FastMCP, session: httpx.Client) -> None:
     """List the metadata objects with a given tag."""
 
@@ -138,36 +281,232 @@ def list_objects_by_tag(mcp: FastMCP, session: httpx.Client) -> None:
         if not tag_name:
             return {"result": "error", "message": "tag_name cannot be empty"}
 
-        response = session.get(f"/api/metalakes/{metalake_name}/tags/{tag_name}/objects")
-        response.raise_for_status()
-        response_json = response.json()
+        return [obj.to_dict() for obj in load_tag_objects(session, tag_name)]
 
-        meta_objects = response_json.get("metadataObjects", [])
-        return [
-            {
-                "fullName": f"{obj.get('fullName')}",
-                "type": f"{obj.get('type')}",
-            }
-            for obj in meta_objects
-        ]
 
+def get_tagged_objects(mcp: FastMCP, session: httpx.Client) -> None:
+    """Get the metadata objects with any or all of the given tags."""
 
-def _associate_tag_to_object(
+    @mcp.tool(
+        name="get_tagged_objects",
+        description=(
+            "Get the metadata objects with any or all of the given tags, or every tagged object, "
+            "together with their tags."
+        ),
+        tags={
+            TAG_OBJECT_TAG,
+            LIST_OPERATION_TAG,
+            BULK_OPERATION_TAG,
+        },
+        annotations={
+            "readOnlyHint": True,
+            "openWorldHint": True,
+        },
+    )
+    def _get_tagged_objects(
+        tag_names: Optional[list[str]] = None,
+        match: Literal["any", "all"] = "any",
+        refresh: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Get the metadata objects with any or all of the given tags. The objects of every tag are loaded
+        concurrently and kept in the server cache, so further queries are answered from memory.
+
+        Parameters
+        ----------
+        tag_names : Optional[list[str]]
+            The names of the tags to query, every tag of the Metalake if not set.
+        match : Literal["any", "all"]
+            Whether an object must have any ("any") or all ("all") of the tags.
+        refresh : bool
+            Whether to reload the tags and their objects from Gravitino instead of using the cache.
+
+        Returns
+        -------
+        dict[str, Any]
+            If an error occurs, returns {"result": "error", "message": "error message"}.
+            if successful, returns a dictionary with the following keys:
+            - result: "success"
+            - objects: The matching objects, each with the keys "fullName", "type" and "tags" (the
+              queried tags the object has)
+            - errors: Tags whose objects could not be loaded, with "name" and "message". They are
+              treated as having no objects.
+        """
+        if tag_names is not None and (not tag_names or not all(tag_names)):
+            return {"result": "error", "message": "tag_names cannot be empty"}
+
+        try:
+            tag_map, errors = load_tag_map(session, tag_names, refresh)
+        except httpx.HTTPError as err:
+            return {"result": "error", "message": str(err)}
+
+        tags_by_object: dict[str, list[str]] = {}
+        objects: dict[str, MetadataObject] = {}
+        for tag_name, tagged in tag_map.items():
+            for obj in tagged:
+                key = _entity_key(obj.type or "", obj.full_name or "")
+                objects.setdefault(key, obj)
+                tags_by_object.setdefault(key, []).append(tag_name)
+
+        required = len(tag_map) + len(errors)
+        return {
+            "result": "success",
+            "objects": [
+                {**objects[key].to_dict(), "tags": tags}
+                for key, tags in tags_by_object.items()
+                if match == "any" or len(tags) == required
+            ],
+            "errors": errors,
+        }
+
+
+def load_tag_map(
+    session: httpx.Client,
+    tag_names: Optional[list[str]] = None,
+    refresh: bool = False,
+) -> tuple[dict[str, tuple[MetadataObject, ...]], list[dict[str, str]]]:
+    """
+    Load the objects of many tags concurrently, through the tag objects cache.
+
+    Parameters
+    ----------
+    session : httpx.Client
+        HTTP client
+    tag_names : Optional[list[str]]
+        The names of the tags, every tag of the Metalake if None
+    refresh : bool
+        Whether to bypass the cache and load the tags and objects from Gravitino
+
+    Returns
+    -------
+    tuple[dict[str, tuple[MetadataObject, ...]], list[dict[str, str]]]
+        The objects of each tag, in the order of the tags, and the tags which could not be loaded,
+        with "name" and "message".
+    """
+    if tag_names is None:
+        tag_names = [tag.name for tag in load_tags(session, refresh)]
+    tag_names = list(dict.fromkeys(tag_names))
+
+    loaded: dict[str, tuple[MetadataObject, ...]] = {}
+    failed: dict[str, str] = {}
+    for tag_name, objects, error in bounded_map(lambda name: load_tag_objects(session, name, refresh), tag_names):
+        if error is not None:
+            failed[tag_name] = str(error)
+        else:
+            loaded[tag_name] = objects
+
+    tag_map = {name: loaded[name] for name in tag_names if name in loaded}
+    errors = [{"name": name, "message": failed[name]} for name in tag_names if name in failed]
+    return tag_map, errors
+
+
+def load_tags(session: httpx.Client, refresh: bool = False) -> tuple[Tag, ...]:
+    """
+    Load the tags of the Metalake, through the tags cache.
+
+    Parameters
+    ----------
+    session : httpx.Client
+        HTTP client
+    refresh : bool
+        Whether to bypass the cached tags and load them from Gravitino
+
+    Returns
+    -------
+    tuple[Tag, ...]
+        The tags in the Metalake.
+    """
+    url = endpoint_path("tags", metalake_name)
+
+    def _load() -> tuple[Tag, ...]:
+        response_json = fetch_json(session, url, _TAG_NAMES_SPEC)
+        return tuple(Tag(name=f"{tag}") for tag in response_json.get("names") or [])
+
+    return get_cache("tags").get_or_load(url, _load, refresh)
+
+
+def load_tag_objects(session: httpx.Client, tag_name: str, refresh: bool = False) -> tuple[MetadataObject, ...]:
+    """
+    Load the metadata objects associated with a tag, through the tag objects cache.
+
+    Parameters
+    ----------
+    session : httpx.Client
+        HTTP client
+    tag_name : str
+        The name of the tag
+    refresh : bool
+        Whether to bypass the cached objects and load them from Gravitino
+
+    Returns
+    -------
+    tuple[MetadataObject, ...]
+        The metadata objects with the tag.
+    """
+    url = _tag_objects_path(tag_name)
+
+    def _load() -> tuple[MetadataObject, ...]:
+        response_json = fetch_json(session, url, _METADATA_OBJECTS_SPEC)
+        objects = tuple(MetadataObject.from_dict(obj) for obj in response_json.get("metadataObjects") or [])
+        # keep the other direction of the index in line with the listing
+        entity_tags = get_cache("entity_tags")
+        for obj in objects:
+            entity_tags.update(_entity_key(obj.type or "", obj.full_name or ""), _with_tags([tag_name]))
+        return objects
+
+    return get_cache("tag_objects").get_or_load(url, _load, refresh)
+
+
+def load_entity_tags(
     session: httpx.Client,
-    tag_name: str,
+    object_type: str,
+    obj_qualified_name: str,
+    refresh: bool = False,
+) -> tuple[Tag, ...]:
+    """
+    Load the tags of a metadata object, through the entity tags cache.
+
+    Parameters
+    ----------
+    session : httpx.Client
+        HTTP client
+    object_type : str
+        The type of the object, e.g. "table"
+    obj_qualified_name : str
+        The qualified name of the object, without the Metalake name
+    refresh : bool
+        Whether to bypass the cached tags and load them from Gravitino
+
+    Returns
+    -------
+    tuple[Tag, ...]
+        The tags of the object, including the inherited ones.
+    """
+    url = endpoint_path("object_tags", metalake_name, object_type, obj_qualified_name)
+
+    def _load() -> tuple[Tag, ...]:
+        response_json = fetch_json(session, url, _TAG_NAMES_SPEC)
+        return tuple(Tag(name=f"{tag}") for tag in response_json.get("names") or [])
+
+    return get_cache("entity_tags").get_or_load(_entity_key(object_type, obj_qualified_name), _load, refresh)
+
+
+def _associate_tags_to_object(
+    session: httpx.Client,
+    tag_names: list[str],
     object_type: str,
     obj_qualified_name: str,
 ) -> dict[str, str]:
     # https://gravitino.apache.org/docs/0.8.0-incubating/api/rest/associate-tags
     """
-    Associate a tag with an object by tag name, object type and object's qualified name.
+    Associate tags with an object by tag names, object type and object's qualified name, in one request.
 
     Parameters
     ----------
     session : httpx.Client
         HTTPX client to make the API call
-    tag_name : str
-        The name of the tag to be associated with the object
+    tag_names : list[str]
+        The names of the tags to be associated with the object
     object_type : str
         The type of the object to be associated with the tag
     obj_qualified_name : str
@@ -181,17 +520,17 @@ def _associate_tag_to_object(
         - message: A message describing the result of the operation, only present if the result is "error"
     """
 
-    if not tag_name:
+    if not tag_names or not all(tag_names):
         return {"result": "error", "message": "tag_name cannot be empty"}
     if not object_type:
         return {"result": "error", "message": "object_type cannot be empty"}
     if not obj_qualified_name:
         return {"result": "error", "message": "obj_qualified_name cannot be empty"}
 
-    json_data = {"tagsToAdd": [tag_name]}
+    json_data = {"tagsToAdd": tag_names}
     try:
         response = session.post(
-            f"/api/metalakes/{metalake_name}/objects/{object_type}/{obj_qualified_name}/tags", json=json_data
+            endpoint_path("object_tags", metalake_name, object_type, obj_qualified_name), json=json_data
         )
         response.raise_for_status()
     except httpx.HTTPStatusError as http_err:
@@ -199,14 +538,51 @@ def _associate_tag_to_object(
     except Exception as err:
         return {"result": "error", "message": str(err)}
 
+    # update both directions of the tag index rather than dropping them
+    obj = MetadataObject(full_name=obj_qualified_name, type=object_type)
+    tag_objects = get_cache("tag_objects")
+    for tag_name in tag_names:
+        tag_objects.update(_tag_objects_path(tag_name), _with_object(obj))
+    entity_tags = get_cache("entity_tags")
+    entity_tags.update(_entity_key(object_type, obj_qualified_name), _with_tags(tag_names))
+    # the children of the object inherit its tags
+    entity_tags.invalidate_prefix(f"{obj_qualified_name}.")
     return {
         "result": "success",
     }
 
 
-def _get_object_type(level: int) -> str:
-    object_type = _level_map.get(level)
-    if object_type is None:
-        raise ValueError(f"Invalid level: {level}")
+def _tag_objects_path(tag_name: str) -> str:
+    return endpoint_path("tag_objects", metalake_name, tag_name)
+
 
-    return object_type
+def _entity_key(object_type: str, obj_qualified_name: str) -> str:
+    # keyed by name first, so the entries of an object's children share its prefix
+    return f"{obj_qualified_name}:{object_type.lower()}"
+
+
+def _with_object(obj: MetadataObject) -> Callable[[tuple[MetadataObject, ...]], tuple[MetadataObject, ...]]:
+    def _add(objects: tuple[MetadataObject, ...]) -> tuple[MetadataObject, ...]:
+        key = _entity_key(obj.type or "", obj.full_name or "")
+        if any(_entity_key(other.type or "", other.full_name or "") == key for other in objects):
+            return objects
+        return objects + (obj,)
+
+    return _add
+
+
+def _with_tags(tag_names: list[str]) -> Callable[[tuple[Tag, ...]], tuple[Tag, ...]]:
+    def _add(tags: tuple[Tag, ...]) -> tuple[Tag, ...]:
+        known = {tag.name for tag in tags}
+        return tags + tuple(Tag(name=name) for name in dict.fromkeys(tag_names) if name not in known)
+
+    return _add
+
+
+def _resolve_taggable(fully_qualified_name: str) -> Optional[FullyQualifiedName]:
+    """Resolve the name of a catalog, schema, table or column, None if it refers to anything else."""
+    try:
+        fqn = resolve_fqn(fully_qualified_name)
+    except ValueError:
+        return None
+    return fqn if fqn.type in _TAGGABLE_TYPES else None
@@ -0,0 +1,173 @@
+# Copyright 2024 Datastrato Pvt Ltd.
+# This software is licensed under the Apache License version 2.
+
+# Topic is a stream of messages in a messaging catalog, e.g. a Kafka topic.
+from typing import Any
+
+import httpx
+from fastmcp import FastMCP
+
+from mcp_server_gravitino.server.cache import get_cache
+from mcp_server_gravitino.server.endpoints import endpoint_path
+from mcp_server_gravitino.server.entities import NameIdentifier, Topic
+from mcp_server_gravitino.server.json_stream import Spec, fetch_json
+from mcp_server_gravitino.server.tools import metalake_name as global_metalake_name
+from mcp_server_gravitino.server.tools.common_tools import (
+    GET_OPERATION_TAG,
+    IDENTIFIERS_SPEC,
+    LIST_OPERATION_TAG,
+    TOPIC_TAG,
+    resolve_fqn,
+)
+
+_TOPIC_SPEC: Spec = {
+    "topic": {
+        "name": True,
+        "comment": True,
+        "properties": True,
+    },
+}
+
+
+def get_list_of_topics(mcp: FastMCP, session: httpx.Client) -> None:
+    """Get a list of topics, filtered by catalog and schema it belongs to."""
+
+    # https://gravitino.apache.org/docs/0.8.0-incubating/api/rest/list-topics
+    @mcp.tool(
+        name="get_list_of_topics",
+        description="Get a list of topics, filtered by catalog and schema it belongs to.",
+        tags={
+            TOPIC_TAG,
+            LIST_OPERATION_TAG,
+        },
+        annotations={
+            "readOnlyHint": True,
+            "openWorldHint": True,
+        },
+    )
+    def _get_list_of_topics(
+        catalog_name: str,
+        schema_name: str,
+    ) -> list[dict[str, Any]]:
+        """
+        Get a list of topics, filtered by catalog and schema it belongs to.
+
+        Parameters
+        ----------
+        catalog_name : str
+            Name of the catalog
+        schema_name : str
+            Name of the schema
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            Returns a list of topics, it contains the following keys:
+            - name: Name of the topic
+            - namespace: Namespace of the topic
+            - fullyQualifiedName: Fully qualified name of the topic
+        """
+        return [topic.to_dict() for topic in load_topics(session, catalog_name, schema_name)]
+
+
+def get_topic_by_fqn(mcp: FastMCP, session: httpx.Client) -> None:
+    """Get a topic by fully qualified topic name."""
+
+    # https://gravitino.apache.org/docs/0.8.0-incubating/api/rest/load-topic
+    @mcp.tool(
+        name="get_topic_by_fqn",
+        description="Get a topic and its properties by fully qualified topic name.",
+        tags={
+            TOPIC_TAG,
+            GET_OPERATION_TAG,
+        },
+        annotations={
+            "readOnlyHint": True,
+            "openWorldHint": True,
+        },
+    )
+    def _get_topic_by_fqn(fully_qualified_name: str) -> dict[str, Any]:
+        """
+        Get a topic by fully qualified topic name.
+
+        Parameters
+        ----------
+        fully_qualified_name : str
+            Fully qualified name of the topic, of the form 'catalog.schema.topic'
+            or 'metalake.catalog.schema.topic'.
+
+        Returns
+        -------
+        dict[str, Any]
+            Returns a dictionary containing the following keys:
+            - name: Name of the topic
+            - fullyQualifiedName: Fully qualified name of the topic
+            - comment: Comment of the topic
+            - properties: Properties of the topic, e.g. its partition count and replication factor
+        """
+        topic = load_topic(session, fully_qualified_name)
+        return {**topic.to_dict(), "fullyQualifiedName": fully_qualified_name}
+
+
+def load_topics(
+    session: httpx.Client,
+    catalog_name: str,
+    schema_name: str,
+    refresh: bool = False,
+) -> tuple[NameIdentifier, ...]:
+    """
+    Load the topic identifiers of a schema, through the topics cache.
+
+    Parameters
+    ----------
+    session : httpx.Client
+        HTTP client
+    catalog_name : str
+        Name of the catalog
+    schema_name : str
+        Name of the schema
+    refresh : bool
+        Whether to bypass the cached identifiers and load them from Gravitino
+
+    Returns
+    -------
+    tuple[NameIdentifier, ...]
+        The identifiers of the topics in the schema.
+    """
+    url = endpoint_path("topics", global_metalake_name, catalog_name, schema_name)
+
+    def _load() -> tuple[NameIdentifier, ...]:
+        response_json = fetch_json(session, url, IDENTIFIERS_SPEC)
+        return tuple(NameIdentifier.from_dict(topic) for topic in response_json.get("identifiers") or [])
+
+    return get_cache("topics").get_or_load(url, _load, refresh)
+
+
+def load_topic(session: httpx.Client, fully_qualified_name: str, refresh: bool = False) -> Topic:
+    """
+    Load a topic by fully qualified topic name, through the topic details cache.
+
+    Parameters
+    ----------
+    session : httpx.Client
+        HTTP client
+    fully_qualified_name : str
+        Fully qualified name of the topic, with or without the Metalake name
+    refresh : bool
+        Whether to bypass the cached topic and load it from Gravitino
+
+    Returns
+    -------
+    Topic
+        The topic.
+    """
+    url = _topic_path(fully_qualified_name)
+    return get_cache("topic_details").get_or_load(
+        url,
+        lambda: Topic.from_dict(fetch_json(session, url, _TOPIC_SPEC).get("topic")),
+        refresh,
+    )
+
+
+def _topic_path(fully_qualified_name: str) -> str:
+    return resolve_fqn(fully_qualified_name, "topic").path
@@ -1,18 +1,147 @@
 # Copyright 2024 Datastrato Pvt Ltd.
 # This software is licensed under the Apache License version 2.
+from typing import Any, Iterable, Literal, Optional
+
 import httpx
 from fastmcp import FastMCP
 
+from mcp_server_gravitino.server.cache import get_cache
+from mcp_server_gravitino.server.concurrency import bounded_map
+from mcp_server_gravitino.server.endpoints import endpoint_path
+from mcp_server_gravitino.server.entities import Role, SecurableObject, User
+from mcp_server_gravitino.server.json_stream import Spec, fetch_json
 from mcp_server_gravitino.server.tools import metalake_name
 from mcp_server_gravitino.server.tools.common_tools import (
+    BULK_OPERATION_TAG,
+    DETAILS_TAG,
     GRANT_OPERATION_TAG,
     LIST_OPERATION_TAG,
     PRIVILEGES_TAG,
     REVOKE_OPERATION_TAG,
     ROLE_TAG,
     USER_TAG,
+    join_fqn,
+    paginate_within_budget,
+    resolve_fqn,
+    split_fqn,
 )
 
+_USERS_SPEC: Spec = {
+    "users": [
+        {
+            "name": True,
+            "roles": True,
+        }
+    ],
+}
+
+_ROLE_SPEC: Spec = {
+    "role": {
+        "name": True,
+        "securableObjects": [
+            {
+                "fullName": True,
+                "type": True,
+                "privileges": [
+                    {
+                        "name": True,
+                        "condition": True,
+                    }
+                ],
+            }
+        ],
+    },
+}
+
+_ROLE_NAMES_SPEC: Spec = {
+    "names": True,
+}
+
+
+# types of the objects privileges are granted on
+_SECURABLE_TYPES = ("metalake", "catalog", "schema", "table", "model", "fileset", "topic")
+
+
+class UserRoleIndex:
+    """The users of the Metalake and the roles granted to them, indexed in both directions."""
+
+    __slots__ = ("users", "role_users")
+
+    def __init__(self, users: Iterable[User]):
+        self.users: dict[str, User] = {f"{user.name}": user for user in users}
+        role_users: dict[str, list[str]] = {}
+        for user in self.users.values():
+            for role in user.roles:
+                role_users.setdefault(role, []).append(f"{user.name}")
+        self.role_users: dict[str, tuple[str, ...]] = {role: tuple(names) for role, names in role_users.items()}
+
+    def users_with_role(self, role_name: str) -> tuple[str, ...]:
+        return self.role_users.get(role_name, ())
+
+    def with_change(
+        self,
+        action: Literal["grant", "revoke"],
+        user_names: Iterable[str],
+        role_names: list[str],
+    ) -> "UserRoleIndex":
+        """Build the index after the same roles were granted to or revoked from users, in one pass."""
+        users = dict(self.users)
+        for user_name in user_names:
+            user = users.get(user_name, User(name=user_name))
+            if action == "grant":
+                roles = user.roles + tuple(role for role in dict.fromkeys(role_names) if role not in user.roles)
+            else:
+                roles = tuple(role for role in user.roles if role not in role_names)
+            users[user_name] = User(name=user_name, roles=roles)
+        return UserRoleIndex(users.values())
+
+
+class RolePrivilegeIndex:
+    """The roles of the Metalake, with the privileges they have indexed by the object they are on."""
+
+    __slots__ = ("roles", "objects", "errors")
+
+    def __init__(self, roles: Iterable[Role], errors: Iterable[dict[str, str]] = ()):
+        self.roles: dict[str, Role] = {role.name: role for role in roles}
+        objects: dict[tuple[str, ...], list[tuple[str, SecurableObject]]] = {}
+        for role in self.roles.values():
+            for obj in role.securable_objects:
+                objects.setdefault(_securable_names(obj), []).append((role.name, obj))
+        self.objects: dict[tuple[str, ...], tuple[tuple[str, SecurableObject], ...]] = {
+            names: tuple(grants) for names, grants in objects.items()
+        }
+        # roles which could not be loaded
+        self.errors: list[dict[str, str]] = list(errors)
+
+    def grants(
+        self,
+        names: tuple[str, ...],
+        privilege: str,
+        role_names: Optional[Iterable[str]] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Get the privileges matching ``privilege`` on the object with ``names`` (its names below the
+        Metalake) or on its parents, from the top of the hierarchy down, optionally only of some roles.
+        """
+        roles = None if role_names is None else set(role_names)
+        found = []
+        for ancestor in _ancestor_names(names):
+            for role_name, obj in self.objects.get(ancestor, ()):
+                if roles is not None and role_name not in roles:
+                    continue
+                for granted in obj.privileges:
+                    if _privilege_matches(granted.name, privilege):
+                        found.append(
+                            {
+                                "role": role_name,
+                                "fullName": obj.full_name,
+                                "type": obj.type,
+                                "privilege": granted.name,
+                                "condition": granted.condition,
+                            }
+                        )
+        return found
+
 
 def get_list_of_roles(mcp: FastMCP, session: httpx.Client) -> None:
     """Get a list of role names, which can be used to manage access control."""
@@ -40,17 +169,241 @@ def get_list_of_roles(mcp: FastMCP, session: httpx.Client) -> None:
             A list of role names, which can be used to manage access control, it contains the following fields:
             - name: The name of the role.
         """
-        response = session.get(f"/api/metalakes/{metalake_name}/roles")
-        response.raise_for_status()
-        response_json = response.json()
+        response_json = fetch_json(session, endpoint_path("roles", metalake_name), _ROLE_NAMES_SPEC)
+        roles = response_json.get("names") or []
+        return [Role(name=f"{role}").to_dict() for role in roles]
 
-        roles = response_json.get("names", [])
-        return [
-            {
-                "name": f"{role}",
-            }
-            for role in roles
-        ]
+
+def get_role_details(mcp: FastMCP, session: httpx.Client) -> None:
+    """Get the securable objects and privileges of roles."""
+
+    # https://gravitino.apache.org/docs/0.8.0-incubating/api/rest/get-role
+    @mcp.tool(
+        name="get_role_details",
+        description="Get the securable objects of roles and the privileges the roles have on them.",
+        tags={
+            ROLE_TAG,
+            PRIVILEGES_TAG,
+            DETAILS_TAG,
+        },
+        annotations={
+            "readOnlyHint": True,
+            "openWorldHint": True,
+        },
+    )
+    def _get_role_details(role_names: Optional[list[str]] = None, refresh: bool = False) -> dict[str, Any]:
+        """
+        Get the securable objects of roles and the privileges the roles have on them. The roles are
+        loaded concurrently and cached.
+
+        Parameters
+        ----------
+        role_names : Optional[list[str]]
+            The names of the roles, every role of the Metalake if not set.
+        refresh : bool
+            Whether to reload the roles from Gravitino instead of using the cache.
+
+        Returns
+        -------
+        dict[str, Any]
+            If an error occurs, returns {"result": "error", "message": "error message"}.
+            if successful, returns a dictionary with the following keys:
+            - result: "success"
+            - roles: The roles, each with a "name" and "securableObjects", a list of objects with
+              "fullName", "type" and "privileges" (each with a "name" and a "condition", "allow" or "deny")
+            - errors: Roles which could not be loaded, with "name" and "message"
+        """
+        if role_names is not None and (not role_names or not all(role_names)):
+            return {"result": "error", "message": "role_names cannot be empty"}
+
+        try:
+            if role_names is None:
+                index = load_role_privilege_index(session, refresh)
+                roles, errors = list(index.roles.values()), index.errors
+            else:
+                roles, errors = load_roles(session, role_names, refresh)
+        except httpx.HTTPError as err:
+            return {"result": "error", "message": str(err)}
+
+        return {
+            "result": "success",
+            "roles": [role.to_dict(details=True) for role in roles],
+            "errors": errors,
+        }
+
+
+def get_roles_granting_privilege(mcp: FastMCP, session: httpx.Client) -> None:
+    """Get the roles having a privilege on a metadata object."""
+
+    @mcp.tool(
+        name="get_roles_granting_privilege",
+        description=(
+            "Get the roles having a privilege on a catalog, schema, table or other metadata object, "
+            "directly or through one of its parents."
+        ),
+        tags={
+            ROLE_TAG,
+            PRIVILEGES_TAG,
+        },
+        annotations={
+            "readOnlyHint": True,
+            "openWorldHint": True,
+        },
+    )
+    def _get_roles_granting_privilege(
+        privilege: str,
+        fully_qualified_name: str,
+        object_type: str = "table",
+        refresh: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Get the roles having a privilege on a metadata object or on one of its parents, from the cached
+        privilege index of every role.
+
+        Parameters
+        ----------
+        privilege : str
+            The name of the privilege, e.g. "select_table". A verb such as "select" matches every
+            privilege whose name starts with it.
+        fully_qualified_name : str
+            The fully qualified name of the object, optionally starting with the Metalake name, e.g.
+            'catalog.schema.table'.
+        object_type : str
+            The type of the object: "metalake", "catalog", "schema", "table", "model", "fileset" or "topic".
+        refresh : bool
+            Whether to reload the roles from Gravitino instead of using the cache.
+
+        Returns
+        -------
+        dict[str, Any]
+            If an error occurs, returns {"result": "error", "message": "error message"}.
+            if successful, returns a dictionary with the following keys:
+            - result: "success"
+            - grants: The matching privileges, each with the "role", the "fullName" and "type" of the
+              object it is on, the "privilege" name and its "condition", "allow" or "deny"
+            - errors: Roles which could not be loaded, with "name" and "message"
+        """
+        if not privilege:
+            return {"result": "error", "message": "privilege cannot be empty"}
+        if not fully_qualified_name:
+            return {"result": "error", "message": "fully_qualified_name cannot be empty"}
+        try:
+            names = _object_names(fully_qualified_name, object_type)
+        except ValueError as err:
+            return {"result": "error", "message": str(err)}
+
+        try:
+            index = load_role_privilege_index(session, refresh)
+        except httpx.HTTPError as err:
+            return {"result": "error", "message": str(err)}
+
+        return {
+            "result": "success",
+            "grants": index.grants(names, privilege),
+            "errors": index.errors,
+        }
+
+
+def check_user_access(mcp: FastMCP, session: httpx.Client) -> None:
+    """Check whether a user has a privilege on a metadata object."""
+
+    @mcp.tool(
+        name="check_user_access",
+        description=(
+            "Check whether a user has a privilege on a catalog, schema, table or other metadata object "
+            "through the roles granted to the user, and list the grants deciding it."
+        ),
+        tags={
+            USER_TAG,
+            ROLE_TAG,
+            PRIVILEGES_TAG,
+        },
+        annotations={
+            "readOnlyHint": True,
+            "openWorldHint": True,
+        },
+    )
+    def _check_user_access(
+        user_name: str,
+        privilege: str,
+        fully_qualified_name: str,
+        object_type: str = "table",
+        refresh: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Check whether a user has a privilege on a metadata object, from the cached user and role index
+        and role privilege index. A privilege is granted on an object by a role having it on the object
+        or on one of its parents, and a deny takes precedence over any allow. Using an object inside a
+        catalog or schema also requires use_catalog and use_schema on them, which are checked the same
+        way. Ownership of objects is not taken into account.
+
+        Parameters
+        ----------
+        user_name : str
+            The name of the user.
+        privilege : str
+            The name of the privilege, e.g. "select_table". A verb such as "select" matches every
+            privilege whose name starts with it.
+        fully_qualified_name : str
+            The fully qualified name of the object, optionally starting with the Metalake name, e.g.
+            'catalog.schema.table'.
+        object_type : str
+            The type of the object: "metalake", "catalog", "schema", "table", "model", "fileset" or "topic".
+        refresh : bool
+            Whether to reload the users and roles from Gravitino instead of using the cache.
+
+        Returns
+        -------
+        dict[str, Any]
+            If an error occurs, returns {"result": "error", "message": "error message"}.
+            if successful, returns a dictionary with the following keys:
+            - result: "success"
+            - allowed: Whether the user has the privilege
+            - roles: The roles granted to the user
+            - checks: The privileges checked, each with the "privilege", the "fullName" of the object,
+              whether it is "allowed" and the "grants" deciding it, as returned by
+              get_roles_granting_privilege
+            - errors: Roles which could not be loaded, with "name" and "message"
+        """
+        if not user_name:
+            return {"result": "error", "message": "user_name cannot be empty"}
+        if not privilege:
+            return {"result": "error", "message": "privilege cannot be empty"}
+        if not fully_qualified_name:
+            return {"result": "error", "message": "fully_qualified_name cannot be empty"}
+        try:
+            names = _object_names(fully_qualified_name, object_type)
+        except ValueError as err:
+            return {"result": "error", "message": str(err)}
+
+        try:
+            user = load_user_role_index(session, refresh).users.get(user_name)
+            if user is None:
+                return {"result": "error", "message": f"user {user_name} not found"}
+            index = load_role_privilege_index(session, refresh)
+        except httpx.HTTPError as err:
+            return {"result": "error", "message": str(err)}
+
+        checks = []
+        for required, required_names in _required_privileges(privilege, names):
+            grants = index.grants(required_names, required, user.roles)
+            conditions = {f"{grant['condition']}".lower() for grant in grants}
+            checks.append(
+                {
+                    "privilege": required,
+                    "fullName": join_fqn(metalake_name, *required_names),
+                    "allowed": "allow" in conditions and "deny" not in conditions,
+                    "grants": grants,
+                }
+            )
+
+        return {
+            "result": "success",
+            "allowed": all(check["allowed"] for check in checks),
+            "roles": list(user.roles),
+            "checks": checks,
+            "errors": index.errors,
+        }
 
 
 def get_list_of_users(mcp: FastMCP, session: httpx.Client) -> None:
@@ -69,29 +422,234 @@ def get_list_of_users(mcp: FastMCP, session: httpx.Client) -> None:
             "openWorldHint": True,
         },
     )
-    def _get_list_of_users() -> list[dict[str, str]]:
+    def _get_list_of_users(
+        max_items: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        page_token: Optional[str] = None,
+    ) -> list[dict[str, Any]] | dict[str, Any]:
         """
-        Get a list of users, and the roles granted to the user.
+        Get a list of users, and the roles granted to the user. If any of max_items, max_bytes or
+        page_token is set, the users are returned in pages: a page holds the users, in the order of
+        Gravitino, up to the first one which would exceed the budget, and the users after it are not
+        encoded.
+
+        Parameters
+        ----------
+        max_items : Optional[int]
+            Max number of users returned.
+        max_bytes : Optional[int]
+            Max size of the returned users as compact JSON, at least one user is returned.
+        page_token : Optional[str]
+            Token of the page to return, as returned by a previous call in "nextPageToken".
 
         Returns
         -------
-        list[dict[str, str]]
+        list[dict[str, Any]] | dict[str, Any]
             A list of users, and the roles granted to the user, it contains the following fields:
             - name: The name of the user.
-            - roles: The roles granted to the user.
+            - roles: The names of the roles granted to the user.
+            If paged, returns {"result": "error", "message": "error message"} if page_token is invalid,
+            otherwise a dictionary with the following keys:
+            - result: "success"
+            - users: The users of the page, with the fields above
+            - counts: The number of users ("total"), in the page ("returned") and after it ("remaining")
+            - nextPageToken: Token of the next page, only present if there are more users
         """
-        response = session.get(f"/api/metalakes/{metalake_name}/users?details=true")
-        response.raise_for_status()
-        response_json = response.json()
+        if page_token is not None and not page_token.isdigit():
+            return {"result": "error", "message": "page_token is invalid"}
+
+        users = load_user_role_index(session).users.values()
+        if max_items is None and max_bytes is None and page_token is None:
+            return [user.to_dict() for user in users]
+
+        page, counts, next_offset = paginate_within_budget(
+            list(users), User.to_dict, max_items, max_bytes, int(page_token or 0)
+        )
+        result: dict[str, Any] = {"result": "success", "users": page, "counts": counts}
+        if next_offset is not None:
+            result["nextPageToken"] = str(next_offset)
+        return result
 
-        users = response_json.get("users", [])
-        return [
-            {
-                "name": f"{user.get('name')}",
-                "roles": f"{user.get('roles')}",
-            }
-            for user in users
-        ]
+
+def get_roles_of_user(mcp: FastMCP, session: httpx.Client) -> None:
+    """Get the roles granted to a user."""
+
+    @mcp.tool(
+        name="get_roles_of_user",
+        description="Get the roles granted to a user.",
+        tags={
+            USER_TAG,
+            ROLE_TAG,
+        },
+        annotations={
+            "readOnlyHint": True,
+            "openWorldHint": True,
+        },
+    )
+    def _get_roles_of_user(user_name: str, refresh: bool = False) -> dict[str, Any]:
+        """
+        Get the roles granted to a user, from the cached user and role index.
+
+        Parameters
+        ----------
+        user_name : str
+            The name of the user.
+        refresh : bool
+            Whether to reload the users from Gravitino instead of using the cache.
+
+        Returns
+        -------
+        dict[str, Any]
+            If an error occurs, returns {"result": "error", "message": "error message"}.
+            if successful, returns a dictionary with the following keys:
+            - name: The name of the user.
+            - roles: The names of the roles granted to the user.
+        """
+        if not user_name:
+            return {"result": "error", "message": "user_name cannot be empty"}
+
+        user = load_user_role_index(session, refresh).users.get(user_name)
+        if user is None:
+            return {"result": "error", "message": f"user {user_name} not found"}
+        return user.to_dict()
+
+
+def get_users_with_role(mcp: FastMCP, session: httpx.Client) -> None:
+    """Get the users a role is granted to."""
+
+    @mcp.tool(
+        name="get_users_with_role",
+        description="Get the users a role is granted to.",
+        tags={
+            USER_TAG,
+            ROLE_TAG,
+        },
+        annotations={
+            "readOnlyHint": True,
+            "openWorldHint": True,
+        },
+    )
+    def _get_users_with_role(role_name: str, refresh: bool = False) -> dict[str, str] | list[dict[str, str]]:
+        """
+        Get the users a role is granted to, from the cached user and role index.
+
+        Parameters
+        ----------
+        role_name : str
+            The name of the role.
+        refresh : bool
+            Whether to reload the users from Gravitino instead of using the cache.
+
+        Returns
+        -------
+        dict[str, str] | list[dict[str, str]]
+            If an error occurs, returns {"result": "error", "message": "error message"}.
+            if successful, returns a list of users, it contains the following fields:
+            - name: The name of the user.
+        """
+        if not role_name:
+            return {"result": "error", "message": "role_name cannot be empty"}
+
+        return [{"name": name} for name in load_user_role_index(session, refresh).users_with_role(role_name)]
+
+
+def load_roles(
+    session: httpx.Client,
+    role_names: Iterable[str],
+    refresh: bool = False,
+) -> tuple[list[Role], list[dict[str, str]]]:
+    """
+    Load roles concurrently, through the role details cache.
+
+    Parameters
+    ----------
+    session : httpx.Client
+        HTTP client
+    role_names : Iterable[str]
+        The names of the roles
+    refresh : bool
+        Whether to bypass the cached roles and load them from Gravitino
+
+    Returns
+    -------
+    tuple[list[Role], list[dict[str, str]]]
+        The roles in the given order, and the roles which could not be loaded, with "name" and "message".
+    """
+    role_names = list(dict.fromkeys(role_names))
+    roles_cache = get_cache("role_details")
+
+    def _load_role(role_name: str) -> Role:
+        url = endpoint_path("role", metalake_name, role_name)
+        return roles_cache.get_or_load(
+            url,
+            lambda: Role.from_dict(fetch_json(session, url, _ROLE_SPEC).get("role")),
+            refresh,
+        )
+
+    loaded: dict[str, Role] = {}
+    failed: dict[str, str] = {}
+    for role_name, role, error in bounded_map(_load_role, role_names):
+        if error is not None:
+            failed[role_name] = str(error)
+        else:
+            loaded[role_name] = role
+
+    roles = [loaded[name] for name in role_names if name in loaded]
+    errors = [{"name": name, "message": failed[name]} for name in role_names if name in failed]
+    return roles, errors
+
+
+def load_role_privilege_index(session: httpx.Client, refresh: bool = False) -> RolePrivilegeIndex:
+    """
+    Load every role of the Metalake into a privilege index, through the role privileges cache. An index
+    missing some roles is returned but not cached.
+
+    Parameters
+    ----------
+    session : httpx.Client
+        HTTP client
+    refresh : bool
+        Whether to bypass the cached index and roles and load them from Gravitino
+
+    Returns
+    -------
+    RolePrivilegeIndex
+        The privileges of the roles.
+    """
+    url = endpoint_path("roles", metalake_name)
+    cache = get_cache("role_privileges")
+    index = None if refresh else cache.get(url)
+    if index is None:
+        role_names = fetch_json(session, url, _ROLE_NAMES_SPEC).get("names") or []
+        index = RolePrivilegeIndex(*load_roles(session, (f"{name}" for name in role_names), refresh))
+        if not index.errors:
+            cache.set(url, index)
+    return index
+
+
+def load_user_role_index(session: httpx.Client, refresh: bool = False) -> UserRoleIndex:
+    """
+    Load the users of the Metalake and their roles, through the users cache.
+
+    Parameters
+    ----------
+    session : httpx.Client
+        HTTP client
+    refresh : bool
+        Whether to bypass the cached users and load them from Gravitino
+
+    Returns
+    -------
+    UserRoleIndex
+        The users and the roles granted to them.
+    """
+    url = _users_path()
+
+    def _load() -> UserRoleIndex:
+        response_json = fetch_json(session, url, _USERS_SPEC)
+        return UserRoleIndex(User.from_dict(user) for user in response_json.get("users") or [])
+
+    return get_cache("users").get_or_load(url, _load, refresh)
 
 
 def grant_role_to_user(mcp: FastMCP, session: httpx.Client) -> None:
@@ -136,20 +694,7 @@ def grant_role_to_user(mcp: FastMCP, session: httpx.Client) -> None:
         if not role_name:
             return {"result": "error", "message": "role_name cannot be empty"}
 
-        json_data = {"roleNames": [role_name]}
-        try:
-            response = session.put(
-                f"/api/metalakes/{metalake_name}/permissions/users/{user_name}/grant", json=json_data
-            )
-            response.raise_for_status()
-        except httpx.HTTPStatusError as http_err:
-            return {"result": "error", "message": str(http_err)}
-        except Exception as err:
-            return {"result": "error", "message": str(err)}
-
-        return {
-            "result": "success",
-        }
+        return _change_user_roles(session, "grant", user_name, [role_name])
 
 
 def revoke_role_from_user(mcp: FastMCP, session: httpx.Client):
@@ -195,17 +740,214 @@ def revoke_role_from_user(mcp: FastMCP, session: httpx.Client):
         if not role_name:
             return {"result": "error", "message": "role_name cannot be empty"}
 
-        json_data = {"roleNames": [role_name]}
-        try:
-            response = session.put(
-                f"/api/metalakes/{metalake_name}/permissions/users/{user_name}/revoke", json=json_data
-            )
-            response.raise_for_status()
-        except httpx.HTTPStatusError as http_err:
-            return {"result": "error", "message": str(http_err)}
-        except Exception as err:
-            return {"result": "error", "message": str(err)}
+        return _change_user_roles(session, "revoke", user_name, [role_name])
 
-        return {
-            "result": "success",
-        }
+
+def grant_roles_to_users(mcp: FastMCP, session: httpx.Client) -> None:
+    """Grant roles to many users."""
+
+    @mcp.tool(
+        name="grant_roles_to_users",
+        description="grant every given role to every given user, sending one request per user",
+        tags={
+            USER_TAG,
+            ROLE_TAG,
+            PRIVILEGES_TAG,
+            GRANT_OPERATION_TAG,
+            BULK_OPERATION_TAG,
+        },
+        annotations={
+            "readOnlyHint": False,
+            "openWorldHint": True,
+            "destructiveHint": True,
+            "idempotentHint": False,
+        },
+    )
+    def _grant_roles_to_users(user_names: list[str], role_names: list[str]) -> dict[str, Any]:
+        """
+        Grant every role to every user. All roles of a user are granted in a single request, and the
+        requests for different users are sent concurrently.
+
+        Parameters
+        ----------
+        user_names : list[str]
+            The names of the users.
+        role_names : list[str]
+            The names of the roles.
+
+        Returns
+        -------
+        dict[str, Any]
+            A dictionary containing the result of the operation.
+            - result: "success" if the roles were granted to every user, "error" otherwise.
+            - message: A message describing the error, only present if the arguments are invalid.
+            - succeeded: Number of users the roles were granted to.
+            - failed: Number of users the roles could not be granted to.
+            - users: One outcome per user, in the given order, with the keys "name", "result" and
+              "message" (only present if the result is "error").
+        """
+        return _change_roles_of_users(session, "grant", user_names, role_names)
+
+
+def revoke_roles_from_users(mcp: FastMCP, session: httpx.Client) -> None:
+    """Revoke roles from many users."""
+
+    @mcp.tool(
+        name="revoke_roles_from_users",
+        description="revoke every given role from every given user, sending one request per user",
+        tags={
+            USER_TAG,
+            ROLE_TAG,
+            PRIVILEGES_TAG,
+            REVOKE_OPERATION_TAG,
+            BULK_OPERATION_TAG,
+        },
+        annotations={
+            "readOnlyHint": False,
+            "openWorldHint": True,
+            "destructiveHint": True,
+            "idempotentHint": False,
+        },
+    )
+    def _revoke_roles_from_users(user_names: list[str], role_names: list[str]) -> dict[str, Any]:
+        """
+        Revoke every role from every user. All roles of a user are revoked in a single request, and
+        the requests for different users are sent concurrently.
+
+        Parameters
+        ----------
+        user_names : list[str]
+            The names of the users.
+        role_names : list[str]
+            The names of the roles.
+
+        Returns
+        -------
+        dict[str, Any]
+            A dictionary containing the result of the operation.
+            - result: "success" if the roles were revoked from every user, "error" otherwise.
+            - message: A message describing the error, only present if the arguments are invalid.
+            - succeeded: Number of users the roles were revoked from.
+            - failed: Number of users the roles could not be revoked from.
+            - users: One outcome per user, in the given order, with the keys "name", "result" and
+              "message" (only present if the result is "error").
+        """
+        return _change_roles_of_users(session, "revoke", user_names, role_names)
+
+
+def _change_user_roles(
+    session: httpx.Client,
+    action: Literal["grant", "revoke"],
+    user_name: str,
+    role_names: list[str],
+) -> dict[str, str]:
+    """Grant or revoke roles of a user in one request."""
+    outcome = _put_user_roles(session, action, user_name, role_names)
+    if outcome["result"] == "success":
+        _update_cached_user_roles(action, [user_name], role_names)
+    return outcome
+
+
+def _put_user_roles(
+    session: httpx.Client,
+    action: Literal["grant", "revoke"],
+    user_name: str,
+    role_names: list[str],
+) -> dict[str, str]:
+    json_data = {"roleNames": role_names}
+    try:
+        response = session.put(endpoint_path(f"{action}_roles", metalake_name, user_name), json=json_data)
+        response.raise_for_status()
+    except httpx.HTTPStatusError as http_err:
+        return {"result": "error", "message": str(http_err)}
+    except Exception as err:
+        return {"result": "error", "message": str(err)}
+    return {
+        "result": "success",
+    }
+
+
+def _update_cached_user_roles(action: Literal["grant", "revoke"], user_names: list[str], role_names: list[str]) -> None:
+    if user_names:
+        get_cache("users").update(_users_path(), lambda index: index.with_change(action, user_names, role_names))
+
+
+def _change_roles_of_users(
+    session: httpx.Client,
+    action: Literal["grant", "revoke"],
+    user_names: list[str],
+    role_names: list[str],
+) -> dict[str, Any]:
+    """Grant or revoke the same roles of many users, one request per user on the bounded pool."""
+    if not user_names or not all(user_names):
+        return {"result": "error", "message": "user_names cannot be empty"}
+    if not role_names or not all(role_names):
+        return {"result": "error", "message": "role_names cannot be empty"}
+
+    # duplicates would only send the same request twice
+    user_names = list(dict.fromkeys(user_names))
+    role_names = list(dict.fromkeys(role_names))
+
+    outcomes: dict[str, dict[str, str]] = {}
+    for user_name, outcome, error in bounded_map(
+        lambda user_name: _put_user_roles(session, action, user_name, role_names),
+        user_names,
+    ):
+        outcomes[user_name] = outcome or {"result": "error", "message": str(error)}
+
+    users = [{"name": user_name, **outcomes[user_name]} for user_name in user_names]
+    # the cached index is rebuilt once for all the users changed
+    _update_cached_user_roles(action, [user["name"] for user in users if user["result"] == "success"], role_names)
+    failed = sum(1 for user in users if user["result"] != "success")
+    return {
+        "result": "error" if failed else "success",
+        "succeeded": len(users) - failed,
+        "failed": failed,
+        "users": users,
+    }
+
+
+def _users_path() -> str:
+    return endpoint_path("users", metalake_name)
+
+
+def _object_names(fully_qualified_name: str, object_type: str) -> tuple[str, ...]:
+    """The names of a securable object below the Metalake, empty for the Metalake itself."""
+    if object_type not in _SECURABLE_TYPES:
+        raise ValueError(f"object_type must be one of {', '.join(_SECURABLE_TYPES)}")
+    fqn = resolve_fqn(fully_qualified_name, object_type)
+    if fqn.metalake != metalake_name:
+        raise ValueError(f"Invalid fully qualified name {fully_qualified_name!r}: the Metalake is {metalake_name}")
+    return fqn.names
+
+
+def _securable_names(obj: SecurableObject) -> tuple[str, ...]:
+    if (obj.type or "").lower() == "metalake" or not obj.full_name:
+        return ()
+    try:
+        return split_fqn(obj.full_name)
+    except ValueError:
+        return (obj.full_name,)
+
+
+def _ancestor_names(names: tuple[str, ...]) -> list[tuple[str, ...]]:
+    """The names of the Metalake, catalog, schema and table (or other leaf) an object is part of."""
+    # columns are not securable, their privileges are those of their table
+    return [names[:level] for level in range(min(len(names), 3) + 1)]
+
+
+def _required_privileges(privilege: str, names: tuple[str, ...]) -> list[tuple[str, tuple[str, ...]]]:
+    """The privileges needed to use ``privilege`` on the object with ``names``, with the names they are needed on."""
+    required = []
+    if len(names) >= 2 and not _privilege_matches("use_catalog", privilege):
+        required.append(("use_catalog", names[:1]))
+    if len(names) >= 3 and not _privilege_matches("use_schema", privilege):
+        required.append(("use_schema", names[:2]))
+    required.append((privilege, names))
+    return required
+
+
+def _privilege_matches(name: Optional[str], privilege: str) -> bool:
+    name = (name or "").lower()
+    privilege = privilege.lower()
+    return name == privilege or name.startswith(f"{privilege}_")
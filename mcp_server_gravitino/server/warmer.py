@@ -0,0 +1,102 @@
+# Copyright 2024 Datastrato Pvt Ltd.
+# This software is licensed under the Apache License version 2.
+
+# Background cache warming. While no tool is called, the catalogs, their schemas and the most requested
+# tables are refreshed in the caches, so the common calls of the clients are cache hits.
+import logging
+import threading
+from typing import Callable, Optional
+
+import httpx
+
+from mcp_server_gravitino.server.access import get_access_counter
+from mcp_server_gravitino.server.limits import RateLimitExceeded
+from mcp_server_gravitino.server.scheduler import call_scope, idle_seconds
+from mcp_server_gravitino.server.settings import get_settings
+from mcp_server_gravitino.server.tools.catalog import load_catalogs
+from mcp_server_gravitino.server.tools.schema import load_schemas
+from mcp_server_gravitino.server.tools.table import load_table
+
+# factor the table request counts are multiplied by after each round, so recent requests weigh more
+_DECAY = 0.9
+
+logger = logging.getLogger(__name__)
+
+
+class CacheWarmer:
+    """Refreshes the cached catalogs, schemas and most requested tables on a daemon thread."""
+
+    def __init__(self, session: httpx.Client):
+        self._session = session
+        self._settings = get_settings()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="cache-warmer", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def warm(self) -> int:
+        """
+        Run a round, unless the server is busy. The round stops early once its request budget is spent,
+        a tool is called or a request is rejected by an endpoint limit. The requests are sent in the bulk
+        priority class.
+
+        Returns
+        -------
+        int
+            The number of requests sent.
+        """
+        settings = self._settings
+        sent = 0
+
+        def _send(load: Callable[[], object]) -> bool:
+            nonlocal sent
+            if sent >= settings.cache_warmer_budget or idle_seconds() < settings.cache_warmer_idle:
+                return False
+            sent += 1
+            try:
+                load()
+            except RateLimitExceeded:
+                # Gravitino is busy with the calls of the clients, the next round tries again
+                return False
+            except (httpx.HTTPError, ValueError):
+                # e.g. a table dropped since it was requested, the next entries are still warmed
+                pass
+            return True
+
+        with call_scope("bulk", "cache warmer"):
+            catalogs: tuple = ()
+
+            def _load_catalogs() -> None:
+                nonlocal catalogs
+                catalogs = load_catalogs(self._session, refresh=True)
+
+            if not _send(_load_catalogs):
+                return sent
+            for catalog in catalogs:
+                if not _send(lambda: load_schemas(self._session, catalog.name, True)):
+                    return sent
+            for fully_qualified_name in get_access_counter().most_common(settings.cache_warmer_tables):
+                if not _send(lambda: load_table(self._session, fully_qualified_name, True)):
+                    return sent
+        return sent
+
+    def _run(self) -> None:
+        counter = get_access_counter()
+        # the first round runs at start, before the first calls of the clients
+        while True:
+            try:
+                if self.warm():
+                    counter.decay(_DECAY)
+                    counter.save()
+            except Exception:
+                # a failed round must not stop the warmer
+                logger.exception("Cache warming round failed")
+            if self._stopped.wait(self._settings.cache_warmer_interval):
+                return
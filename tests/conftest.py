@@ -0,0 +1,31 @@
+import json
+
+import pytest
+from fastmcp import Client, FastMCP
+
+from mcp_server_gravitino.server.settings import get_settings
+
+
+@pytest.fixture
+def settings(monkeypatch):
+    """Settings of an in-process server, with the environment variables set by ``monkeypatch``."""
+    monkeypatch.setenv("GRAVITINO_URI", "http://localhost:8090")
+    monkeypatch.setenv("GRAVITINO_USERNAME", "admin")
+    monkeypatch.setenv("GRAVITINO_PASSWORD", "admin")
+    get_settings.cache_clear()
+    yield get_settings()
+    get_settings.cache_clear()
+
+
+@pytest.fixture
+def call_tool(settings):
+    """Call a tool of an in-process server, returning its decoded result."""
+
+    async def _call_tool(register_tool, session, name, **arguments):
+        mcp = FastMCP("test")
+        register_tool(mcp, session)
+        async with Client(mcp) as client:
+            content = await client.call_tool(name, arguments)
+        return json.loads(content[0].text)
+
+    return _call_tool
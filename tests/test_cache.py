@@ -0,0 +1,137 @@
+import threading
+import time
+
+from mcp_server_gravitino.server import cache as cache_module
+from mcp_server_gravitino.server.cache import ImmutableCache, TTLCache, get_cache
+
+
+def test_ttl_cache_update_keeps_missing_keys_missing():
+    cache = TTLCache(ttl=60, max_entries=10)
+    cache.set("a", (1,))
+    cache.update("a", lambda value: value + (2,))
+    cache.update("b", lambda value: value + (2,))
+    assert cache.get("a") == (1, 2)
+    assert cache.get("b") is None
+
+
+def test_immutable_cache_is_persisted(tmp_path):
+    path = tmp_path / "model_versions.jsonl"
+    cache = ImmutableCache(max_entries=10, path=path)
+    cache.set("v1", {"version": 1})
+    cache.set("v2", {"version": 2})
+    with path.open("a", encoding="utf-8") as file:
+        file.write('{"key": "v3", "val')
+
+    reloaded = ImmutableCache(max_entries=1, path=path)
+    assert len(reloaded) == 1
+    assert reloaded.get("v2") == {"version": 2}
+
+
+def test_ttl_cache_serves_stale_while_revalidating():
+    cache = TTLCache(ttl=0.05, max_entries=10, grace=60)
+    loaded = threading.Event()
+
+    def _load():
+        loaded.set()
+        return "new"
+
+    cache.set("a", "old")
+    time.sleep(0.06)
+    assert cache.get("a") is None
+    assert cache.get_or_load("a", _load) == "old"
+    assert loaded.wait(1)
+    time.sleep(0.01)
+    assert cache.get_or_load("a", lambda: "unused") == "new"
+    stats = cache.stats()
+    assert (stats["hits"], stats["staleHits"], stats["misses"]) == (1, 1, 1)
+    assert stats["maxStaleSeconds"] > 0
+
+
+def test_get_cache_max_entries_overrides_settings(settings, monkeypatch):
+    monkeypatch.setattr(settings, "cache_max_entries", 0)
+    assert not get_cache("test_metadata").enabled
+    results = get_cache("test_results", ttl=60, max_entries=2)
+    results.set("a", 1)
+    assert results.get("a") == 1
+
+
+def test_ttl_cache_reloads_on_shared_threads():
+    cache = TTLCache(ttl=0.2, max_entries=100, grace=60)
+    release = threading.Event()
+    threads = set()
+
+    def _load():
+        threads.add(threading.current_thread().name)
+        release.wait(1)
+        return "new"
+
+    for key in range(20):
+        cache.set(key, "old")
+    time.sleep(0.21)
+    for key in range(20):
+        assert cache.get_or_load(key, _load) == "old"
+    release.set()
+    deadline = time.monotonic() + 2
+    while cache._refreshing and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert all(cache.get(key) == "new" for key in range(20))
+    assert 0 < len(threads) <= cache_module._REFRESH_WORKERS
+
+
+def test_ttl_cache_forced_load_wins_over_older_reload():
+    cache = TTLCache(ttl=0.2, max_entries=10, grace=60)
+    started, release = threading.Event(), threading.Event()
+
+    def _slow_load():
+        started.set()
+        release.wait(1)
+        return "old reload"
+
+    cache.set("a", "old")
+    time.sleep(0.21)
+    assert cache.get_or_load("a", _slow_load) == "old"
+    assert started.wait(1)
+    assert cache.get_or_load("a", lambda: "new", refresh=True) == "new"
+    release.set()
+    time.sleep(0.05)
+    assert cache.get("a") == "new"
+
+
+def test_ttl_cache_reload_survives_miss_of_another_key():
+    cache = TTLCache(ttl=0.05, max_entries=10, grace=60)
+    started, release = threading.Event(), threading.Event()
+
+    def _slow_load():
+        started.set()
+        release.wait(1)
+        return "a2"
+
+    cache.set("a", "a1")
+    time.sleep(0.06)
+    assert cache.get_or_load("a", _slow_load) == "a1"
+    assert started.wait(1)
+    assert cache.get_or_load("b", lambda: "b1") == "b1"
+    cache.invalidate("c")
+    release.set()
+    deadline = time.monotonic() + 1
+    while cache._refreshing and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert cache.get_or_load("a", lambda: "unused") == "a2"
+
+
+def test_immutable_cache_file_is_compacted(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_module, "_COMPACT_MIN_LINES", 4)
+    path = tmp_path / "model_versions.jsonl"
+    cache = ImmutableCache(max_entries=2, path=path)
+    for version in range(10):
+        cache.set(f"v{version}", {"version": version})
+    assert len(path.read_text(encoding="utf-8").splitlines()) < 4
+
+    with path.open("a", encoding="utf-8") as file:
+        file.write('{"key":"v9","value":{"version":9}}\n' * 5)
+    reloaded = ImmutableCache(max_entries=2, path=path)
+    assert path.read_text(encoding="utf-8").splitlines() == [
+        '{"key":"v8","value":{"version":8}}',
+        '{"key":"v9","value":{"version":9}}',
+    ]
+    assert reloaded.get("v8") == {"version": 8}
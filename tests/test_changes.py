@@ -0,0 +1,74 @@
+import httpx
+
+from mcp_server_gravitino.server.snapshots import Snapshot
+from mcp_server_gravitino.server.tools import metalake_name
+from mcp_server_gravitino.server.tools.changes import _capture, _diff
+
+
+def test_changed_definitions_detect_altered_columns(settings):
+    schema_path = f"/api/metalakes/{metalake_name}/catalogs/c/schemas/s"
+    tables = {
+        "orders": {"name": "orders", "columns": [{"name": "id", "type": "long"}]},
+        "users": {"name": "users", "columns": [{"name": "id", "type": "long"}]},
+    }
+    for table in tables.values():
+        table["audit"] = {"createTime": "2024-01-01T00:00:00Z"}
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == f"/api/metalakes/{metalake_name}/catalogs":
+            return httpx.Response(200, json={"catalogs": [{"name": "c", "type": "relational"}]})
+        if path == f"/api/metalakes/{metalake_name}/catalogs/c/schemas":
+            return httpx.Response(200, json={"identifiers": [{"name": "s"}]})
+        if path == f"{schema_path}/tables":
+            return httpx.Response(200, json={"identifiers": [{"name": name} for name in tables]})
+        return httpx.Response(200, json={"table": tables[path.rsplit("/", 1)[-1]]})
+
+    session = httpx.Client(base_url=settings.uri, transport=httpx.MockTransport(_handler))
+
+    def _snapshot(base):
+        snapshot = Snapshot.create(definitions="changed")
+        _capture(session, snapshot, base, [])
+        return snapshot
+
+    # the modification times are recorded from the second snapshot on
+    first = _snapshot(None)
+    second = _snapshot(first)
+    assert _diff(first, second) == ([], [], [])
+
+    tables["orders"]["columns"].append({"name": "amount", "type": "decimal(10,2)"})
+    tables["orders"]["audit"]["lastModifiedTime"] = "2024-02-01T00:00:00Z"
+    third = _snapshot(second)
+    assert _diff(second, third) == ([], [], [{"type": "table", "fullyQualifiedName": f"{metalake_name}.c.s.orders"}])
+    assert third.entries["definition:c.s.users"] == second.entries["definition:c.s.users"]
+
+
+def test_changes_quote_names_with_dots(settings):
+    tables = {"t.x": {"name": "t.x", "columns": [{"name": "id", "type": "long"}]}}
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        names = request.url.path.split("/")
+        if names[-1] == "catalogs":
+            return httpx.Response(200, json={"catalogs": [{"name": "c.1", "type": "relational"}]})
+        if names[-1] == "schemas":
+            return httpx.Response(200, json={"identifiers": [{"name": "s"}]})
+        if names[-1] == "tables":
+            return httpx.Response(200, json={"identifiers": [{"name": name} for name in tables]})
+        return httpx.Response(200, json={"table": tables[names[-1]]})
+
+    session = httpx.Client(base_url=settings.uri, transport=httpx.MockTransport(_handler))
+    first = Snapshot.create(catalog_names=["c.1"], definitions="all")
+    _capture(session, first, None, [])
+    assert "definition:`c.1`.s.`t.x`" in first.entries
+
+    tables["t.x"]["columns"].append({"name": "amount", "type": "decimal(10,2)"})
+    tables["new.t"] = {"name": "new.t", "columns": []}
+    errors = []
+    second = Snapshot.create(catalog_names=["c.1"], definitions="all")
+    _capture(session, second, first, errors)
+    assert errors == []
+    assert _diff(first, second) == (
+        [{"type": "table", "fullyQualifiedName": f"{metalake_name}.`c.1`.s.`new.t`"}],
+        [],
+        [{"type": "table", "fullyQualifiedName": f"{metalake_name}.`c.1`.s.`t.x`"}],
+    )
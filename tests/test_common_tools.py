@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+from mcp_server_gravitino.server.tools.common_tools import (
+    first_results_page,
+    paginate_within_budget,
+    resolve_fqn,
+    results_page,
+    split_fqn,
+)
+
+
+def test_split_fqn_with_quoted_names():
+    assert split_fqn("catalog.`my.schema`.`a``b`") == ("catalog", "my.schema", "a`b")
+    for fqn in ["catalog..table", "`catalog", "`catalog`schema"]:
+        with pytest.raises(ValueError):
+            split_fqn(fqn)
+
+
+def test_resolve_fqn_with_optional_metalake():
+    table = resolve_fqn("demo.catalog.`my.schema`.table", "table")
+    assert table.metalake == "demo"
+    assert table.path == "/api/metalakes/demo/catalogs/catalog/schemas/my.schema/tables/table"
+    assert str(table) == "demo.catalog.`my.schema`.table"
+    assert resolve_fqn("catalog.schema.table", "table").names == ("catalog", "schema", "table")
+    with pytest.raises(ValueError):
+        resolve_fqn("catalog.schema", "table")
+
+
+def test_resolve_fqn_infers_type():
+    assert [resolve_fqn(fqn).type for fqn in ["m", "m.c", "m.c.s", "m.c.s.t", "m.c.s.t.col"]] == [
+        "metalake",
+        "catalog",
+        "schema",
+        "table",
+        "column",
+    ]
+    assert resolve_fqn("m.c.s.t.col").object_name == "c.s.t.col"
+    assert resolve_fqn("m.c.s") is resolve_fqn("m.c.s")
+
+
+def test_paginate_within_budget_stops_before_budget():
+    encoded = []
+
+    def _encode(index):
+        encoded.append(index)
+        return {"name": f"column_{index}"}
+
+    page, counts, next_offset = paginate_within_budget(range(100), _encode, max_bytes=100, offset=10)
+    assert len(json.dumps(page, separators=(",", ":"))) <= 100 < len(json.dumps(page + [page[0]]))
+    assert counts == {"total": 100, "returned": len(page), "remaining": 90 - len(page)}
+    assert next_offset == 10 + len(page)
+    # only the items of the page and the one exceeding the budget are encoded
+    assert encoded == list(range(10, next_offset + 1))
+
+    assert paginate_within_budget(range(3), _encode, max_items=2, max_bytes=1)[1:] == (
+        {"total": 3, "returned": 1, "remaining": 2},
+        1,
+    )
+    assert paginate_within_budget(range(3), _encode, max_items=5, offset=1)[2] is None
+
+
+def test_results_are_paged_by_token(settings, monkeypatch):
+    monkeypatch.setattr(settings, "cache_max_entries", 0)
+    page = first_results_page("test_results", {"result": "success", "items": [1, 2, 3]}, 2)
+    assert page["items"] == [1, 2]
+    page = results_page("test_results", page["nextPageToken"], 2, "expired")
+    assert page["items"] == [3] and "nextPageToken" not in page
+
+    assert results_page("test_results", "1", 2, "expired")["message"] == "page_token is invalid"
+    assert results_page("test_results", "unknown:2", 2, "expired") == {"result": "error", "message": "expired"}
@@ -0,0 +1,52 @@
+import os
+
+import httpx
+import pytest
+
+from mcp_server_gravitino.server.cache import get_cache
+from mcp_server_gravitino.server.tools import metalake_name
+from mcp_server_gravitino.server.tools.crawl import _crawl, _export_path
+
+
+def test_export_path_stays_in_export_dir(settings, monkeypatch, tmp_path):
+    with pytest.raises(ValueError, match="disabled"):
+        _export_path("crawl.jsonl")
+
+    export_dir = tmp_path / "exports"
+    monkeypatch.setattr(settings, "export_dir", str(export_dir))
+    assert _export_path("a/crawl.jsonl") == (export_dir / "a" / "crawl.jsonl").resolve()
+    assert (export_dir / "a").is_dir()
+
+    os.symlink(tmp_path, export_dir / "outside")
+    for output_path in ["/tmp/crawl.jsonl", "../crawl.jsonl", "a/../../crawl.jsonl", "outside/crawl.jsonl", "."]:
+        with pytest.raises(ValueError):
+            _export_path(output_path)
+
+
+def test_crawl_quotes_names_with_dots(settings):
+    loaded = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        names = request.url.path.split("/")
+        if names[-1] == "catalogs":
+            return httpx.Response(200, json={"catalogs": [{"name": "c.1", "type": "relational"}]})
+        if names[-1] == "schemas":
+            return httpx.Response(200, json={"identifiers": [{"name": "s", "namespace": [metalake_name, "c.1"]}]})
+        if names[-1] == "tables":
+            namespace = [metalake_name, "c.1", "s"]
+            return httpx.Response(200, json={"identifiers": [{"name": "t.x", "namespace": namespace}]})
+        loaded.append(request.url.path)
+        return httpx.Response(200, json={"table": {"name": names[-1], "columns": []}})
+
+    session = httpx.Client(base_url=settings.uri, transport=httpx.MockTransport(_handler))
+    for cache in ("catalogs", "schemas", "tables", "table_details"):
+        get_cache(cache).invalidate()
+    items = []
+    summary = _crawl(session, None, True, items.append, lambda done, total: None)
+    assert summary["errors"] == []
+    assert [(item["type"], item["fullyQualifiedName"]) for item in items] == [
+        ("catalog", f"{metalake_name}.`c.1`"),
+        ("schema", f"{metalake_name}.`c.1`.s"),
+        ("table", f"{metalake_name}.`c.1`.s.`t.x`"),
+    ]
+    assert loaded == [f"/api/metalakes/{metalake_name}/catalogs/c.1/schemas/s/tables/t.x"]
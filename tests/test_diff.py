@@ -0,0 +1,82 @@
+import httpx
+
+from mcp_server_gravitino.server.cache import get_cache
+from mcp_server_gravitino.server.entities import Table
+from mcp_server_gravitino.server.snapshots import content_hash
+from mcp_server_gravitino.server.tools import metalake_name
+from mcp_server_gravitino.server.tools.diff import _diff, _fingerprint, diff_table_definitions
+
+
+def test_diff_table_definitions():
+    source = Table.from_dict(
+        {
+            "name": "orders",
+            "columns": [
+                {"name": "id", "type": "long"},
+                {"name": "amount", "type": "decimal(10,2)"},
+                {"name": "legacy", "type": "string"},
+            ],
+        }
+    )
+    target = Table.from_dict(
+        {
+            "name": "orders",
+            "columns": [
+                {"name": "id", "type": "long"},
+                {"name": "amount", "type": "decimal(12,2)", "nullable": False},
+                {"name": "channel", "type": "string"},
+            ],
+        }
+    )
+
+    diff = diff_table_definitions(source, target)
+    assert not diff["identical"]
+    assert [column["name"] for column in diff["added"]] == ["channel"]
+    assert [column["name"] for column in diff["removed"]] == ["legacy"]
+    assert diff["changed"] == [
+        {
+            "name": "amount",
+            "type": {"source": "decimal(10,2)", "target": "decimal(12,2)"},
+            "nullable": {"source": None, "target": False},
+        }
+    ]
+    assert diff_table_definitions(source, source)["identical"]
+
+
+def test_diff_namespaces_quotes_names_with_dots(settings):
+    tables = {
+        "c1": {"t": [{"name": "id", "type": "long"}]},
+        "c2": {"t": [{"name": "id", "type": "string"}], "new.t": []},
+    }
+    loaded = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        names = request.url.path.split("/")
+        catalog = names[5]
+        if names[-1] == "schemas":
+            return httpx.Response(200, json={"identifiers": [{"name": "my.schema"}]})
+        if names[-1] == "tables":
+            return httpx.Response(200, json={"identifiers": [{"name": name} for name in tables[catalog]]})
+        loaded.append(request.url.path)
+        return httpx.Response(200, json={"table": {"name": names[-1], "columns": tables[catalog][names[-1]]}})
+
+    session = httpx.Client(base_url=settings.uri, transport=httpx.MockTransport(_handler))
+    for cache in ("schemas", "tables", "table_details"):
+        get_cache(cache).invalidate()
+    summary = _diff(session, ("c1",), ("c2",), lambda done, total: None)
+    assert summary["errors"] == []
+    assert [(item["name"], item["status"]) for item in summary["items"]] == [
+        ("`my.schema`.`new.t`", "added"),
+        ("`my.schema`.t", "changed"),
+    ]
+    assert sorted(loaded) == [
+        f"/api/metalakes/{metalake_name}/catalogs/{catalog}/schemas/my.schema/tables/t" for catalog in ("c1", "c2")
+    ]
+
+
+def test_table_fingerprint_hashes_column_values():
+    table = Table.from_dict({"name": "orders", "columns": [{"name": "id", "type": "long", "nullable": False}]})
+    assert _fingerprint(table) == content_hash(
+        [{"name": "id", "type": "long", "comment": None, "nullable": False, "auto_increment": None}]
+    )
+    assert _fingerprint(table) != _fingerprint(Table.from_dict({"name": "orders", "columns": [{"name": "id"}]}))
@@ -0,0 +1,15 @@
+from mcp_server_gravitino.server.endpoints import endpoint_label, endpoint_path
+
+
+def test_endpoint_path_is_percent_encoded():
+    assert endpoint_path("table", "demo", "catalog", "my schema", "a/b") == (
+        "/api/metalakes/demo/catalogs/catalog/schemas/my%20schema/tables/a%2Fb"
+    )
+    assert endpoint_path("catalogs", "demo") == "/api/metalakes/demo/catalogs?details=true"
+
+
+def test_endpoint_label():
+    assert endpoint_label(endpoint_path("table", "demo", "catalog", "schema", "a/b")) == "table"
+    assert endpoint_label("/api/metalakes/demo/catalogs") == "catalogs"
+    assert endpoint_label("/api/metalakes/demo/objects/table/catalog.schema.table/tags") == "object_tags"
+    assert endpoint_label("/api/unknown") is None
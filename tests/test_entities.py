@@ -0,0 +1,53 @@
+from mcp_server_gravitino.server.entities import ModelVersion, NameIdentifier, Role, Schema, Table, User
+from mcp_server_gravitino.server.tools.common_tools import resolve_fqn
+
+
+def test_entities_tolerate_missing_keys():
+    assert Table.from_dict(None) == Table(name=None)
+    assert ModelVersion.from_dict({"version": 1}).creator is None
+    assert User.from_dict({"name": "alice", "roles": None}).roles == ()
+
+
+def test_name_identifier_to_dict():
+    ident = NameIdentifier.from_dict({"name": "orders", "namespace": ["metalake", "catalog", "sales"]})
+    assert ident.to_dict() == {
+        "name": "orders",
+        "namespace": "metalake.catalog.sales",
+        "fullyQualifiedName": "metalake.catalog.sales.orders",
+    }
+    assert Schema.from_dict({"name": "sales", "namespace": ["metalake", "catalog"]}).to_dict() == {
+        "name": "sales",
+        "namespace": "metalake.catalog",
+    }
+
+
+def test_name_identifier_quotes_names_with_dots():
+    ident = NameIdentifier.from_dict({"name": "t.x", "namespace": ["metalake", "catalog", "s.y"]})
+    assert ident.namespace_name == "metalake.catalog.`s.y`"
+    assert ident.fully_qualified_name == "metalake.catalog.`s.y`.`t.x`"
+    assert resolve_fqn(ident.fully_qualified_name, "table").names == ("catalog", "s.y", "t.x")
+
+
+def test_table_columns_are_decoded_once():
+    table = Table.from_dict({"name": "t", "columns": [{"name": "id", "type": "long", "autoIncrement": True}]})
+    assert table.columns[0].to_dict()["autoIncrement"] is True
+    assert not hasattr(table, "__dict__")
+
+
+def test_role_securable_objects():
+    role = Role.from_dict(
+        {
+            "name": "analyst",
+            "securableObjects": [
+                {
+                    "fullName": "catalog",
+                    "type": "catalog",
+                    "privileges": [{"name": "use_catalog", "condition": "allow"}],
+                }
+            ],
+        }
+    )
+    assert role.to_dict() == {"name": "analyst"}
+    assert role.to_dict(details=True)["securableObjects"][0]["privileges"] == [
+        {"name": "use_catalog", "condition": "allow"}
+    ]
@@ -0,0 +1,37 @@
+import httpx
+import pytest
+
+from mcp_server_gravitino.server.tools import get_filesets_in_schema, get_list_of_topics, metalake_name
+
+
+@pytest.mark.asyncio
+async def test_names_with_dots_are_quoted(settings, call_tool):
+    paths = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path.endswith("/topics"):
+            return httpx.Response(
+                200, json={"identifiers": [{"namespace": [metalake_name, "kafka", "my.schema"], "name": "events"}]}
+            )
+        return httpx.Response(200, json={"fileset": {"name": "raw.logs", "storageLocation": "hdfs://logs"}})
+
+    session = httpx.Client(base_url=settings.uri, transport=httpx.MockTransport(_handler))
+    result = await call_tool(
+        get_filesets_in_schema,
+        session,
+        "get_filesets_in_schema",
+        catalog_name="files",
+        schema_name="my.schema",
+        fileset_names=["raw.logs"],
+    )
+    assert result["errors"] == []
+    assert [fileset["fullyQualifiedName"] for fileset in result["filesets"]] == [
+        f"{metalake_name}.files.`my.schema`.`raw.logs`"
+    ]
+    assert paths == [f"/api/metalakes/{metalake_name}/catalogs/files/schemas/my.schema/filesets/raw.logs"]
+
+    topics = await call_tool(
+        get_list_of_topics, session, "get_list_of_topics", catalog_name="kafka", schema_name="my.schema"
+    )
+    assert [topic["fullyQualifiedName"] for topic in topics] == [f"{metalake_name}.kafka.`my.schema`.events"]
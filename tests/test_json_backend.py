@@ -0,0 +1,22 @@
+import pytest
+
+from mcp_server_gravitino.server import json_backend
+
+
+@pytest.mark.skipif(json_backend.msgspec is None, reason="msgspec is not installed")
+def test_typed_decoders_are_bounded():
+    for i in range(json_backend._MAX_TYPED_DECODERS + 10):
+        assert json_backend.decode_typed(b'{"name": "t", "x": 1}', {"name": True}) == {"name": "t"}
+    assert len(json_backend._typed_decoders) <= json_backend._MAX_TYPED_DECODERS
+
+
+def test_dumps_encodes_wide_integers():
+    assert json_backend.dumps({"id": 2**70, "name": "t"}, indent=False) == '{"id":1180591620717411303424,"name":"t"}'
+
+
+def test_malformed_json_raises_value_error():
+    with pytest.raises(ValueError):
+        json_backend.loads(b'{"name": ')
+    if json_backend.msgspec is not None:
+        with pytest.raises(ValueError):
+            json_backend.decode_typed(b'{"name": ', {"name": True})
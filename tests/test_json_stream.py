@@ -0,0 +1,71 @@
+import json
+
+import pytest
+
+from mcp_server_gravitino.server.json_stream import decode_json, project_json, project_value
+
+TABLE_RESPONSE = {
+    "code": 0,
+    "table": {
+        "name": 'tab"le\\',
+        "comment": None,
+        "properties": {"format": "[{", "location": "}]"},
+        "columns": [
+            {
+                "name": f"col_{i}",
+                "type": {"type": "struct", "fields": [{"name": "x", "type": "integer"}]},
+                "nullable": i % 2 == 0,
+                "defaultValue": [1, 2.5e3, -3, "ünïcode"],
+            }
+            for i in range(20)
+        ],
+        "rowCount": 12345678901234567890,
+    },
+}
+TABLE_SPEC = {
+    "table": {
+        "name": True,
+        "comment": True,
+        "rowCount": True,
+        "columns": [{"name": True, "type": True, "nullable": True}],
+    }
+}
+
+
+def _chunks(document, size: int):
+    data = json.dumps(document, ensure_ascii=False).encode()
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 17, 4096])
+def test_project_json_matches_decoded_projection(chunk_size):
+    expected = project_value(TABLE_RESPONSE, TABLE_SPEC)
+    assert project_json(_chunks(TABLE_RESPONSE, chunk_size), TABLE_SPEC) == expected
+    assert "properties" not in expected["table"]
+    assert set(expected["table"]["columns"][0]) == {"name", "type", "nullable"}
+
+
+def test_project_json_keeps_whole_document():
+    assert project_json(_chunks(TABLE_RESPONSE, 5), True) == TABLE_RESPONSE
+
+
+def test_project_json_keeps_value_with_unexpected_shape():
+    document = {"identifiers": None, "extra": [{"a": 1}]}
+    assert project_json(_chunks(document, 2), {"identifiers": [{"name": True}]}) == {"identifiers": None}
+
+
+def test_project_json_rejects_truncated_document():
+    data = json.dumps(TABLE_RESPONSE).encode()[:-10]
+    with pytest.raises(json.JSONDecodeError):
+        project_json([data], TABLE_SPEC)
+
+
+def test_decode_json_matches_streaming_projection():
+    data = json.dumps(TABLE_RESPONSE).encode()
+    assert decode_json(data, TABLE_SPEC) == project_json([data], TABLE_SPEC)
+    assert decode_json(data) == TABLE_RESPONSE
+
+
+def test_decode_json_falls_back_on_unexpected_shape():
+    data = json.dumps({"identifiers": {"name": "not-a-list"}}).encode()
+    assert decode_json(data, {"identifiers": [{"name": True}]}) == {"identifiers": {"name": "not-a-list"}}
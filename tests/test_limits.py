@@ -0,0 +1,78 @@
+import threading
+import time
+
+import httpx
+import pytest
+
+from mcp_server_gravitino.server import limits
+from mcp_server_gravitino.server.limits import Limiter, RateLimitExceeded
+
+
+def test_limiter_rejects_over_rate_with_retry_hint():
+    limiter = Limiter("tool", rate=2)
+    limiter.acquire()
+    limiter.acquire()
+    with pytest.raises(RateLimitExceeded) as info:
+        limiter.acquire(max_wait=0.1)
+    assert 0.1 < info.value.retry_after <= 0.5
+    assert info.value.to_dict()["retryAfterSeconds"] == round(info.value.retry_after, 3)
+
+
+def test_limiter_serves_cheapest_waiter_first():
+    limiter = Limiter("endpoint", max_in_flight=1)
+    limiter.acquire()
+    served = []
+
+    def _call(cost: int) -> None:
+        limiter.acquire(cost, max_wait=5)
+        served.append(cost)
+        limiter.release()
+
+    threads = [threading.Thread(target=_call, args=(cost,)) for cost in (3, 1)]
+    for thread in threads:
+        thread.start()
+        time.sleep(0.05)
+    limiter.release()
+    for thread in threads:
+        thread.join()
+    assert served == [1, 3]
+
+
+def test_idle_limiters_are_dropped(settings, monkeypatch):
+    monkeypatch.setattr(settings, "tool_rate_limits", {"*": 100.0})
+    monkeypatch.setattr(limits, "_LIMITER_IDLE_TTL", 0.05)
+    monkeypatch.setattr(limits, "_limiters", {})
+    busy = limits.get_limiter("tool", "list_of_tables", "busy")
+    busy.acquire()
+    idle = limits.get_limiter("tool", "list_of_tables", "gone")
+    idle.acquire()
+
+    time.sleep(0.1)
+    busy.acquire()
+    limits.get_limiter("tool", "list_of_tables", "new")
+    assert set(limits._limiters) == {("tool", "list_of_tables", "busy"), ("tool", "list_of_tables", "new")}
+    assert limits.get_limiter("tool", "list_of_tables", "gone") is not idle
+
+
+def test_endpoint_limit_raises_transport_error(settings, monkeypatch):
+    monkeypatch.setattr(settings, "endpoint_rate_limits", {"*": 1.0})
+    monkeypatch.setattr(settings, "limit_max_wait", 0.0)
+    monkeypatch.setattr(limits, "_limiters", {})
+    transport = limits.LimitedTransport(httpx.MockTransport(lambda request: httpx.Response(200, json={})))
+    session = httpx.Client(base_url=settings.uri, transport=transport)
+    session.get("/api/metalakes")
+    with pytest.raises(httpx.TransportError) as info:
+        session.get("/api/metalakes")
+    assert isinstance(info.value, RateLimitExceeded)
+    assert info.value.request.url.path == "/api/metalakes"
+
+
+def test_limiter_refunds_token_when_no_slot_is_freed():
+    limiter = Limiter("endpoint", rate=1, max_in_flight=1)
+    limiter.acquire()
+    time.sleep(1.0)
+    with pytest.raises(RateLimitExceeded):
+        limiter.acquire(max_wait=0.05)
+    limiter.release()
+    # the token of the rejected call is still available
+    limiter.acquire(max_wait=0.0)
@@ -0,0 +1,40 @@
+import httpx
+
+from mcp_server_gravitino.server.cache import get_cache
+from mcp_server_gravitino.server.tools import metalake_name
+from mcp_server_gravitino.server.tools.models import load_model_version_numbers, load_model_versions
+
+
+def test_model_versions_are_served_from_immutable_cache(settings):
+    model_path = f"/api/metalakes/{metalake_name}/catalogs/c/schemas/s/models/versioned"
+    aliases = {1: ["old"], 2: ["prod"]}
+    paths = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path == f"{model_path}/versions":
+            infos = [{"version": version, "aliases": names} for version, names in aliases.items()]
+            return httpx.Response(200, json={"infos": infos})
+        version = int(request.url.path.rsplit("/", 1)[-1])
+        model_version = {"version": version, "aliases": aliases[version], "uri": f"s3://models/{version}"}
+        return httpx.Response(200, json={"modelVersion": model_version})
+
+    session = httpx.Client(base_url=settings.uri, transport=httpx.MockTransport(_handler))
+    assert load_model_version_numbers(session, "c.s.versioned") == (1, 2)
+    assert [version.aliases for version in load_model_versions(session, "c.s.versioned", [1, 2])] == [
+        ("old",),
+        ("prod",),
+    ]
+    assert sorted(paths) == [f"{model_path}/versions", f"{model_path}/versions/1", f"{model_path}/versions/2"]
+
+    # once the aliases expire, they are reloaded from the list of versions only
+    aliases.update({1: ["prod"], 2: []})
+    get_cache("model_version_aliases").invalidate()
+    get_cache("model_versions").invalidate()
+    paths.clear()
+    versions = load_model_versions(session, "c.s.versioned", [1, 2])
+    assert [(version.uri, version.aliases) for version in versions] == [
+        ("s3://models/1", ("prod",)),
+        ("s3://models/2", ()),
+    ]
+    assert paths == [f"{model_path}/versions"]
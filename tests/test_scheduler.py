@@ -0,0 +1,50 @@
+import threading
+import time
+
+import httpx
+import pytest
+
+from mcp_server_gravitino.server.scheduler import FairSlots, idle_seconds, priority_class, tool_call
+
+
+def test_priority_class():
+    assert priority_class({"bulk operation"}, {"readOnlyHint": False}) == "bulk"
+    assert priority_class({"tags"}, {"readOnlyHint": False}) == "write"
+    assert priority_class({"tables"}, {"readOnlyHint": True}) == "interactive"
+
+
+def test_fair_slots_take_turns_between_clients():
+    slots = FairSlots(1)
+    slots.acquire()
+    served = []
+
+    def _request(client: str) -> None:
+        slots.acquire(client)
+        served.append(client)
+        slots.release()
+
+    threads = [threading.Thread(target=_request, args=(client,)) for client in ("a", "a", "a", "b")]
+    for thread in threads:
+        thread.start()
+        time.sleep(0.05)
+    slots.release()
+    for thread in threads:
+        thread.join()
+    assert served == ["a", "b", "a", "a"]
+
+
+def test_idle_seconds():
+    with tool_call("interactive"):
+        assert idle_seconds() == 0
+    time.sleep(0.05)
+    assert 0.05 <= idle_seconds() < 1
+
+
+def test_fair_slots_wait_times_out():
+    slots = FairSlots(1)
+    slots.acquire()
+    with pytest.raises(httpx.PoolTimeout):
+        slots.acquire("a", timeout=0.05)
+    # the timed out waiter does not take the slot freed later
+    slots.release()
+    slots.acquire("b", timeout=0)
@@ -0,0 +1,61 @@
+import json
+
+import httpx
+import pytest
+
+from mcp_server_gravitino.server.cache import get_cache
+from mcp_server_gravitino.server.entities import Tag
+from mcp_server_gravitino.server.tools import associate_tags_to_entities, metalake_name
+from mcp_server_gravitino.server.tools.tag import _entity_key, _tag_objects_path
+
+
+@pytest.mark.asyncio
+async def test_associate_tags_to_entities(settings, call_tool):
+    requests = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requests.append((request.url.path, json.loads(request.content)))
+        if "broken" in request.url.path:
+            return httpx.Response(500, json={"code": 1000})
+        return httpx.Response(200, json={"names": []})
+
+    session = httpx.Client(base_url=settings.uri, transport=httpx.MockTransport(_handler))
+    entity_tags = get_cache("entity_tags")
+    tag_objects = get_cache("tag_objects")
+    entity_tags.invalidate()
+    tag_objects.invalidate()
+    entity_tags.set(_entity_key("table", "c.s.t"), (Tag(name="old"),))
+    entity_tags.set(_entity_key("column", "c.s.t.email"), (Tag(name="old"),))
+    entity_tags.set(_entity_key("table", "c.s.t2"), (Tag(name="old"),))
+    tag_objects.set(_tag_objects_path("PII"), ())
+
+    result = await call_tool(
+        associate_tags_to_entities,
+        session,
+        "associate_tags_to_entities",
+        associations=[
+            {"tag_names": ["PII"], "fully_qualified_name": f"{metalake_name}.c.s.t"},
+            {"tag_names": ["broken"], "fully_qualified_name": f"{metalake_name}.c.broken"},
+            {"tag_names": ["sensitive", "PII"], "fully_qualified_name": f"{metalake_name}.c.s.t"},
+            {"tag_names": ["PII"], "fully_qualified_name": metalake_name},
+        ],
+    )
+
+    # the tags of an object are merged and de-duplicated into a single request
+    assert sorted(requests) == [
+        (f"/api/metalakes/{metalake_name}/objects/schema/c.broken/tags", {"tagsToAdd": ["broken"]}),
+        (f"/api/metalakes/{metalake_name}/objects/table/c.s.t/tags", {"tagsToAdd": ["PII", "sensitive"]}),
+    ]
+    assert (result["result"], result["succeeded"], result["failed"]) == ("error", 1, 2)
+    assert [(item["fullyQualifiedName"], item["tagNames"], item["result"]) for item in result["items"]] == [
+        (f"{metalake_name}.c.s.t", ["PII", "sensitive"], "success"),
+        (f"{metalake_name}.c.broken", ["broken"], "error"),
+        (metalake_name, ["PII"], "error"),
+    ]
+    assert "500" in result["items"][1]["message"]
+
+    # both directions of the tag index are updated, and the tags inherited by children are dropped
+    assert [tag.name for tag in entity_tags.get(_entity_key("table", "c.s.t"))] == ["old", "PII", "sensitive"]
+    assert entity_tags.get(_entity_key("column", "c.s.t.email")) is None
+    assert entity_tags.get(_entity_key("table", "c.s.t2")) is not None
+    assert [(obj.type, obj.full_name) for obj in tag_objects.get(_tag_objects_path("PII"))] == [("table", "c.s.t")]
@@ -1,3 +1,4 @@
+import json
 import os
 from unittest.mock import patch
 
@@ -45,6 +46,7 @@ def make_server_params(**kwargs) -> StdioServerParameters:
             "GRAVITINO_PASSWORD": kwargs.get("GRAVITINO_PASSWORD", DEFAULT_PASS),
             "GRAVITINO_ACTIVE_TOOLS": kwargs.get("GRAVITINO_ACTIVE_TOOLS", DEFAULT_ACTIVE_TOOLS),
             "GRAVITINO_TEST": kwargs.get("GRAVITINO_TEST", DEFAULT_TEST),
+            "GRAVITINO_EXPORT_DIR": kwargs.get("GRAVITINO_EXPORT_DIR", ""),
         },
     )
 
@@ -159,6 +161,205 @@ async def test_get_list_of_models():
             validate_result(result)
 
 
+@pytest.mark.asyncio
+async def test_get_tags_for_entity():
+    params = {
+        "GRAVITINO_TEST": "True",
+    }
+    async with stdio_client(make_server_params(**params)) as (stdio, write):
+        async with ClientSession(stdio, write) as session:
+            await session.initialize()
+            result = await session.call_tool(
+                "get_tags_for_entity",
+                arguments={
+                    "fully_qualified_name": "demo_metalake.catalog.schema.table1",
+                },
+            )
+
+            validate_result(result)
+            assert json.loads(result.content[0].text) == [{"name": "PII"}, {"name": "sensitive"}]
+
+
+@pytest.mark.asyncio
+async def test_get_tagged_objects():
+    params = {
+        "GRAVITINO_TEST": "True",
+    }
+    async with stdio_client(make_server_params(**params)) as (stdio, write):
+        async with ClientSession(stdio, write) as session:
+            await session.initialize()
+            result = await session.call_tool("get_tagged_objects", arguments={})
+            validate_result(result)
+            assert len(json.loads(result.content[0].text)["objects"]) == 2
+
+            result = await session.call_tool(
+                "get_tagged_objects",
+                arguments={
+                    "tag_names": ["PII", "sensitive"],
+                    "match": "all",
+                },
+            )
+            validate_result(result)
+            assert json.loads(result.content[0].text)["objects"] == [
+                {"fullName": "catalog.schema.table1", "type": "table", "tags": ["PII", "sensitive"]}
+            ]
+
+
+@pytest.mark.asyncio
+async def test_get_users_with_role():
+    params = {
+        "GRAVITINO_TEST": "True",
+    }
+    async with stdio_client(make_server_params(**params)) as (stdio, write):
+        async with ClientSession(stdio, write) as session:
+            await session.initialize()
+            result = await session.call_tool(
+                "get_users_with_role",
+                arguments={
+                    "role_name": "analyst",
+                },
+            )
+
+            validate_result(result)
+            assert json.loads(result.content[0].text) == [{"name": "alice"}, {"name": "bob"}]
+
+
+@pytest.mark.asyncio
+async def test_get_roles_granting_privilege():
+    params = {
+        "GRAVITINO_TEST": "True",
+    }
+    async with stdio_client(make_server_params(**params)) as (stdio, write):
+        async with ClientSession(stdio, write) as session:
+            await session.initialize()
+            result = await session.call_tool(
+                "get_roles_granting_privilege",
+                arguments={
+                    "privilege": "select",
+                    "fully_qualified_name": "demo_metalake.catalog.schema.table2",
+                },
+            )
+
+            validate_result(result)
+            grants = json.loads(result.content[0].text)["grants"]
+            assert [(grant["fullName"], grant["condition"]) for grant in grants] == [
+                ("catalog", "allow"),
+                ("catalog.schema.table2", "deny"),
+            ]
+
+
+@pytest.mark.asyncio
+async def test_check_user_access():
+    params = {
+        "GRAVITINO_TEST": "True",
+    }
+    async with stdio_client(make_server_params(**params)) as (stdio, write):
+        async with ClientSession(stdio, write) as session:
+            await session.initialize()
+            for table_name, allowed in (("table1", True), ("table2", False)):
+                result = await session.call_tool(
+                    "check_user_access",
+                    arguments={
+                        "user_name": "bob",
+                        "privilege": "select_table",
+                        "fully_qualified_name": f"demo_metalake.catalog.schema.{table_name}",
+                    },
+                )
+
+                validate_result(result)
+                assert json.loads(result.content[0].text)["allowed"] is allowed
+
+
+@pytest.mark.asyncio
+async def test_get_list_of_model_versions_by_fqn():
+    params = {
+        "GRAVITINO_TEST": "True",
+    }
+    async with stdio_client(make_server_params(**params)) as (stdio, write):
+        async with ClientSession(stdio, write) as session:
+            await session.initialize()
+            for arguments in ({"latest": 1}, {"alias": "prod"}):
+                result = await session.call_tool(
+                    "get_list_model_versions_by_fqn",
+                    arguments={
+                        "fqn": "catalog.schema.model1",
+                        **arguments,
+                    },
+                )
+
+                validate_result(result)
+                assert [version["version"] for version in json.loads(result.content[0].text)] == [2]
+
+
+@pytest.mark.asyncio
+async def test_get_filesets_in_schema():
+    params = {
+        "GRAVITINO_TEST": "True",
+    }
+    async with stdio_client(make_server_params(**params)) as (stdio, write):
+        async with ClientSession(stdio, write) as session:
+            await session.initialize()
+            result = await session.call_tool(
+                "get_filesets_in_schema",
+                arguments={
+                    "catalog_name": "fileset_catalog",
+                    "schema_name": "schema",
+                    "page_size": 1,
+                },
+            )
+
+            validate_result(result)
+            page = json.loads(result.content[0].text)
+            assert [fileset["storageLocation"] for fileset in page["filesets"]] == ["hdfs://warehouse/fileset1"]
+            assert page["nextPageToken"] == "1"
+
+
+@pytest.mark.asyncio
+async def test_get_table_details_by_fqn():
+    params = {
+        "GRAVITINO_TEST": "True",
+    }
+    async with stdio_client(make_server_params(**params)) as (stdio, write):
+        async with ClientSession(stdio, write) as session:
+            await session.initialize()
+            result = await session.call_tool(
+                "get_table_details_by_fqn",
+                arguments={
+                    "fully_qualified_name": "demo_metalake.catalog.schema.table1",
+                    "sections": ["partitioning", "indexes"],
+                },
+            )
+
+            validate_result(result)
+            details = json.loads(result.content[0].text)
+            assert list(details) == ["name", "fullyQualifiedName", "comment", "partitioning", "indexes"]
+            assert details["partitioning"] == [{"strategy": "day", "fieldName": ["ts"]}]
+
+
+@pytest.mark.asyncio
+async def test_diff_namespaces():
+    params = {
+        "GRAVITINO_TEST": "True",
+    }
+    async with stdio_client(make_server_params(**params)) as (stdio, write):
+        async with ClientSession(stdio, write) as session:
+            await session.initialize()
+            result = await session.call_tool(
+                "diff_namespaces",
+                arguments={
+                    "source_namespace": "demo_metalake.catalog.schema",
+                    "target_namespace": "demo_metalake.catalog.schema",
+                },
+            )
+
+            validate_result(result)
+            diff = json.loads(result.content[0].text)
+            assert diff["result"] == "success"
+            assert diff["items"] == []
+            assert diff["counts"]["changed"] == 0
+            assert diff["counts"]["identical"] >= 1
+
+
 def validate_result(result) -> None:
     assert not result.isError
 
@@ -167,3 +368,101 @@ def validate_result(result) -> None:
     item = content[0]
     assert item.type == "text"
     assert isinstance(item, TextContent)
+
+
+@pytest.mark.asyncio
+async def test_crawl_metalake(tmp_path):
+    params = {
+        "GRAVITINO_TEST": "True",
+        "GRAVITINO_EXPORT_DIR": str(tmp_path),
+    }
+    async with stdio_client(make_server_params(**params)) as (stdio, write):
+        async with ClientSession(stdio, write) as session:
+            await session.initialize()
+            result = await session.call_tool(
+                "crawl_metalake",
+                arguments={
+                    "catalog_names": ["catalog"],
+                    "page_size": 2,
+                },
+            )
+
+            validate_result(result)
+            first_page = json.loads(result.content[0].text)
+            assert first_page["counts"] == {
+                "catalog": 1,
+                "schema": 1,
+                "table": 2,
+                "model": 0,
+                "fileset": 0,
+                "topic": 0,
+            }
+            assert first_page["errors"] == []
+            assert [(item["type"], item["name"]) for item in first_page["items"]] == [
+                ("catalog", "catalog"),
+                ("schema", "schema"),
+            ]
+            assert first_page["items"][0]["fullyQualifiedName"] == f"{DEFAULT_METALAKE}.catalog"
+            assert first_page["items"][0]["provider"] == "hive"
+
+            result = await session.call_tool(
+                "crawl_metalake",
+                arguments={
+                    "page_size": 2,
+                    "page_token": first_page["nextPageToken"],
+                },
+            )
+            validate_result(result)
+            second_page = json.loads(result.content[0].text)
+            assert [item["name"] for item in second_page["items"]] == ["table1", "table2"]
+            assert "nextPageToken" not in second_page
+
+            result = await session.call_tool(
+                "crawl_metalake",
+                arguments={
+                    "catalog_names": ["catalog"],
+                    "output_path": "crawls/catalog.jsonl",
+                },
+            )
+            validate_result(result)
+            output = json.loads(result.content[0].text)
+            assert output["outputPath"] == str((tmp_path / "crawls" / "catalog.jsonl").resolve())
+            with open(output["outputPath"], encoding="utf-8") as file:
+                records = [json.loads(line) for line in file]
+            assert [record["type"] for record in records] == ["catalog", "schema", "table", "table"]
+            assert "items" not in output
+
+            result = await session.call_tool(
+                "crawl_metalake",
+                arguments={
+                    "output_path": "../catalog.jsonl",
+                },
+            )
+            assert json.loads(result.content[0].text)["result"] == "error"
+
+
+@pytest.mark.asyncio
+async def test_get_metadata_changes_since():
+    params = {
+        "GRAVITINO_TEST": "True",
+    }
+    async with stdio_client(make_server_params(**params)) as (stdio, write):
+        async with ClientSession(stdio, write) as session:
+            await session.initialize()
+            result = await session.call_tool(
+                "get_metadata_changes_since",
+                arguments={
+                    "catalog_names": ["catalog"],
+                },
+            )
+            validate_result(result)
+
+            snapshot_id = json.loads(result.content[0].text)["snapshotId"]
+            result = await session.call_tool(
+                "get_metadata_changes_since",
+                arguments={
+                    "snapshot_id": snapshot_id,
+                },
+            )
+            validate_result(result)
+            assert json.loads(result.content[0].text)["added"] == []
@@ -0,0 +1,198 @@
+import json
+
+import httpx
+import pytest
+
+from mcp_server_gravitino.server.cache import get_cache
+from mcp_server_gravitino.server.entities import Privilege, Role, SecurableObject
+from mcp_server_gravitino.server.tools import (
+    check_user_access,
+    get_list_of_roles,
+    get_roles_granting_privilege,
+    grant_roles_to_users,
+    metalake_name,
+    revoke_roles_from_users,
+)
+from mcp_server_gravitino.server.tools.user_role import (
+    RolePrivilegeIndex,
+    UserRoleIndex,
+    _object_names,
+    load_user_role_index,
+)
+
+
+@pytest.mark.asyncio
+async def test_list_of_roles_decodes_only_names(settings, call_tool):
+    def _handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == f"/api/metalakes/{metalake_name}/roles"
+        return httpx.Response(200, json={"code": 0, "names": ["analyst", "admin"], "extra": [{"ignored": 1}]})
+
+    session = httpx.Client(base_url=settings.uri, transport=httpx.MockTransport(_handler))
+    assert await call_tool(get_list_of_roles, session, "get_list_of_roles") == [{"name": "analyst"}, {"name": "admin"}]
+
+
+@pytest.mark.asyncio
+async def test_grant_and_revoke_roles_of_users(settings, call_tool, monkeypatch):
+    requests = []
+    changes = []
+    with_change = UserRoleIndex.with_change
+    monkeypatch.setattr(
+        UserRoleIndex,
+        "with_change",
+        lambda self, *args: changes.append(args) or with_change(self, *args),
+    )
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            return httpx.Response(
+                200,
+                json={"users": [{"name": "alice", "roles": ["analyst"]}, {"name": "bob", "roles": []}]},
+            )
+        requests.append((request.url.path.split("/")[-2:], json.loads(request.content)))
+        if "ghost" in request.url.path:
+            return httpx.Response(404, json={"code": 1003})
+        return httpx.Response(200, json={"user": {}})
+
+    session = httpx.Client(base_url=settings.uri, transport=httpx.MockTransport(_handler))
+    get_cache("users").invalidate()
+    load_user_role_index(session)
+
+    result = await call_tool(
+        grant_roles_to_users,
+        session,
+        "grant_roles_to_users",
+        user_names=["alice", "ghost", "alice", "bob"],
+        role_names=["admin", "writer", "admin"],
+    )
+
+    # duplicates are dropped, and all roles of a user are granted in one request
+    assert sorted(requests) == [
+        (["alice", "grant"], {"roleNames": ["admin", "writer"]}),
+        (["bob", "grant"], {"roleNames": ["admin", "writer"]}),
+        (["ghost", "grant"], {"roleNames": ["admin", "writer"]}),
+    ]
+    assert (result["result"], result["succeeded"], result["failed"]) == ("error", 2, 1)
+    assert [(user["name"], user["result"]) for user in result["users"]] == [
+        ("alice", "success"),
+        ("ghost", "error"),
+        ("bob", "success"),
+    ]
+    assert "404" in result["users"][1]["message"]
+
+    # the cached index is updated for the users the roles were granted to only
+    index = get_cache("users").get(f"/api/metalakes/{metalake_name}/users?details=true")
+    assert {name: user.roles for name, user in index.users.items()} == {
+        "alice": ("analyst", "admin", "writer"),
+        "bob": ("admin", "writer"),
+    }
+    assert index.users_with_role("admin") == ("alice", "bob")
+    # the index is rebuilt once for all the users
+    assert changes == [("grant", ["alice", "bob"], ["admin", "writer"])]
+
+    requests.clear()
+    result = await call_tool(
+        revoke_roles_from_users,
+        session,
+        "revoke_roles_from_users",
+        user_names=["alice"],
+        role_names=["analyst", "writer"],
+    )
+    assert result["result"] == "success"
+    assert requests == [(["alice", "revoke"], {"roleNames": ["analyst", "writer"]})]
+    index = get_cache("users").get(f"/api/metalakes/{metalake_name}/users?details=true")
+    assert index.users["alice"].roles == ("admin",)
+    assert index.users_with_role("analyst") == ()
+
+
+def test_role_privilege_index_matches_quoted_names():
+    index = RolePrivilegeIndex(
+        [
+            Role(
+                name="reader",
+                securable_objects=(
+                    SecurableObject("catalog.`my.schema`", "schema", (Privilege("select_table", "allow"),)),
+                    SecurableObject("catalog.my", "schema", (Privilege("select_table", "deny"),)),
+                ),
+            )
+        ]
+    )
+    grants = index.grants(_object_names(f"{metalake_name}.catalog.`my.schema`.table", "table"), "select_table")
+    assert [(grant["fullName"], grant["condition"]) for grant in grants] == [("catalog.`my.schema`", "allow")]
+
+
+@pytest.mark.asyncio
+async def test_privileges_of_names_without_metalake(settings, call_tool):
+    def _handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path.endswith("/roles"):
+            return httpx.Response(200, json={"names": ["reader"]})
+        if path.endswith("/roles/reader"):
+            privileges = [{"name": "select_table", "condition": "allow"}]
+            return httpx.Response(
+                200,
+                json={
+                    "role": {
+                        "name": "reader",
+                        "securableObjects": [
+                            {
+                                "fullName": "catalog",
+                                "type": "catalog",
+                                "privileges": [{"name": "use_catalog", "condition": "allow"}],
+                            },
+                            {
+                                "fullName": "catalog.schema",
+                                "type": "schema",
+                                "privileges": [{"name": "use_schema", "condition": "allow"}],
+                            },
+                            {"fullName": "catalog.schema.orders", "type": "table", "privileges": privileges},
+                        ],
+                    }
+                },
+            )
+        return httpx.Response(200, json={"users": [{"name": "alice", "roles": ["reader"]}]})
+
+    session = httpx.Client(base_url=settings.uri, transport=httpx.MockTransport(_handler))
+    for cache in ("role_details", "role_privileges", "users"):
+        get_cache(cache).invalidate()
+
+    for fully_qualified_name in ("catalog.schema.orders", f"{metalake_name}.catalog.schema.orders"):
+        result = await call_tool(
+            get_roles_granting_privilege,
+            session,
+            "get_roles_granting_privilege",
+            privilege="select",
+            fully_qualified_name=fully_qualified_name,
+        )
+        assert [grant["fullName"] for grant in result["grants"]] == ["catalog.schema.orders"]
+        result = await call_tool(
+            check_user_access,
+            session,
+            "check_user_access",
+            user_name="alice",
+            privilege="select_table",
+            fully_qualified_name=fully_qualified_name,
+        )
+        assert result["allowed"] is True
+        assert result["checks"][-1]["fullName"] == f"{metalake_name}.catalog.schema.orders"
+
+    result = await call_tool(
+        get_roles_granting_privilege,
+        session,
+        "get_roles_granting_privilege",
+        privilege="select",
+        fully_qualified_name="catalog.schema",
+    )
+    assert result["result"] == "error"
+    for tool, name, arguments in (
+        (get_roles_granting_privilege, "get_roles_granting_privilege", {}),
+        (check_user_access, "check_user_access", {"user_name": "alice"}),
+    ):
+        result = await call_tool(
+            tool,
+            session,
+            name,
+            privilege="select_table",
+            fully_qualified_name="other.catalog.schema.orders",
+            **arguments,
+        )
+        assert result["result"] == "error" and "Metalake" in result["message"]
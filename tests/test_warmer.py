@@ -0,0 +1,60 @@
+import time
+
+import httpx
+
+from mcp_server_gravitino.server.access import AccessCounter
+from mcp_server_gravitino.server.limits import RateLimitExceeded
+from mcp_server_gravitino.server.warmer import CacheWarmer
+
+
+def test_access_counter_is_persisted_and_decayed(tmp_path):
+    path = tmp_path / "access_counts.json"
+    counter = AccessCounter(path)
+    for key in ["m.c.s.a", "m.c.s.b", "m.c.s.b"]:
+        counter.record(key)
+    counter.save()
+
+    restored = AccessCounter(path)
+    assert restored.most_common(1) == ["m.c.s.b"]
+    for _ in range(30):
+        restored.decay(0.9)
+    assert restored.most_common(2) == ["m.c.s.b"]
+
+
+def test_warm_stops_at_request_budget(settings, monkeypatch):
+    monkeypatch.setattr(settings, "cache_warmer_budget", 3)
+    paths = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path.endswith("/catalogs"):
+            return httpx.Response(200, json={"catalogs": [{"name": f"c{i}", "type": "relational"} for i in range(5)]})
+        return httpx.Response(200, json={"identifiers": []})
+
+    session = httpx.Client(base_url=settings.uri, transport=httpx.MockTransport(_handler))
+    assert CacheWarmer(session).warm() == 3
+    assert [path.rsplit("/", 2)[-2:] for path in paths[1:]] == [["c0", "schemas"], ["c1", "schemas"]]
+
+
+def test_warmer_survives_limited_and_failed_rounds(settings, monkeypatch):
+    rounds = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        rounds.append(request.url.path)
+        if len(rounds) == 1:
+            raise RateLimitExceeded("catalogs", 1.0)
+        raise RuntimeError("unexpected")
+
+    monkeypatch.setattr(settings, "cache_warmer_interval", 0.01)
+    session = httpx.Client(base_url=settings.uri, transport=httpx.MockTransport(_handler))
+    warmer = CacheWarmer(session)
+    # a rejected request ends the round, after counting against its budget
+    assert warmer.warm() == 1
+
+    warmer.start()
+    try:
+        time.sleep(0.2)
+        assert warmer._thread.is_alive()
+        assert len(rounds) > 2
+    finally:
+        warmer.stop()